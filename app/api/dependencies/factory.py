@@ -134,7 +134,10 @@ class Factory:
         self,
     ):
         return MapsetService(
-            self.mapset_repository(), self.mapset_history_repository(), self.map_source_usage_repository()
+            self.mapset_repository(),
+            self.mapset_history_repository(),
+            self.map_source_usage_repository(),
+            self.map_projection_system_repository(),
         )
 
     def get_mapset_history_service(
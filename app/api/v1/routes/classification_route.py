@@ -25,14 +25,18 @@ async def get_classifications(
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    classifications, total = await service.find_all(filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[ClassificationSchema.model_validate(classification) for classification in classifications],
-        total=total,
+        items=[ClassificationSchema.model_validate(classification) for classification in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
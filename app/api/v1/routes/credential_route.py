@@ -82,6 +82,9 @@ async def get_credentials(
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
 
     if credential_type:
         filter_params.append(f"credential_type={credential_type}")
@@ -89,16 +92,25 @@ async def get_credentials(
     if not include_inactive:
         filter_params.append(f"is_active=true")
 
-    credentials, total = await service.find_all(
-        filters=filter_params, sort=sort, search=search, group_by=group_by, limit=limit, offset=offset
+    page = await service.find_all(
+        filters=filter_params,
+        sort=sort,
+        search=search,
+        group_by=group_by,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+        search_mode=search_mode,
     )
 
     return PaginatedResponse(
-        items=[credential for credential in credentials],
-        total=total,
+        items=[credential for credential in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=offset + limit < total,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -32,14 +32,18 @@ async def get_files(params: CommonParams = Depends(), service: FileService = Dep
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    files, total = await service.find_all(filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[FileSchema.model_validate(file) for file in files],
-        total=total,
+        items=[FileSchema.model_validate(file) for file in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
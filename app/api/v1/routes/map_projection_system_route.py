@@ -26,17 +26,21 @@ async def get_map_projection_systems(
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    map_projection_systems, total = await service.find_all(filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
         items=[
             MapProjectionSystemSchema.model_validate(map_projection_system)
-            for map_projection_system in map_projection_systems
+            for map_projection_system in page.items
         ],
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -26,14 +26,18 @@ async def get_mapset_histories(
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    histories, total = await service.find_all(filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[MapsetHistorySchema.model_validate(history) for history in histories],
-        total=total,
+        items=[MapsetHistorySchema.model_validate(history) for history in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Body, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.dependencies.auth import get_current_active_user, get_payload
 from app.api.dependencies.factory import Factory
@@ -8,6 +9,7 @@ from app.core.data_types import UUID7Field
 from app.core.params import CommonParams
 from app.core.responses import PaginatedResponse
 from app.schemas.mapset_schema import (
+    ColorScaleRequestSchema,
     MapsetByOrganizationSchema,
     MapsetCreateSchema,
     MapsetSchema,
@@ -15,6 +17,10 @@ from app.schemas.mapset_schema import (
 )
 from app.schemas.user_schema import UserSchema
 from app.services import MapsetService
+from app.utils.aggregation import AggregateFunction
+from app.utils.binning import BinShape
+from app.utils.class_breaks import ClassificationMethod
+from app.utils.topojson import TOPOJSON_MEDIA_TYPE, accepts_topojson
 
 router = APIRouter()
 
@@ -31,14 +37,18 @@ async def get_mapsets(
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    mapsets, total = await service.find_all(user, filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(user, filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[MapsetSchema.model_validate(mapset) for mapset in mapsets],
-        total=total,
+        items=[MapsetSchema.model_validate(mapset) for mapset in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -69,6 +79,16 @@ async def get_mapset(id: UUID7Field, service: MapsetService = Depends(Factory().
     return mapset
 
 
+@router.get("/mapsets/{id}/clusters", status_code=status.HTTP_200_OK)
+async def get_mapset_clusters(
+    id: UUID7Field,
+    bbox: str = Query(..., description="Area peta minx,miny,maxx,maxy dalam derajat"),
+    zoom: float = Query(..., ge=0, description="Level zoom peta"),
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    return await service.get_clusters(id, bbox, zoom)
+
+
 @router.post("/mapsets", response_model=MapsetSchema, status_code=status.HTTP_201_CREATED)
 async def create_mapset(
     data: MapsetCreateSchema,
@@ -83,12 +103,150 @@ async def create_mapset(
 async def create_color_scale(
     source_url: str = Body(..., embed=True),
     color_range: list[str] = Body(None, embed=True),
+    method: ClassificationMethod = Body(ClassificationMethod.quantile, embed=True),
+    aggregate: AggregateFunction = Body(AggregateFunction.count, embed=True),
+    field: Optional[str] = Body(None, embed=True),
+    boundary: str = Body("jatim.json", embed=True),
+    zoom: Optional[float] = Body(None, ge=0, embed=True),
+    tolerance: Optional[float] = Body(None, ge=0, embed=True),
+    projection_system_id: Optional[UUID7Field] = Body(None, embed=True),
+    accept: Optional[str] = Header(None),
     service: MapsetService = Depends(Factory().get_mapset_service),
 ):
-    result, rangelist = await service.generate_colorscale(source_url, color_range)
+    source_crs = await service.get_source_crs(projection_system_id)
+    result, rangelist, fingerprint = await service.generate_colorscale(
+        source_url,
+        color_range,
+        boundary_name=boundary,
+        method=method,
+        aggregate=aggregate,
+        field=field,
+        zoom=zoom,
+        tolerance=tolerance,
+        source_crs=source_crs,
+    )
+    if accepts_topojson(accept):
+        content = await run_in_threadpool(
+            service.encode_colorscale_topojson, boundary, result, rangelist, fingerprint, zoom, tolerance
+        )
+        return Response(content=content, media_type=TOPOJSON_MEDIA_TYPE, headers={"Vary": "Accept"})
+
+    return {"data": result, "rangelist": rangelist, "fingerprint": fingerprint}
+
+
+@router.post("/mapsets/color_scale/levels", status_code=status.HTTP_200_OK)
+async def create_color_scale_levels(
+    source_url: str = Body(..., embed=True),
+    boundaries: List[str] = Body(..., embed=True),
+    color_range: list[str] = Body(None, embed=True),
+    method: ClassificationMethod = Body(ClassificationMethod.quantile, embed=True),
+    aggregate: AggregateFunction = Body(AggregateFunction.count, embed=True),
+    field: Optional[str] = Body(None, embed=True),
+    projection_system_id: Optional[UUID7Field] = Body(None, embed=True),
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    source_crs = await service.get_source_crs(projection_system_id)
+    results = await service.generate_colorscale_levels(
+        source_url, boundaries, color_range, method=method, aggregate=aggregate, field=field, source_crs=source_crs
+    )
+    return {"data": results}
+
+
+@router.post("/mapsets/color_scale/bins", status_code=status.HTTP_200_OK)
+async def create_color_scale_bins(
+    source_url: str = Body(..., embed=True),
+    cell_size: float = Body(..., gt=0, embed=True),
+    shape: BinShape = Body(BinShape.hexagon, embed=True),
+    color_range: list[str] = Body(None, embed=True),
+    method: ClassificationMethod = Body(ClassificationMethod.quantile, embed=True),
+    aggregate: AggregateFunction = Body(AggregateFunction.count, embed=True),
+    field: Optional[str] = Body(None, embed=True),
+    projection_system_id: Optional[UUID7Field] = Body(None, embed=True),
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    source_crs = await service.get_source_crs(projection_system_id)
+    result, rangelist = await service.generate_colorscale_bins(
+        source_url,
+        cell_size,
+        shape,
+        color_range,
+        method=method,
+        aggregate=aggregate,
+        field=field,
+        source_crs=source_crs,
+    )
     return {"data": result, "rangelist": rangelist}
 
 
+@router.post("/mapsets/color_scale/batch", status_code=status.HTTP_200_OK)
+async def create_color_scale_batch(
+    jobs: List[ColorScaleRequestSchema] = Body(..., embed=True),
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    results = await service.generate_colorscale_batch(jobs)
+    return {"data": results}
+
+
+@router.post("/mapsets/color_scale/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def create_color_scale_job(
+    data: ColorScaleRequestSchema,
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    return await service.submit_colorscale_job(data)
+
+
+@router.get("/mapsets/color_scale/jobs/{job_id}", status_code=status.HTTP_200_OK)
+async def get_color_scale_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Tunggu job selesai paling lama sekian detik (long-poll)"),
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    return await service.get_colorscale_job(job_id, wait)
+
+
+@router.get("/mapsets/color_scale/jobs/{job_id}/result", status_code=status.HTTP_200_OK)
+async def get_color_scale_job_result(
+    job_id: str,
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    result, rangelist, fingerprint = service.get_colorscale_job_result(job_id)
+    return {"data": result, "rangelist": rangelist, "fingerprint": fingerprint}
+
+
+@router.get("/mapsets/boundaries/{boundary}", status_code=status.HTTP_200_OK)
+async def get_boundary(
+    boundary: str,
+    zoom: Optional[float] = Query(None, ge=0, description="Level zoom peta untuk memilih level penyederhanaan"),
+    tolerance: Optional[float] = Query(None, ge=0, description="Toleransi penyederhanaan dalam derajat"),
+    accept: Optional[str] = Header(None),
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    topojson = accepts_topojson(accept)
+    content = await run_in_threadpool(service.get_boundary, boundary, zoom, tolerance, topojson)
+    return Response(
+        content=content,
+        media_type=TOPOJSON_MEDIA_TYPE if topojson else "application/geo+json",
+        headers={"Vary": "Accept"},
+    )
+
+
+@router.get("/mapsets/tiles/{boundary}/{z}/{x}/{y}.mvt", status_code=status.HTTP_200_OK)
+async def get_tile(
+    boundary: str,
+    z: int,
+    x: int,
+    y: int,
+    fingerprint: Optional[str] = Query(None, description="Fingerprint hasil color scale"),
+    service: MapsetService = Depends(Factory().get_mapset_service),
+):
+    tile = await service.get_tile(boundary, z, x, y, fingerprint)
+    return Response(
+        content=tile,
+        media_type="application/vnd.mapbox-vector-tile",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
+
+
 @router.patch(
     "/mapsets/activation", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(get_current_active_user)]
 )
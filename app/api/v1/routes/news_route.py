@@ -21,14 +21,18 @@ async def get_newss(params: CommonParams = Depends(), service: NewsService = Dep
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    newss, total = await service.find_all(filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[NewsSchema.model_validate(news) for news in newss],
-        total=total,
+        items=[NewsSchema.model_validate(news) for news in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -28,14 +28,18 @@ async def get_organizations(
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    organizations, total = await service.find_all(user, filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(user, filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[OrganizationSchema.model_validate(organization) for organization in organizations],
-        total=total,
+        items=[OrganizationSchema.model_validate(organization) for organization in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
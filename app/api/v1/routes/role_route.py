@@ -19,14 +19,18 @@ async def get_roles(params: CommonParams = Depends(), service: RoleService = Dep
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    roles, total = await service.find_all(filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[RoleSchema.model_validate(role) for role in roles],
-        total=total,
+        items=[RoleSchema.model_validate(role) for role in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -21,14 +21,18 @@ async def get_users(params: CommonParams = Depends(), service: UserService = Dep
     group_by = params.group_by
     limit = params.limit
     offset = params.offset
-    users, total = await service.find_all(filter, sort, search, group_by, limit, offset)
+    cursor = params.cursor
+    count = params.count
+    search_mode = params.search_mode
+    page = await service.find_all(filter, sort, search, group_by, limit, offset, cursor, count, search_mode)
 
     return PaginatedResponse(
-        items=[UserSchema.model_validate(user) for user in users],
-        total=total,
+        items=[UserSchema.model_validate(user) for user in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=total > (offset + limit),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -0,0 +1,282 @@
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+import shapely
+
+from app.core.boundary_registry import Boundary, boundary_registry
+from app.core.config import settings
+from app.utils.cache import LRUCache
+from app.utils.spatial import PointInPolygonEngine
+from app.utils.topojson import QuantizedTopology
+from app.utils.topology import build_geometries, extract_topology, simplify_arcs
+
+MAGIC = b"BPYR\x01"
+
+
+def tolerance_for_zoom(zoom: float) -> float:
+    """Ukuran satu piksel (tile 256 px) dalam derajat pada level zoom tertentu."""
+    return 360 / (256 * 2**zoom)
+
+
+class BoundaryPyramid:
+    """
+    Piramida geometri boundary yang disederhanakan pada beberapa level toleransi.
+
+    Geometri setiap level disimpan sebagai WKB di satu file yang dibaca lewat mmap,
+    sehingga hanya level yang dipakai yang di-parse dan halaman file dibagi antar
+    worker process oleh page cache OS.
+
+    Format file: MAGIC, panjang header (uint32), header JSON, tabel offset uint64
+    berukuran (jumlah level, jumlah feature + 1), lalu blob WKB.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Format file piramida boundary tidak valid: {path}")
+
+        (header_size,) = struct.unpack_from("<I", self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = orjson.loads(self._mmap[header_start : header_start + header_size])
+
+        self.source_mtime: float = header["source_mtime"]
+        self.tolerances: List[float] = header["tolerances"]
+        self.count: int = header["count"]
+
+        table_start = header_start + header_size
+        self._offsets = np.frombuffer(
+            self._mmap, dtype="<u8", count=len(self.tolerances) * (self.count + 1), offset=table_start
+        ).reshape(len(self.tolerances), self.count + 1)
+        self._data_start = table_start + self._offsets.nbytes
+        self._levels: Dict[int, np.ndarray] = {}
+        self._engines: Dict[int, PointInPolygonEngine] = {}
+
+    def __len__(self) -> int:
+        return len(self.tolerances)
+
+    def select_level(self, tolerance: float) -> Optional[int]:
+        """Level dengan toleransi terbesar yang tidak melebihi `tolerance`, None untuk resolusi penuh."""
+        level = None
+        for i, value in enumerate(self.tolerances):
+            if value <= tolerance:
+                level = i
+        return level
+
+    def geometries(self, level: int) -> np.ndarray:
+        geometries = self._levels.get(level)
+        if geometries is None:
+            offsets = self._offsets[level]
+            blobs = [
+                self._mmap[self._data_start + start : self._data_start + end]
+                for start, end in zip(offsets[:-1], offsets[1:])
+            ]
+            geometries = shapely.from_wkb(blobs)
+            self._levels[level] = geometries
+        return geometries
+
+    def engine(self, level: int) -> PointInPolygonEngine:
+        engine = self._engines.get(level)
+        if engine is None:
+            engine = PointInPolygonEngine(self.geometries(level))
+            self._engines[level] = engine
+        return engine
+
+    def close(self) -> None:
+        self._levels.clear()
+        self._engines.clear()
+        del self._offsets
+        self._mmap.close()
+
+    @classmethod
+    def build(cls, boundary: Boundary, tolerances: Sequence[float], path: str) -> "BoundaryPyramid":
+        """
+        Bangun piramida dari boundary dan tulis ke `path`.
+
+        Batas yang dipakai bersama poligon bertetangga disederhanakan sekali sebagai arc,
+        sehingga tidak muncul celah atau tumpang tindih antar poligon. Geometri yang
+        menjadi tidak valid atau hilang disederhanakan ulang per poligon.
+        """
+        tolerances = sorted(float(value) for value in tolerances)
+        arcs, topology = extract_topology(boundary.geometries)
+
+        levels = []
+        for tolerance in tolerances:
+            geometries = build_geometries(simplify_arcs(arcs, tolerance), topology)
+            broken = shapely.is_empty(geometries) | ~shapely.is_valid(geometries)
+            geometries[broken] = shapely.simplify(boundary.geometries[broken], tolerance, preserve_topology=True)
+            levels.append(shapely.to_wkb(geometries))
+
+        header = orjson.dumps({"source_mtime": boundary.mtime, "tolerances": tolerances, "count": len(boundary)})
+        offsets = np.zeros((len(tolerances), len(boundary) + 1), dtype="<u8")
+        position = 0
+        for i, blobs in enumerate(levels):
+            sizes = np.fromiter((len(blob) for blob in blobs), dtype=np.uint64, count=len(blobs))
+            offsets[i, 1:] = position + np.cumsum(sizes)
+            offsets[i, 0] = position
+            position = int(offsets[i, -1])
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(offsets.tobytes())
+            for blobs in levels:
+                for blob in blobs:
+                    f.write(blob)
+        os.replace(temp_path, path)
+
+        return cls(path)
+
+
+class BoundaryPyramidStore:
+    """
+    Penyimpanan file piramida per boundary.
+
+    File piramida dibangun ulang otomatis jika belum ada, mtime boundary sumber berubah,
+    atau daftar toleransi di konfigurasi berubah.
+    """
+
+    def __init__(self, directory: str, tolerances: Sequence[float]):
+        self.directory = directory
+        self.tolerances = sorted(float(value) for value in tolerances)
+        self._pyramids: Dict[str, BoundaryPyramid] = {}
+        self._geojson: LRUCache[tuple, bytes] = LRUCache(maxsize=32)
+        self._topologies: LRUCache[tuple, QuantizedTopology] = LRUCache(maxsize=32)
+        self._lock = threading.Lock()
+
+    def path_for(self, boundary: Boundary) -> str:
+        return os.path.join(self.directory, f"{boundary.name.removesuffix('.json')}.pyr")
+
+    def get(self, boundary: Boundary) -> BoundaryPyramid:
+        pyramid = self._pyramids.get(boundary.name)
+        if pyramid is not None and self._is_current(pyramid, boundary):
+            return pyramid
+
+        with self._lock:
+            pyramid = self._pyramids.get(boundary.name)
+            if pyramid is not None and self._is_current(pyramid, boundary):
+                return pyramid
+
+            if pyramid is not None:
+                pyramid.close()
+
+            pyramid = self._open(boundary)
+            if pyramid is None:
+                pyramid = BoundaryPyramid.build(boundary, self.tolerances, self.path_for(boundary))
+            self._pyramids[boundary.name] = pyramid
+            return pyramid
+
+    def build_all(self) -> None:
+        """Pastikan piramida semua boundary di registry tersedia dan mutakhir."""
+        for name in boundary_registry.names():
+            self.get(boundary_registry.get(name))
+
+    def level_for(
+        self, boundary: Boundary, zoom: Optional[float] = None, tolerance: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Tentukan level piramida dari `tolerance` (derajat) atau `zoom`.
+
+        Returns:
+            Optional[int]: Indeks level, atau None untuk geometri resolusi penuh
+        """
+        if tolerance is None and zoom is None:
+            return None
+        if tolerance is None:
+            tolerance = tolerance_for_zoom(zoom)
+        return self.get(boundary).select_level(tolerance)
+
+    def geometries(self, boundary: Boundary, level: Optional[int]) -> np.ndarray:
+        if level is None:
+            return boundary.geometries
+        return self.get(boundary).geometries(level)
+
+    def engine(self, boundary: Boundary, level: Optional[int]) -> PointInPolygonEngine:
+        if level is None:
+            return boundary.engine
+        return self.get(boundary).engine(level)
+
+    def geojson(self, boundary: Boundary, level: Optional[int]) -> bytes:
+        """FeatureCollection GeoJSON boundary pada level tertentu, di-cache per boundary dan level."""
+        key = (boundary.name, boundary.mtime, level, tuple(self.tolerances))
+        content = self._geojson.get(key)
+        if content is not None:
+            return content
+
+        geometries = shapely.to_geojson(self.geometries(boundary, level))
+        features = b",".join(
+            b'{"type":"Feature","properties":%s,"geometry":%s}' % (orjson.dumps(properties), geometry.encode())
+            for properties, geometry in zip(boundary.properties, geometries)
+        )
+        content = b'{"type":"FeatureCollection","features":[%s]}' % features
+        self._geojson.set(key, content)
+        return content
+
+    def topology(self, boundary: Boundary, level: Optional[int]) -> QuantizedTopology:
+        """Topologi TopoJSON (arc bersama, koordinat terkuantisasi) boundary pada level tertentu."""
+        key = (boundary.name, boundary.mtime, level, tuple(self.tolerances))
+        topology = self._topologies.get(key)
+        if topology is None:
+            topology = QuantizedTopology(self.geometries(boundary, level), settings.TOPOJSON_QUANTIZATION)
+            self._topologies.set(key, topology)
+        return topology
+
+    def _open(self, boundary: Boundary) -> Optional[BoundaryPyramid]:
+        path = self.path_for(boundary)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            pyramid = BoundaryPyramid(path)
+        except (ValueError, OSError):
+            return None
+
+        if self._is_current(pyramid, boundary) and pyramid.count == len(boundary):
+            return pyramid
+
+        pyramid.close()
+        return None
+
+    def _is_current(self, pyramid: BoundaryPyramid, boundary: Boundary) -> bool:
+        return pyramid.source_mtime == boundary.mtime and pyramid.tolerances == self.tolerances
+
+
+def _level_sizes(pyramid: BoundaryPyramid) -> List[Tuple[float, int, int]]:
+    sizes = []
+    for level, tolerance in enumerate(pyramid.tolerances):
+        offsets = pyramid._offsets[level]
+        vertices = int(shapely.get_num_coordinates(pyramid.geometries(level)).sum())
+        sizes.append((tolerance, vertices, int(offsets[-1] - offsets[0])))
+    return sizes
+
+
+boundary_pyramids = BoundaryPyramidStore(settings.BOUNDARY_PYRAMID_DIR, settings.BOUNDARY_PYRAMID_TOLERANCES)
+
+
+if __name__ == "__main__":
+    # Bangun piramida boundary tanpa menjalankan aplikasi:
+    #   python -m app.core.boundary_pyramid [jatim.json ...]
+    boundary_registry.load_all()
+    names = sys.argv[1:] or boundary_registry.names()
+
+    for name in names:
+        boundary = boundary_registry.get(name)
+        pyramid = BoundaryPyramid.build(boundary, boundary_pyramids.tolerances, boundary_pyramids.path_for(boundary))
+        full = int(shapely.get_num_coordinates(boundary.geometries).sum())
+        print(f"{boundary.name}: {full} vertex -> {pyramid.path}")
+        for tolerance, vertices, size in _level_sizes(pyramid):
+            print(f"  toleransi {tolerance:g}: {vertices} vertex, {math.ceil(size / 1024)} KiB")
+        pyramid.close()
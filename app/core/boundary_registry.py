@@ -0,0 +1,211 @@
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+import shapely
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundException, UnprocessableEntity
+from app.utils.mvt import lonlat_to_mercator
+from app.utils.spatial import PointInPolygonEngine
+
+
+class Boundary:
+    """Boundary GeoJSON yang sudah di-parse, berisi geometri shapely yang di-prepare beserta properties-nya."""
+
+    def __init__(self, name: str, path: str, mtime: float, features: List[Dict[str, Any]]):
+        self.name = name
+        self.path = path
+        self.mtime = mtime
+        self.properties = [feature.get("properties") or {} for feature in features]
+        self.geometries = np.asarray(shapely.from_geojson([orjson.dumps(f["geometry"]) for f in features]))
+        self.engine = PointInPolygonEngine(self.geometries)
+        self._mercator: Optional[np.ndarray] = None
+        self._mercator_tree: Optional[shapely.STRtree] = None
+        self._codes: Optional[np.ndarray] = None
+
+    @property
+    def codes(self) -> np.ndarray:
+        """
+        Kode wilayah setiap feature (hanya digit, misal `35.01` menjadi `3501`).
+
+        Kode diambil dari properti pertama yang tersedia di BOUNDARY_CODE_FIELDS,
+        string kosong jika feature tidak memiliki kode.
+        """
+        if self._codes is None:
+            self._codes = np.asarray([_region_code(properties) for properties in self.properties], dtype=str)
+        return self._codes
+
+    @property
+    def code_length(self) -> int:
+        """Panjang kode wilayah terpanjang, menandakan tingkat wilayah boundary (provinsi 2, kabupaten 4, ...)."""
+        return int(np.char.str_len(self.codes).max()) if len(self) else 0
+
+    @property
+    def mercator(self) -> np.ndarray:
+        """Geometri boundary dalam Web Mercator (EPSG:3857), diproyeksikan sekali saat pertama dipakai."""
+        if self._mercator is None:
+            self._mercator = shapely.transform(self.geometries, lonlat_to_mercator)
+        return self._mercator
+
+    @property
+    def mercator_tree(self) -> shapely.STRtree:
+        if self._mercator_tree is None:
+            self._mercator_tree = shapely.STRtree(self.mercator)
+        return self._mercator_tree
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+
+def _region_code(properties: Dict[str, Any]) -> str:
+    for field in settings.BOUNDARY_CODE_FIELDS:
+        value = properties.get(field)
+        if value is not None:
+            return "".join(char for char in str(value) if char.isdigit())
+    return ""
+
+
+def _validate_containment(child: Boundary, parent: Boundary, index: np.ndarray) -> None:
+    matched = np.flatnonzero(index >= 0)
+    points = shapely.point_on_surface(child.geometries[matched])
+    outside = matched[~shapely.covers(parent.geometries[index[matched]], points)]
+    if outside.size:
+        codes = ", ".join(child.codes[outside[:5]].tolist())
+        raise UnprocessableEntity(
+            f"Kode wilayah {child.name} tidak sesuai dengan geometri induk di {parent.name}: {codes}"
+        )
+
+
+class BoundaryRegistry:
+    """
+    Registry boundary GeoJSON di folder assets yang dimuat sekali per proses.
+
+    Setiap entry dimuat ulang ketika mtime file berubah. Pengecekan mtime dibatasi
+    paling sering sekali per `check_interval` detik agar hot path tidak menyentuh disk.
+    """
+
+    def __init__(self, directory: str, check_interval: float = 30):
+        self.directory = directory
+        self.check_interval = check_interval
+        self._entries: Dict[str, Boundary] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._parents: Dict[tuple, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def load_all(self) -> None:
+        """Muat seluruh file boundary di dalam folder assets."""
+        if not os.path.isdir(self.directory):
+            return
+
+        for filename in sorted(os.listdir(self.directory)):
+            if filename.endswith(".json"):
+                self.get(filename)
+
+    def names(self) -> List[str]:
+        return sorted(self._entries)
+
+    def hierarchy(self, names: List[str]) -> List[Tuple[Boundary, np.ndarray]]:
+        """
+        Susun boundary dari tingkat wilayah terhalus ke terkasar berdasarkan kode wilayah.
+
+        Relasi induk diambil dari awalan kode wilayah di properties boundary (format yang sama
+        dengan `RegionalModel.code`, misal `35.01` berinduk ke `35`). Tabel regional tidak dipakai
+        karena hanya menyimpan kode datar tanpa tautan ke feature boundary. Relasi kode divalidasi
+        secara geometris: titik representatif setiap feature harus berada di dalam induknya.
+
+        Args:
+            names: Nama file boundary, urutan bebas
+
+        Returns:
+            List[Tuple[Boundary, np.ndarray]]: Boundary beserta indeks feature-nya untuk setiap
+            feature boundary terhalus (-1 jika tidak ada induk). Entry pertama adalah boundary
+            terhalus dengan indeks identitas.
+
+        Raises:
+            UnprocessableEntity: Jika boundary tidak memiliki kode wilayah, atau ada feature yang
+                tidak berada di dalam wilayah induk menurut kodenya
+        """
+        boundaries = [self.get(name) for name in dict.fromkeys(self._normalize_name(name) for name in names)]
+        for boundary in boundaries:
+            if boundary.code_length == 0:
+                raise UnprocessableEntity(f"Boundary {boundary.name} tidak memiliki kode wilayah")
+
+        boundaries.sort(key=lambda boundary: boundary.code_length, reverse=True)
+        finest = boundaries[0]
+        return [(boundary, self._parent_index(finest, boundary)) for boundary in boundaries]
+
+    def _parent_index(self, child: Boundary, parent: Boundary) -> np.ndarray:
+        key = (child.name, child.mtime, parent.name, parent.mtime)
+        index = self._parents.get(key)
+        if index is not None:
+            return index
+
+        if child is parent:
+            index = np.arange(len(child), dtype=np.intp)
+        else:
+            lookup = {code: i for i, code in enumerate(parent.codes.tolist()) if code}
+            length = parent.code_length
+            index = np.fromiter(
+                (lookup.get(code[:length], -1) if len(code) >= length else -1 for code in child.codes.tolist()),
+                dtype=np.intp,
+                count=len(child),
+            )
+            _validate_containment(child, parent, index)
+
+        self._parents[key] = index
+        return index
+
+    def get(self, name: str) -> Boundary:
+        """
+        Ambil boundary berdasarkan nama file.
+
+        Args:
+            name: Nama file boundary di dalam folder assets, misal `jatim.json`
+
+        Returns:
+            Boundary: Entry boundary yang sudah di-parse dan di-prepare
+        """
+        name = self._normalize_name(name)
+        entry = self._entries.get(name)
+        now = time.monotonic()
+
+        if entry is not None and now - self._checked_at.get(name, 0) < self.check_interval:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(name)
+            path = os.path.join(self.directory, name)
+            mtime = self._get_mtime(path)
+
+            if mtime is None:
+                self._entries.pop(name, None)
+                self._checked_at.pop(name, None)
+                raise NotFoundException(f"File boundary tidak ditemukan: {name}")
+
+            if entry is None or entry.mtime != mtime:
+                with open(path, "rb") as f:
+                    geojson = orjson.loads(f.read())
+                entry = Boundary(name, path, mtime, geojson.get("features", []))
+                self._entries[name] = entry
+
+            self._checked_at[name] = now
+            return entry
+
+    def _normalize_name(self, name: str) -> str:
+        name = os.path.basename(name)
+        if not name.endswith(".json"):
+            name = f"{name}.json"
+        return name
+
+    def _get_mtime(self, path: str) -> Optional[float]:
+        try:
+            return os.stat(path).st_mtime
+        except FileNotFoundError:
+            return None
+
+
+boundary_registry = BoundaryRegistry(settings.BOUNDARY_DIR, settings.BOUNDARY_RELOAD_INTERVAL)
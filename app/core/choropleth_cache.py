@@ -0,0 +1,90 @@
+import asyncio
+import hashlib
+import io
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import orjson
+from fastapi import HTTPException
+from miniopy_async.error import MinioException
+
+from app.core.config import settings
+from app.core.minio_client import MinioClient
+from app.utils.assignment import AssignmentState
+from app.utils.cache import LRUCache
+from app.utils.clustering import ClusterIndex
+
+ChoroplethResult = Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+
+# Gangguan MinIO (objek tidak ada, koneksi/timeout, respons S3 error) tidak boleh menggagalkan
+# request; cache MinIO hanya lapisan tambahan di atas cache memori.
+_MINIO_ERRORS = (HTTPException, MinioException, aiohttp.ClientError, asyncio.TimeoutError, OSError)
+
+
+class ChoroplethCache:
+    """
+    Cache hasil choropleth `(result, rangelist)` berdasarkan fingerprint input.
+
+    Hasil disimpan di memori proses (LRU). Jika `use_minio` aktif, hasil juga disimpan
+    ke MinIO sehingga bisa dipakai ulang oleh worker lain maupun setelah restart. Kegagalan
+    MinIO diperlakukan sebagai cache miss (get) atau penulisan yang dilewati (set).
+    """
+
+    def __init__(self, maxsize: int, use_minio: bool = False, prefix: str = "cache/choropleth"):
+        self.use_minio = use_minio
+        self.prefix = prefix.strip("/")
+        self._results: LRUCache[str, ChoroplethResult] = LRUCache(maxsize=maxsize)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Buat fingerprint dari komponen input, misal digest sumber data, boundary dan color range."""
+        return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def object_name(self, key: str) -> str:
+        return f"{self.prefix}/{key}.json"
+
+    async def get(self, key: str) -> Optional[ChoroplethResult]:
+        result = self._results.get(key)
+        if result is not None or not self.use_minio:
+            return result
+
+        try:
+            content = await MinioClient().read_file(self.object_name(key))
+            payload = orjson.loads(content)
+            result = (payload["data"], payload["rangelist"])
+        except (*_MINIO_ERRORS, orjson.JSONDecodeError, KeyError, TypeError):
+            return None
+
+        self._results.set(key, result)
+        return result
+
+    async def set(self, key: str, result: ChoroplethResult) -> None:
+        self._results.set(key, result)
+        if not self.use_minio:
+            return
+
+        content = orjson.dumps({"data": result[0], "rangelist": result[1]}, option=orjson.OPT_SERIALIZE_NUMPY)
+        try:
+            await MinioClient().upload_file(
+                file_data=io.BytesIO(content),
+                object_name=self.object_name(key),
+                content_type="application/json",
+                content_length=len(content),
+            )
+        except _MINIO_ERRORS:
+            pass
+
+
+choropleth_cache = ChoroplethCache(
+    settings.CHOROPLETH_CACHE_SIZE, settings.CHOROPLETH_CACHE_MINIO, settings.CHOROPLETH_CACHE_PREFIX
+)
+
+tile_cache: LRUCache[tuple, bytes] = LRUCache(maxsize=None, max_bytes=settings.TILE_CACHE_MAX_BYTES, sizeof=len)
+
+assignment_cache: LRUCache[tuple, AssignmentState] = LRUCache(
+    maxsize=None, max_bytes=settings.ASSIGNMENT_CACHE_MAX_BYTES, sizeof=lambda state: state.nbytes
+)
+
+cluster_cache: LRUCache[tuple, ClusterIndex] = LRUCache(
+    maxsize=None, max_bytes=settings.CLUSTER_CACHE_MAX_BYTES, sizeof=lambda index: index.nbytes
+)
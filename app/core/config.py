@@ -72,6 +72,42 @@ class Settings(BaseSettings):
 
     TIMEZONE: str = Field(default="Asia/Jakarta")
 
+    # Geoprocessing settings
+    BOUNDARY_DIR: str = Field(default="assets")
+    BOUNDARY_RELOAD_INTERVAL: int = Field(default=30)
+    BOUNDARY_CODE_FIELDS: List[str] = Field(default=["kode", "code", "kode_wilayah", "kd_wilayah"])
+    BOUNDARY_PYRAMID_DIR: str = Field(default="assets/.pyramid")
+    BOUNDARY_PYRAMID_TOLERANCES: List[float] = Field(default=[0.0001, 0.0005, 0.002, 0.01])
+    TOPOJSON_QUANTIZATION: int = Field(default=100000)
+    GEOPROCESSING_WORKERS: int = Field(default=2)
+    GEOPROCESSING_QUEUE_SIZE: int = Field(default=8)
+    GEOPROCESSING_QUEUE_TIMEOUT: float = Field(default=30)
+    GEOJSON_CHUNK_SIZE: int = Field(default=65536)
+    HTTP_MAX_CONNECTIONS: int = Field(default=100)
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = Field(default=6)
+    HTTP_TIMEOUT: float = Field(default=60)
+    COLOR_SCALE_BATCH_MAX_JOBS: int = Field(default=50)
+    COLOR_SCALE_JOB_WORKERS: int = Field(default=4)
+    COLOR_SCALE_JOB_TTL: int = Field(default=600)
+    COLOR_SCALE_JOB_MAX_WAIT: int = Field(default=30)
+    COLOR_SCALE_JOB_MAX_PENDING: int = Field(default=100)
+    COLOR_SCALE_JOB_MAX_RETAINED: int = Field(default=1000)
+    ASSIGNMENT_CACHE_MAX_BYTES: int = Field(default=128 * 1024 * 1024)
+    TILE_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024)
+    CLUSTER_CACHE_MAX_BYTES: int = Field(default=256 * 1024 * 1024)
+    CLUSTER_RADIUS: int = Field(default=40)
+    CLUSTER_EXTENT: int = Field(default=512)
+    CLUSTER_MAX_ZOOM: int = Field(default=16)
+    SOURCE_CACHE_TTL: int = Field(default=300)
+    SOURCE_CACHE_MAX_BYTES: int = Field(default=256 * 1024 * 1024)
+    SOURCE_MINIO_PREFIXES: List[str] = Field(default=["sources/"])
+    CHOROPLETH_CACHE_SIZE: int = Field(default=256)
+    CHOROPLETH_CACHE_MINIO: bool = Field(default=False)
+    CHOROPLETH_CACHE_PREFIX: str = Field(default="cache/choropleth")
+    COUNT_ESTIMATE_THRESHOLD: int = Field(default=10000)
+    SEARCH_FUZZY_THRESHOLD: float = Field(default=0.5)
+    FILTER_CACHE_SIZE: int = Field(default=1024)
+
     # Settings config
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="allow")
 
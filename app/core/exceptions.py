@@ -58,6 +58,18 @@ UnprocessableEntity = create_exception(
 DuplicateValueException = create_exception(
     "DuplicateValueException", status.HTTP_422_UNPROCESSABLE_ENTITY, HTTPStatus.UNPROCESSABLE_ENTITY.description
 )
+ConflictException = create_exception("ConflictException", status.HTTP_409_CONFLICT, HTTPStatus.CONFLICT.description)
+TooManyRequestsException = create_exception(
+    "TooManyRequestsException", status.HTTP_429_TOO_MANY_REQUESTS, HTTPStatus.TOO_MANY_REQUESTS.description
+)
+ServiceUnavailableException = create_exception(
+    "ServiceUnavailableException", status.HTTP_503_SERVICE_UNAVAILABLE, HTTPStatus.SERVICE_UNAVAILABLE.description
+)
+UnsupportedMediaTypeException = create_exception(
+    "UnsupportedMediaTypeException",
+    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+    HTTPStatus.UNSUPPORTED_MEDIA_TYPE.description,
+)
 InvalidInputException = create_exception(
     "InvalidInputException", status.HTTP_422_UNPROCESSABLE_ENTITY, HTTPStatus.UNPROCESSABLE_ENTITY.description
 )
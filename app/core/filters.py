@@ -0,0 +1,340 @@
+"""
+Compiler parameter `filter` dan `sort` endpoint list.
+
+Grammar `filter` (JSON, lihat `CommonParams`):
+
+- string `"kolom<op>nilai"` dengan op `=`, `!=`, `>`, `>=`, `<`, `<=` atau `~` (ILIKE);
+  nilai `null` dengan `=`/`!=` berarti IS NULL/IS NOT NULL
+- object `{"field": "kolom", "op": "...", "value": ...}` dengan op `eq`, `ne`, `gt`, `gte`,
+  `lt`, `lte`, `in`, `not_in`, `between` ([min, max], salah satunya boleh null), `ilike`,
+  `is_null` (true/false), `date`, `date_from` dan `date_to` (tanggal `YYYY-MM-DD`)
+- list berisi item di atas: digabung dengan OR
+
+Grammar `sort`: `"kolom:asc"` atau `"kolom:desc"`.
+
+Nilai dikonversi sesuai tipe kolom SQLAlchemy-nya. Operator tanggal diterjemahkan menjadi
+rentang `>= awal hari` dan `< awal hari berikutnya` agar tetap bisa memakai index kolom.
+Hasil parsing di-cache per string query mentah.
+"""
+
+import re
+import uuid
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+from zoneinfo import ZoneInfo
+
+import orjson
+from sqlalchemy import DateTime, and_, or_
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+
+from app.core.config import settings
+from app.core.database import Base
+from app.core.exceptions import UnprocessableEntity
+from app.utils.cache import LRUCache
+
+Models = Union[Type[Base], Sequence[Type[Base]]]
+
+_STRING_PATTERN = re.compile(r"^\s*([A-Za-z_]\w*)\s*(!=|>=|<=|=|>|<|~)(.*)$", re.DOTALL)
+_STRING_OPERATORS = {"=": "eq", "!=": "ne", ">": "gt", ">=": "gte", "<": "lt", "<=": "lte", "~": "ilike"}
+_OPERATORS = {
+    "eq",
+    "ne",
+    "gt",
+    "gte",
+    "lt",
+    "lte",
+    "in",
+    "not_in",
+    "between",
+    "ilike",
+    "is_null",
+    "date",
+    "date_from",
+    "date_to",
+}
+_TRUE = {"true", "t", "1", "yes"}
+_FALSE = {"false", "f", "0", "no"}
+
+
+class FilterCondition(NamedTuple):
+    """Satu kondisi filter yang sudah di-resolve ke kolom model dan nilainya sudah dikonversi."""
+
+    model: Type[Base]
+    column: str
+    op: str
+    value: Any
+
+
+class FilterGroup(NamedTuple):
+    """Kondisi-kondisi yang digabung dengan OR."""
+
+    conditions: Tuple[FilterCondition, ...]
+
+
+class SortItem(NamedTuple):
+    model: Type[Base]
+    column: str
+    descending: bool
+
+
+class CompiledFilters(NamedTuple):
+    nodes: Tuple[Union[FilterCondition, FilterGroup], ...]
+
+    def clauses(self, model: Optional[Type[Base]] = None) -> List[ColumnElement]:
+        """
+        Bangun klausa WHERE.
+
+        Args:
+            model: Hanya kondisi untuk model ini; grup OR yang mencampur beberapa model
+                dipecah per model. None berarti semua kondisi
+
+        Returns:
+            List[ColumnElement]: Klausa yang digabung dengan AND
+        """
+        clauses = []
+        for node in self.nodes:
+            if isinstance(node, FilterGroup):
+                conditions = [_clause(c) for c in node.conditions if model is None or c.model is model]
+                if conditions:
+                    clauses.append(or_(*conditions))
+            elif model is None or node.model is model:
+                clauses.append(_clause(node))
+        return clauses
+
+
+_filter_cache: LRUCache[tuple, CompiledFilters] = LRUCache(maxsize=settings.FILTER_CACHE_SIZE)
+_sort_cache: LRUCache[tuple, Tuple[SortItem, ...]] = LRUCache(maxsize=settings.FILTER_CACHE_SIZE)
+
+
+def compile_filters(filters: Any, models: Models) -> CompiledFilters:
+    """
+    Parse parameter `filter` menjadi kondisi terkompilasi.
+
+    Args:
+        filters: Hasil `CommonParams.filter` (string, object atau list)
+        models: Model tujuan; kolom dicari berurutan pada setiap model
+
+    Raises:
+        UnprocessableEntity: Jika format, kolom, operator atau nilai filter tidak valid
+
+    Returns:
+        CompiledFilters: Kondisi filter, gunakan `clauses()` untuk klausa WHERE
+    """
+    models = _as_tuple(models)
+    key = (models, _raw(filters, "filter"))
+    compiled = _filter_cache.get(key)
+    if compiled is None:
+        compiled = CompiledFilters(tuple(_parse_node(item, models) for item in _as_items(filters, "filter")))
+        _filter_cache.set(key, compiled)
+    return compiled
+
+
+def compile_sort(sort: Any, models: Models) -> List[UnaryExpression]:
+    """
+    Parse parameter `sort` menjadi klausa ORDER BY.
+
+    Raises:
+        UnprocessableEntity: Jika format, kolom atau arah sort tidak valid
+
+    Returns:
+        List[UnaryExpression]: Klausa ORDER BY sesuai urutan parameter
+    """
+    models = _as_tuple(models)
+    key = (models, _raw(sort, "sort"))
+    items = _sort_cache.get(key)
+    if items is None:
+        items = tuple(_parse_sort(item, models) for item in _as_items(sort, "sort"))
+        _sort_cache.set(key, items)
+
+    columns = (getattr(item.model, item.column) for item in items)
+    return [column.desc() if item.descending else column.asc() for item, column in zip(items, columns)]
+
+
+def _as_tuple(models: Models) -> Tuple[Type[Base], ...]:
+    return tuple(models) if isinstance(models, (list, tuple)) else (models,)
+
+
+def _as_items(value: Any, kind: str) -> List[Any]:
+    if not value:
+        return []
+    if isinstance(value, (str, dict)):
+        return [value]
+    if isinstance(value, list):
+        return value
+    raise UnprocessableEntity(f"Invalid {kind} {value}")
+
+
+def _raw(value: Any, kind: str) -> Union[str, bytes]:
+    if isinstance(value, str):
+        return value
+    try:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        raise UnprocessableEntity(f"Invalid {kind} {value}")
+
+
+def _parse_node(item: Any, models: Tuple[Type[Base], ...]) -> Union[FilterCondition, FilterGroup]:
+    if isinstance(item, list):
+        if any(isinstance(value, list) for value in item):
+            raise UnprocessableEntity(f"Invalid filter {item}, OR group cannot be nested")
+        return FilterGroup(tuple(_parse_condition(value, models) for value in item))
+    return _parse_condition(item, models)
+
+
+def _parse_condition(item: Any, models: Tuple[Type[Base], ...]) -> FilterCondition:
+    if isinstance(item, str):
+        match = _STRING_PATTERN.match(item)
+        if not match:
+            raise UnprocessableEntity(
+                f"Invalid filter {item} must be 'name=value' or '[[name=value],[name=value]]'"
+            )
+        name, operator, value = match.groups()
+        op = _STRING_OPERATORS[operator]
+        if op in {"eq", "ne"} and value.lower() == "null":
+            op, value = "is_null", op == "eq"
+    elif isinstance(item, dict):
+        name, op, value = item.get("field"), item.get("op", "eq"), item.get("value")
+        if not isinstance(name, str) or op not in _OPERATORS:
+            raise UnprocessableEntity(f"Invalid filter {item} must have 'field' and a valid 'op'")
+    else:
+        raise UnprocessableEntity(f"Invalid filter {item}")
+
+    model = _resolve(name, models, "filter")
+    column = getattr(model, name)
+    return FilterCondition(model, name, op, _coerce_operand(column, op, value, name))
+
+
+def _parse_sort(item: Any, models: Tuple[Type[Base], ...]) -> SortItem:
+    try:
+        name, order = item.split(":")
+    except (AttributeError, ValueError):
+        raise UnprocessableEntity(f"Invalid sort {item}. Must be 'name:asc' or 'name:desc'")
+
+    model = _resolve(name, models, "sort")
+    if order.lower() not in {"asc", "desc"}:
+        raise UnprocessableEntity(f"Invalid sort order '{order}' for {name}")
+    return SortItem(model, name, order.lower() == "desc")
+
+
+def _resolve(name: str, models: Tuple[Type[Base], ...], kind: str) -> Type[Base]:
+    for model in models:
+        if name in model.__mapper__.columns:
+            return model
+    raise UnprocessableEntity(f"Invalid {kind} column: {name}")
+
+
+def _coerce_operand(column: ColumnElement, op: str, value: Any, name: str) -> Any:
+    if op in {"in", "not_in"}:
+        if not isinstance(value, list):
+            raise UnprocessableEntity(f"Invalid filter value {value} for {name}, '{op}' requires a list")
+        return tuple(_coerce(column, item, name) for item in value)
+
+    if op == "between":
+        if not isinstance(value, list) or len(value) != 2 or value == [None, None]:
+            raise UnprocessableEntity(f"Invalid filter value {value} for {name}, 'between' requires [min, max]")
+        return tuple(None if item is None else _coerce(column, item, name) for item in value)
+
+    if op == "is_null":
+        return value if isinstance(value, bool) else _to_bool(True if value is None else value, name)
+
+    if op == "ilike":
+        if not isinstance(value, str) or not value:
+            raise UnprocessableEntity(f"Invalid filter value {value} for {name}, 'ilike' requires a string")
+        return value if "%" in value or "_" in value else f"%{value}%"
+
+    if op in {"date", "date_from", "date_to"}:
+        try:
+            return date.fromisoformat(str(value)[:10])
+        except ValueError:
+            raise UnprocessableEntity(f"Invalid filter value {value} for {name}, expected YYYY-MM-DD")
+
+    return _coerce(column, value, name)
+
+
+def _coerce(column: ColumnElement, value: Any, name: str) -> Any:
+    """Konversi nilai ke tipe Python kolom."""
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    try:
+        if python_type is bool:
+            return value if isinstance(value, bool) else _to_bool(value, name)
+        if issubclass(python_type, datetime):
+            parsed = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+            if parsed.tzinfo is None and getattr(column.type, "timezone", False):
+                parsed = parsed.replace(tzinfo=ZoneInfo(settings.TIMEZONE))
+            return parsed
+        if issubclass(python_type, date):
+            return date.fromisoformat(str(value))
+        if python_type is Decimal:
+            return Decimal(str(value))
+        if issubclass(python_type, (int, float)):
+            if isinstance(value, bool):
+                raise ValueError(value)
+            return python_type(value)
+        if issubclass(python_type, uuid.UUID):
+            return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+        if python_type is str:
+            return value if isinstance(value, str) else orjson.dumps(value).decode()
+    except (TypeError, ValueError, InvalidOperation):
+        raise UnprocessableEntity(f"Invalid filter value {value} for {name}")
+
+    return value
+
+
+def _to_bool(value: Any, name: str) -> bool:
+    text = str(value).lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise UnprocessableEntity(f"Invalid filter value {value} for {name}, expected true or false")
+
+
+def _day_start(column: ColumnElement, day: date) -> Union[date, datetime]:
+    if not isinstance(column.type, DateTime):
+        return day
+    tzinfo = ZoneInfo(settings.TIMEZONE) if column.type.timezone else None
+    return datetime.combine(day, time.min, tzinfo=tzinfo)
+
+
+def _clause(condition: FilterCondition) -> ColumnElement:
+    column = getattr(condition.model, condition.column)
+    op, value = condition.op, condition.value
+
+    if op == "eq":
+        return column.is_(value) if value is None or isinstance(value, bool) else column == value
+    if op == "ne":
+        return column.is_not(value) if value is None or isinstance(value, bool) else column != value
+    if op == "gt":
+        return column > value
+    if op == "gte":
+        return column >= value
+    if op == "lt":
+        return column < value
+    if op == "lte":
+        return column <= value
+    if op == "in":
+        return column.in_(value)
+    if op == "not_in":
+        return column.not_in(value)
+    if op == "between":
+        low, high = value
+        bounds = ([] if low is None else [column >= low]) + ([] if high is None else [column <= high])
+        return and_(*bounds)
+    if op == "ilike":
+        return column.ilike(value)
+    if op == "is_null":
+        return column.is_(None) if value else column.is_not(None)
+    if op == "date":
+        return and_(column >= _day_start(column, value), column < _day_start(column, value + timedelta(days=1)))
+    if op == "date_from":
+        return column >= _day_start(column, value)
+    # date_to: sampai akhir hari tersebut
+    return column < _day_start(column, value + timedelta(days=1))
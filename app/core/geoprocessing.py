@@ -0,0 +1,382 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+import shapely
+
+from app.core.boundary_pyramid import boundary_pyramids
+from app.core.boundary_registry import boundary_registry
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.core.source_cache import SourceEntry
+from app.utils.aggregation import AggregateFunction, PolygonAggregator
+from app.utils.assignment import AssignmentState
+from app.utils.binning import BinShape, bin_cells, cell_polygons, group_cells
+from app.utils.class_breaks import ClassificationMethod, classify
+from app.utils.clustering import ClusterIndex
+from app.utils.geojson_stream import PointChunk, iter_point_chunks
+from app.utils.mvt import encode_tile, tile_bounds, to_tile_geometry
+from app.utils.reprojection import reproject_chunks
+from app.utils.source_formats import iter_source_point_chunks
+from app.utils.spatial import PointInPolygonEngine
+
+T = TypeVar("T")
+
+
+class GeoProcessPool:
+    """
+    Process pool untuk pekerjaan geoprocessing yang CPU-bound (shapely/NumPy).
+
+    Pekerjaan dijalankan di luar event loop agar request lain tetap dilayani. Jumlah
+    pekerjaan yang berjalan dan mengantre dibatasi `max_workers + queue_size`; pekerjaan
+    yang tidak mendapat slot dalam `queue_timeout` detik ditolak dengan 503.
+    """
+
+    def __init__(self, max_workers: int, queue_size: int, queue_timeout: float):
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._restart_lock = asyncio.Lock()
+
+    def start(self) -> None:
+        self._slots = asyncio.Semaphore(max(1, self.max_workers) + self.queue_size)
+        if self.max_workers < 1:
+            return
+
+        self._executor = self._create_executor()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Jalankan fungsi di process pool.
+
+        Jika pool tidak aktif (misal GEOPROCESSING_WORKERS=0), fungsi dijalankan di thread
+        terpisah agar event loop tetap tidak terblokir. Jika worker mati (misal OOM) pool
+        dibuat ulang dan pekerjaan dicoba sekali lagi; kegagalan kedua ditolak dengan 503.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, self.max_workers) + self.queue_size)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ServiceUnavailableException("Antrean geoprocessing penuh, silakan coba lagi")
+
+        try:
+            if self._executor is None:
+                return await asyncio.to_thread(fn, *args)
+
+            loop = asyncio.get_running_loop()
+            executor = self._executor
+            try:
+                return await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                executor = await self._restart(executor)
+
+            try:
+                return await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                await self._restart(executor)
+                raise ServiceUnavailableException("Worker geoprocessing berhenti tiba-tiba, silakan coba lagi")
+        finally:
+            self._slots.release()
+
+    async def _restart(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Ganti executor yang rusak; pemanggil lain yang melihat executor sama memakai pengganti yang sama."""
+        async with self._restart_lock:
+            if self._executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+            return self._executor
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        for _ in range(self.max_workers):
+            executor.submit(_warm_up)
+        return executor
+
+
+def _init_worker() -> None:
+    boundary_registry.load_all()
+
+
+def _warm_up() -> None:
+    pass
+
+
+def aggregate_points(
+    boundary_name: str,
+    point_chunks: Iterable[PointChunk],
+    aggregate: AggregateFunction = AggregateFunction.count,
+    level: Optional[int] = None,
+) -> List[Dict]:
+    """Agregasikan titik per poligon boundary dari chunk koordinat, opsional pada level piramida tertentu."""
+    boundary = boundary_registry.get(boundary_name)
+    aggregator = _join_points(boundary_pyramids.engine(boundary, level), len(boundary), point_chunks)
+    return _aggregate_rows(boundary.properties, aggregator, aggregate)
+
+
+def aggregate_points_hierarchy(
+    boundary_names: List[str],
+    point_chunks: Iterable[PointChunk],
+    aggregate: AggregateFunction = AggregateFunction.count,
+) -> Dict[str, List[Dict]]:
+    """
+    Agregasikan titik ke beberapa tingkat wilayah dengan satu spatial join.
+
+    Titik hanya di-join ke boundary terhalus, lalu akumulatornya digabung ke boundary
+    yang lebih kasar lewat relasi kode wilayah.
+
+    Returns:
+        Dict[str, List[Dict]]: Data choropleth per nama boundary
+    """
+    hierarchy = boundary_registry.hierarchy(boundary_names)
+    finest = hierarchy[0][0]
+    aggregator = _join_points(finest.engine, len(finest), point_chunks)
+
+    result = {}
+    for boundary, parent_idx in hierarchy:
+        level_aggregator = aggregator if boundary is finest else aggregator.rollup(parent_idx, len(boundary))
+        result[boundary.name] = _aggregate_rows(boundary.properties, level_aggregator, aggregate)
+    return result
+
+
+def _source_points(
+    source: SourceEntry,
+    chunk_size: int,
+    field: Optional[str] = None,
+    with_keys: bool = False,
+    source_crs: Optional[str] = None,
+) -> Iterable[PointChunk]:
+    """Baca titik dari sumber data lalu reproyeksikan ke CRS boundary (WGS 84) per chunk."""
+    point_chunks = iter_source_point_chunks(source, chunk_size=chunk_size, value_field=field, with_keys=with_keys)
+    return reproject_chunks(point_chunks, source_crs)
+
+
+def _join_points(engine: PointInPolygonEngine, size: int, point_chunks: Iterable[PointChunk]) -> PolygonAggregator:
+    aggregator = PolygonAggregator(size)
+    for chunk in point_chunks:
+        point_idx, polygon_idx = engine.join(chunk.x, chunk.y)
+        aggregator.update(polygon_idx, chunk.values[point_idx] if chunk.values is not None else None)
+    return aggregator
+
+
+def _aggregate_rows(properties: List[Dict], aggregator: PolygonAggregator, aggregate: AggregateFunction) -> List[Dict]:
+    return [{**item, "value": _to_python(value)} for item, value in zip(properties, aggregator.result(aggregate))]
+
+
+def aggregate_feature_points(
+    features: List[Dict],
+    boundary_name: str,
+    coordinate_field: str = "coordinates",
+    aggregate: AggregateFunction = AggregateFunction.count,
+    field: Optional[str] = None,
+    chunk_size: int = 65536,
+    level: Optional[int] = None,
+    source_crs: Optional[str] = None,
+) -> List[Dict]:
+    point_chunks = reproject_chunks(iter_point_chunks(features, coordinate_field, chunk_size, field), source_crs)
+    return aggregate_points(boundary_name, point_chunks, aggregate, level)
+
+
+def compute_colorscale(
+    source: SourceEntry,
+    boundary_name: str,
+    color_range: List[str],
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    aggregate: AggregateFunction = AggregateFunction.count,
+    field: Optional[str] = None,
+    chunk_size: int = 65536,
+    level: Optional[int] = None,
+    source_crs: Optional[str] = None,
+) -> Tuple[List[Dict], List[Dict]]:
+    """Hitung choropleth dari sumber data yang di-stream lalu beri warna sesuai class break."""
+    point_chunks = _source_points(source, chunk_size, field, source_crs=source_crs)
+    choropleth_data = aggregate_points(boundary_name, point_chunks, aggregate, level)
+
+    return classify_choropleth(choropleth_data, color_range, method, integer=aggregate == AggregateFunction.count)
+
+
+def compute_colorscale_incremental(
+    source: SourceEntry,
+    boundary_name: str,
+    color_range: List[str],
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    aggregate: AggregateFunction = AggregateFunction.count,
+    field: Optional[str] = None,
+    chunk_size: int = 65536,
+    level: Optional[int] = None,
+    state: Optional[AssignmentState] = None,
+    source_crs: Optional[str] = None,
+) -> Tuple[List[Dict], List[Dict], AssignmentState]:
+    """
+    Seperti `compute_colorscale`, tetapi memakai ulang hasil join dari `state` sebelumnya.
+
+    Hanya feature baru atau yang berpindah koordinat yang di-join ke boundary. Sumber data
+    tetap di-stream per chunk: pasangan (feature, poligon) setiap chunk langsung diagregasi,
+    sehingga selain satu chunk hanya state ringkas (sekitar 12 byte per feature) yang
+    ditahan. Agregat selalu dihitung dari seluruh pasangan dokumen baru, sehingga min/max
+    tetap benar ketika feature dihapus.
+
+    Returns:
+        Tuple[List[Dict], List[Dict], AssignmentState]: Data choropleth, rangelist dan state baru
+    """
+    boundary = boundary_registry.get(boundary_name)
+    point_chunks = _source_points(source, chunk_size, field, with_keys=True, source_crs=source_crs)
+
+    aggregator = PolygonAggregator(len(boundary))
+    engine = boundary_pyramids.engine(boundary, level)
+    state, _ = (state or AssignmentState.empty()).update(engine, point_chunks, aggregator)
+    choropleth_data = _aggregate_rows(boundary.properties, aggregator, aggregate)
+
+    result, rangelist = classify_choropleth(
+        choropleth_data, color_range, method, integer=aggregate == AggregateFunction.count
+    )
+    return result, rangelist, state
+
+
+def compute_colorscale_levels(
+    source: SourceEntry,
+    boundary_names: List[str],
+    color_range: List[str],
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    aggregate: AggregateFunction = AggregateFunction.count,
+    field: Optional[str] = None,
+    chunk_size: int = 65536,
+    source_crs: Optional[str] = None,
+) -> Dict[str, Tuple[List[Dict], List[Dict]]]:
+    """Hitung choropleth beberapa tingkat wilayah sekaligus, class break dihitung per tingkat."""
+    point_chunks = _source_points(source, chunk_size, field, source_crs=source_crs)
+    levels = aggregate_points_hierarchy(boundary_names, point_chunks, aggregate)
+
+    integer = aggregate == AggregateFunction.count
+    return {name: classify_choropleth(data, color_range, method, integer=integer) for name, data in levels.items()}
+
+
+def compute_colorscale_bins(
+    source: SourceEntry,
+    cell_size: float,
+    shape: BinShape,
+    color_range: List[str],
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    aggregate: AggregateFunction = AggregateFunction.count,
+    field: Optional[str] = None,
+    chunk_size: int = 65536,
+    source_crs: Optional[str] = None,
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Hitung peta kepadatan titik pada grid hexagon/persegi tanpa boundary.
+
+    Setiap chunk titik dipetakan ke indeks sel secara tervektorisasi, lalu sel yang berisi
+    titik diagregasi dengan `PolygonAggregator` dan diberi warna sesuai class break.
+
+    Returns:
+        Tuple[List[Dict], List[Dict]]: Feature GeoJSON sel dengan `value` dan `color`, serta rangelist
+    """
+    columns, rows, values = [], [], []
+    for chunk in _source_points(source, chunk_size, field, source_crs=source_crs):
+        column, row = bin_cells(chunk.x, chunk.y, cell_size, shape)
+        columns.append(column)
+        rows.append(row)
+        values.append(chunk.values)
+
+    empty = np.empty(0, dtype=np.int64)
+    cell_columns, cell_rows, cell_idx = group_cells(
+        np.concatenate(columns) if columns else empty, np.concatenate(rows) if rows else empty
+    )
+
+    aggregator = PolygonAggregator(len(cell_columns))
+    aggregator.update(cell_idx, np.concatenate(values) if field and values else None)
+    properties = [{"cell": f"{column},{row}"} for column, row in zip(cell_columns.tolist(), cell_rows.tolist())]
+    cells = _aggregate_rows(properties, aggregator, aggregate)
+
+    result, rangelist = classify_choropleth(cells, color_range, method, integer=aggregate == AggregateFunction.count)
+    features = [
+        {"type": "Feature", "geometry": geometry, "properties": item}
+        for geometry, item in zip(cell_polygons(cell_columns, cell_rows, cell_size, shape), result)
+    ]
+    return features, rangelist
+
+
+def classify_choropleth(
+    choropleth_data: List[Dict],
+    color_range: List[str],
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    integer: bool = True,
+) -> Tuple[List[Dict], List[Dict]]:
+    values = np.array([np.nan if row["value"] is None else row["value"] for row in choropleth_data], dtype=np.float64)
+    # Hanya agregat count (integer) yang memakai 0 sebagai tanpa data; agregat lain memakai None.
+    class_index, rangelist = classify(values, color_range, method, integer=integer, zero_is_no_data=integer)
+
+    result = []
+    for item, index in zip(choropleth_data, class_index):
+        temp = item.copy()
+        if index >= 0:
+            temp["color"] = rangelist[index]["color"]
+        result.append(temp)
+
+    return result, rangelist
+
+
+def render_tile(
+    boundary_name: str, z: int, x: int, y: int, attributes: Optional[List[Dict]] = None
+) -> bytes:
+    """
+    Render satu tile MVT untuk boundary.
+
+    Args:
+        boundary_name: Nama file boundary
+        z, x, y: Koordinat tile (skema XYZ)
+        attributes: Atribut per feature sesuai urutan boundary, misal hasil choropleth
+            berisi `value` dan `color`. Jika None, properties boundary yang dipakai.
+
+    Returns:
+        bytes: Tile MVT, kosong jika tidak ada feature di area tile
+    """
+    boundary = boundary_registry.get(boundary_name)
+    if attributes is None:
+        attributes = boundary.properties
+
+    bounds = tile_bounds(z, x, y)
+    geometries: List[Optional[Any]] = [None] * len(boundary)
+    for index in boundary.mercator_tree.query(shapely.box(*bounds)):
+        geometries[index] = to_tile_geometry(boundary.mercator[index], bounds)
+
+    layer_name = boundary.name.removesuffix(".json")
+    return encode_tile([(layer_name, geometries, attributes)])
+
+
+def build_cluster_index(source: SourceEntry, chunk_size: int = 65536, source_crs: Optional[str] = None) -> ClusterIndex:
+    """Bangun index cluster titik dari sumber data yang di-stream, chunk demi chunk."""
+    return ClusterIndex.from_chunks(
+        _source_points(source, chunk_size, source_crs=source_crs),
+        max_zoom=settings.CLUSTER_MAX_ZOOM,
+        radius=settings.CLUSTER_RADIUS,
+        extent=settings.CLUSTER_EXTENT,
+    )
+
+
+def _to_python(value: float) -> int | float | None:
+    if np.isnan(value):
+        return None
+    if isinstance(value, np.integer):
+        return int(value)
+    return float(value)
+
+
+geo_pool = GeoProcessPool(
+    settings.GEOPROCESSING_WORKERS, settings.GEOPROCESSING_QUEUE_SIZE, settings.GEOPROCESSING_QUEUE_TIMEOUT
+)
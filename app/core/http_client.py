@@ -0,0 +1,55 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config import settings
+
+
+class HttpClientPool:
+    """
+    Client HTTP/2 bersama untuk mengambil sumber data remote.
+
+    Satu `httpx.AsyncClient` dipakai ulang oleh semua request sehingga koneksi ke host
+    yang sama di-multiplex, dan jumlah request bersamaan per host dibatasi `max_per_host`.
+    """
+
+    def __init__(self, max_connections: int, max_per_host: int, timeout: float):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                verify=False,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def limit(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Ambil slot request untuk host dari `url`, lalu kembalikan client bersama."""
+        host = urlparse(url).netloc
+        slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with slots:
+            yield self.client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+http_client = HttpClientPool(
+    settings.HTTP_MAX_CONNECTIONS, settings.HTTP_MAX_CONNECTIONS_PER_HOST, settings.HTTP_TIMEOUT
+)
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from uuid6 import uuid7
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundException, ServiceUnavailableException, TooManyRequestsException
+
+
+class JobStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
+class Job:
+    def __init__(self, key: str):
+        self.id = str(uuid7())
+        self.key = key
+        self.status = JobStatus.pending
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.done, JobStatus.failed)
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """
+    Antrean pekerjaan background di dalam proses.
+
+    Pekerjaan dengan `key` yang sama selama masih pending/running digabung ke job yang
+    sama. Paling banyak `max_workers` pekerjaan berjalan bersamaan, dan job yang sudah
+    selesai disimpan selama `result_ttl` detik sebelum dibuang.
+
+    Jumlah job dibatasi agar memori tidak tumbuh tanpa batas: paling banyak `max_pending`
+    job pending/running, dan paling banyak `max_retained` job yang disimpan. Jika batas
+    simpan tercapai, job selesai yang paling lama dibuang lebih dulu.
+
+    Status job hanya tersimpan di memori proses ini, sehingga pada deployment dengan
+    beberapa worker, polling harus diarahkan ke worker yang sama (sticky session).
+    """
+
+    def __init__(self, max_workers: int, result_ttl: int, max_pending: int, max_retained: int):
+        self.max_workers = max_workers
+        self.result_ttl = result_ttl
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self._jobs: Dict[str, Job] = {}
+        self._inflight: Dict[str, Job] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Job:
+        """
+        Daftarkan pekerjaan baru atau kembalikan job yang sedang berjalan untuk `key` yang sama.
+
+        Args:
+            key: Kunci deduplikasi pekerjaan
+            fn: Fungsi tanpa argumen yang mengembalikan coroutine pekerjaan
+
+        Raises:
+            TooManyRequestsException: Jika job pending/running sudah mencapai `max_pending`
+            ServiceUnavailableException: Jika job tersimpan sudah mencapai `max_retained` dan
+                tidak ada job selesai yang bisa dibuang
+
+        Returns:
+            Job: Job yang menangani pekerjaan
+        """
+        self._purge()
+
+        job = self._inflight.get(key)
+        if job is not None:
+            return job
+
+        if len(self._inflight) >= self.max_pending:
+            raise TooManyRequestsException("Antrean job penuh, coba lagi nanti")
+        if len(self._jobs) >= self.max_retained:
+            self._evict(len(self._jobs) - self.max_retained + 1)
+            if len(self._jobs) >= self.max_retained:
+                raise ServiceUnavailableException("Kapasitas job penuh, coba lagi nanti")
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, self.max_workers))
+
+        job = Job(key)
+        self._jobs[job.id] = job
+        self._inflight[key] = job
+
+        task = asyncio.create_task(self._run(job, fn))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        self._purge()
+
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise NotFoundException(f"Job tidak ditemukan: {job_id}")
+        return job
+
+    async def wait(self, job_id: str, timeout: float) -> Job:
+        """Tunggu job selesai paling lama `timeout` detik, lalu kembalikan job apa pun statusnya."""
+        job = self.get(job_id)
+        if not job.finished and timeout > 0:
+            try:
+                await asyncio.wait_for(job._done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        return job
+
+    async def shutdown(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, job: Job, fn: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            async with self._slots:
+                job.status = JobStatus.running
+                job.result = await fn()
+                job.status = JobStatus.done
+        except asyncio.CancelledError:
+            job.error = asyncio.CancelledError()
+            job.status = JobStatus.failed
+            raise
+        except Exception as e:
+            job.error = e
+            job.status = JobStatus.failed
+        finally:
+            job.finished_at = time.time()
+            self._inflight.pop(job.key, None)
+            job._done.set()
+
+    def _purge(self) -> None:
+        expired_before = time.time() - self.result_ttl
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and job.finished_at < expired_before:
+                del self._jobs[job_id]
+
+    def _evict(self, count: int) -> None:
+        finished = sorted((job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at)
+        for job in finished[:count]:
+            del self._jobs[job.id]
+
+
+color_scale_jobs = JobManager(
+    settings.COLOR_SCALE_JOB_WORKERS,
+    settings.COLOR_SCALE_JOB_TTL,
+    settings.COLOR_SCALE_JOB_MAX_PENDING,
+    settings.COLOR_SCALE_JOB_MAX_RETAINED,
+)
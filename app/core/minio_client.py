@@ -110,6 +110,58 @@ class MinioClient:
                 detail=f"Error retrieving file from MinIO: {str(err)}",
             )
 
+    async def stat_file(self, object_name: str) -> Dict[str, Any]:
+        """
+        Ambil metadata objek di MinIO tanpa mengunduh isinya.
+
+        Args:
+            object_name: Nama objek di MinIO
+
+        Returns:
+            Metadata objek (etag, size, last_modified, ...)
+        """
+        try:
+            stat = await self.client.stat_object(bucket_name=self.bucket_name, object_name=object_name)
+            return {
+                "etag": stat.etag,
+                "size": stat.size,
+                "last_modified": stat.last_modified,
+                "content_type": stat.content_type,
+            }
+
+        except S3Error as err:
+            if err.code == "NoSuchKey":
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error retrieving file from MinIO: {str(err)}",
+            )
+
+    async def read_file(self, object_name: str) -> bytes:
+        """
+        Ambil seluruh isi file dari MinIO sebagai bytes.
+
+        Args:
+            object_name: Nama objek di MinIO
+
+        Returns:
+            Isi file
+        """
+        try:
+            async with aiohttp.ClientSession() as session:
+                response = await self.client.get_object(
+                    bucket_name=self.bucket_name, object_name=object_name, session=session
+                )
+                return await response.read()
+
+        except S3Error as err:
+            if err.code == "NoSuchKey":
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error retrieving file from MinIO: {str(err)}",
+            )
+
     async def delete_file(self, object_name: str) -> bool:
         """
         Hapus file dari MinIO.
@@ -0,0 +1,203 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+import orjson
+from sqlalchemy import and_, false, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement, UnaryExpression
+
+from app.core.config import settings
+from app.core.exceptions import UnprocessableEntity
+
+T = TypeVar("T")
+
+# Kolom sort beserta arahnya (True untuk descending).
+SortKey = Tuple[ColumnElement, bool]
+
+
+class CountMode(str, Enum):
+    """
+    Cara menghitung total item pada endpoint list.
+
+    - exact: `count(*)` terpisah dari seluruh hasil query
+    - window: `count(*) OVER ()` dalam query halaman yang sama
+    - estimate: estimasi jumlah baris dari planner (EXPLAIN), exact jika estimasi kecil
+    - none: tanpa total, `has_more` ditentukan dengan mengambil limit + 1 baris
+    """
+
+    exact = "exact"
+    window = "window"
+    estimate = "estimate"
+    none = "none"
+
+
+class Page(Generic[T]):
+    """Satu halaman hasil query list."""
+
+    def __init__(self, items: List[T], total: Optional[int], has_more: bool, next_cursor: Optional[str] = None):
+        self.items = items
+        self.total = total
+        self.has_more = has_more
+        self.next_cursor = next_cursor
+
+
+def sort_keys(sort: Sequence[Any], tie_breaker: ColumnElement) -> List[SortKey]:
+    """
+    Ubah klausa ORDER BY menjadi daftar key keyset, ditambah kolom `tie_breaker` (id).
+
+    Id UUIDv7 unik dan berurutan sesuai waktu pembuatan, sehingga urutan selalu total
+    walaupun kolom sort memiliki nilai yang sama.
+    """
+    keys = []
+    for clause in sort:
+        if isinstance(clause, UnaryExpression):
+            keys.append((clause.element, clause.modifier is operators.desc_op))
+        else:
+            keys.append((clause, False))
+
+    if not any(column.compare(tie_breaker) for column, _ in keys):
+        keys.append((tie_breaker, False))
+    return keys
+
+
+def order_by(keys: Sequence[SortKey]) -> List[UnaryExpression]:
+    return [column.desc() if descending else column.asc() for column, descending in keys]
+
+
+def encode_cursor(keys: Sequence[SortKey], values: Sequence[Any]) -> str:
+    """
+    Buat token cursor opaque dari nilai key sort item terakhir pada halaman.
+
+    Nilai diambil dari kolom key sort yang ikut dipilih query halaman (lihat
+    `BaseRepository._paginate`), bukan dari atribut item, sehingga kolom model lain dan
+    ekspresi juga didukung. Token ditandatangani HMAC agar tidak bisa diubah klien.
+    """
+    payload = orjson.dumps({"k": _signature(keys), "v": [_json_value(value) for value in values]})
+    return f"{_b64encode(payload)}.{_b64encode(_mac(payload))}"
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> List[Any]:
+    """
+    Baca nilai key sort dari token cursor.
+
+    Raises:
+        UnprocessableEntity: Jika token rusak, diubah, atau dibuat untuk urutan sort yang berbeda
+    """
+    try:
+        encoded_payload, encoded_mac = cursor.split(".")
+        payload = _b64decode(encoded_payload)
+        if not hmac.compare_digest(_b64decode(encoded_mac), _mac(payload)):
+            raise ValueError("signature")
+        data = orjson.loads(payload)
+        values = data["v"]
+        signature = data["k"]
+    except (binascii.Error, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        raise UnprocessableEntity("Cursor tidak valid")
+
+    if signature != _signature(keys) or len(values) != len(keys):
+        raise UnprocessableEntity("Cursor tidak sesuai dengan urutan sort")
+
+    try:
+        return [_column_value(column, value) for (column, _), value in zip(keys, values)]
+    except (TypeError, ValueError, ArithmeticError):
+        raise UnprocessableEntity("Cursor tidak valid")
+
+
+def after_cursor(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    Kondisi WHERE untuk baris setelah posisi cursor.
+
+    Dibentuk sebagai `(a > va) OR (a = va AND b > vb) OR ...` agar arah sort setiap kolom
+    boleh berbeda. NULL mengikuti urutan default PostgreSQL: di akhir untuk ASC dan di
+    awal untuk DESC.
+    """
+    conditions = []
+    for i, (column, descending) in enumerate(keys):
+        equal = [_equal(keys[j][0], values[j]) for j in range(i)]
+        conditions.append(and_(*equal, _after(column, descending, values[i])))
+    return or_(*conditions)
+
+
+class Explain(Executable, ClauseElement):
+    """Statement `EXPLAIN (FORMAT JSON) <query>` dengan bind parameter query tetap terpakai."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def plan_rows(plan: Any) -> int:
+    """Ambil estimasi jumlah baris node teratas dari output `EXPLAIN (FORMAT JSON)`."""
+    if isinstance(plan, (str, bytes)):
+        plan = orjson.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _after(column: ColumnElement, descending: bool, value: Any) -> ColumnElement:
+    if descending:
+        return column.is_not(None) if value is None else column < value
+    return false() if value is None else or_(column > value, column.is_(None))
+
+
+def _equal(column: ColumnElement, value: Any) -> ColumnElement:
+    return column.is_(None) if value is None else column == value
+
+
+def _signature(keys: Sequence[SortKey]) -> str:
+    # Ekspresi SQL setiap key (tanpa nilai bind parameter) beserta arahnya, misal
+    # `categories.name:asc`, sehingga kolom bernama sama dari tabel berbeda tetap dibedakan.
+    text = "|".join(f"{column}:{'desc' if descending else 'asc'}" for column, descending in keys)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _mac(payload: bytes) -> bytes:
+    return hmac.new(settings.SECRET_KEY.encode(), payload, hashlib.sha256).digest()[:16]
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def _column_value(column: ColumnElement, value: Any) -> Any:
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, date):
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    if issubclass(python_type, uuid.UUID):
+        return uuid.UUID(value)
+    return value
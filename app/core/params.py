@@ -3,6 +3,9 @@ from typing import Optional
 
 from fastapi import Query
 
+from app.core.pagination import CountMode
+from app.core.search import SearchMode
+
 
 class CommonParams:
     def __init__(
@@ -10,9 +13,21 @@ class CommonParams:
         filter: Optional[str] = Query(default=None),
         sort: Optional[str] = Query(default=None),
         search: str = Query(default=""),
+        search_mode: SearchMode = Query(
+            default=SearchMode.fulltext,
+            description="Cara pencarian: fulltext atau fuzzy (nama mirip, toleran salah ketik)",
+        ),
         group_by: Optional[str] = Query(default=None),
         limit: int = Query(default=100, ge=1),
         offset: int = Query(default=0, ge=0),
+        cursor: Optional[str] = Query(
+            default=None,
+            description="Paginasi cursor: kosongkan untuk halaman pertama, lalu isi dengan next_cursor",
+        ),
+        count: CountMode = Query(
+            default=CountMode.exact,
+            description="Cara menghitung total: exact, window, estimate (perkiraan) atau none (tanpa total)",
+        ),
     ):
         if filter:
             try:
@@ -31,6 +46,9 @@ class CommonParams:
             self.sort = []
 
         self.search = search
+        self.search_mode = search_mode
         self.group_by = group_by
         self.limit = limit
         self.offset = offset
+        self.cursor = cursor
+        self.count = count
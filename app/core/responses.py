@@ -1,4 +1,4 @@
-from typing import Any, Generic, List, TypeVar
+from typing import Any, Generic, List, Optional, TypeVar
 
 import orjson
 from fastapi.responses import JSONResponse
@@ -23,7 +23,8 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None
@@ -0,0 +1,102 @@
+from enum import Enum
+from typing import Dict
+
+from sqlalchemy import DDL, Computed, Index, func, literal
+from sqlalchemy.sql.elements import ColumnElement
+
+# Text search configuration yang dipakai kolom `search_vector`. Dibuat dari konfigurasi
+# `indonesian` (stemmer Snowball, PostgreSQL >= 12) jika tersedia, selain itu `simple`.
+SEARCH_CONFIG = "satu_peta"
+
+SEARCH_CONFIG_DDL = DDL(
+    f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{SEARCH_CONFIG}') THEN
+        IF EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'indonesian') THEN
+            CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = pg_catalog.indonesian);
+        ELSE
+            CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = pg_catalog.simple);
+        END IF;
+    END IF;
+END
+$$;
+"""
+)
+
+TRIGRAM_EXTENSION_DDL = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+class SearchMode(str, Enum):
+    """
+    Cara mencocokkan parameter `search`.
+
+    - fulltext: full-text search pada `search_vector` (ILIKE untuk model tanpa kolom tersebut)
+    - fuzzy: kemiripan trigram (pg_trgm) pada kolom `name`, toleran salah ketik
+    """
+
+    fulltext = "fulltext"
+    fuzzy = "fuzzy"
+
+
+def search_vector(weights: Dict[str, str]) -> Computed:
+    """
+    Ekspresi generated column `tsvector` dari kolom teks.
+
+    Args:
+        weights: Nama kolom dan bobotnya (`A` paling relevan sampai `D`)
+
+    Returns:
+        Computed: Generated column tersimpan (STORED) untuk dipakai di `Column`
+    """
+    parts = [
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weights.items()
+    ]
+    return Computed(" || ".join(parts), persisted=True)
+
+
+def search_query(search: str) -> ColumnElement:
+    """`tsquery` dari input pengguna; sintaks web (`"frasa"`, `or`, `-kata`) didukung tanpa error sintaks."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, search)
+
+
+def search_match(vector: ColumnElement, search: str) -> ColumnElement:
+    """Kondisi `vector @@ tsquery` yang dilayani index GIN pada `vector`."""
+    return vector.op("@@")(search_query(search))
+
+
+def search_rank(vector: ColumnElement, search: str) -> ColumnElement:
+    """Skor relevansi `ts_rank` untuk ORDER BY."""
+    return func.ts_rank(vector, search_query(search))
+
+
+def trigram_index(name: str, column: str = "name") -> Index:
+    """Index GIN `gin_trgm_ops` yang melayani operator kemiripan pg_trgm pada `column`."""
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
+def fuzzy_match(column: ColumnElement, search: str) -> ColumnElement:
+    """
+    Kondisi `search <% column`.
+
+    Memakai word similarity sehingga kata yang salah ketik tetap cocok dengan nama yang
+    lebih panjang ("Banyuwangie" dengan "Peta Kabupaten Banyuwangi"). Ambang batasnya
+    `pg_trgm.word_similarity_threshold`, lihat `fuzzy_server_settings`.
+    """
+    return literal(search).op("<%")(column)
+
+
+def fuzzy_rank(column: ColumnElement, search: str) -> ColumnElement:
+    """Skor `word_similarity` untuk ORDER BY."""
+    return func.word_similarity(search, column)
+
+
+def fuzzy_server_settings(threshold: float) -> Dict[str, str]:
+    """
+    Parameter server untuk ambang batas `fuzzy_match`, dipasang sekali saat koneksi dibuka.
+
+    Dipakai sebagai `server_settings` asyncpg sehingga pencarian fuzzy tidak perlu statement
+    `set_config` tambahan di setiap request.
+    """
+    return {"pg_trgm.word_similarity_threshold": str(threshold)}
@@ -0,0 +1,228 @@
+import asyncio
+import hashlib
+import posixpath
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, Optional
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException, ForbiddenException
+from app.core.http_client import http_client
+from app.core.minio_client import MinioClient
+from app.utils.cache import LRUCache
+from app.utils.source_formats import SourceFormat, detect_format
+
+MINIO_SCHEME = "minio://"
+
+
+class SourceEntry:
+    """Body sumber data (terkompresi zlib) beserta validator HTTP-nya."""
+
+    def __init__(
+        self,
+        url: str,
+        body: bytes,
+        size: int,
+        digest: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.url = url
+        self.body = body
+        self.size = size
+        self.digest = digest
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = time.monotonic()
+        self._format: Optional[SourceFormat] = None
+
+    @property
+    def format(self) -> SourceFormat:
+        """Format sumber data, dideteksi dari magic bytes di awal isi."""
+        if self._format is None:
+            self._format = detect_format(next(self.iter_chunks(64), b""))
+        return self._format
+
+    def read(self) -> bytes:
+        """Kembalikan body utuh yang sudah didekompresi."""
+        return zlib.decompress(self.body)
+
+    def iter_chunks(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Dekompresi body secara bertahap, setiap chunk paling besar `chunk_size` bytes."""
+        decompressor = zlib.decompressobj()
+        body = memoryview(self.body)
+        pos = 0
+
+        while True:
+            if decompressor.unconsumed_tail:
+                data = decompressor.unconsumed_tail
+            elif pos < len(body):
+                data = body[pos : pos + chunk_size]
+                pos += chunk_size
+            else:
+                break
+
+            chunk = decompressor.decompress(data, chunk_size)
+            if chunk:
+                yield chunk
+
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+    def validator_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class SourceCache:
+    """
+    Cache sumber data remote berdasarkan URL.
+
+    Selain URL HTTP(S), sumber data bisa berupa objek di bucket MinIO dengan skema
+    `minio://<nama objek>`; objek hanya diunduh ulang jika etag-nya berubah. Karena objek
+    dibaca dengan kredensial service, hanya objek di bawah `minio_prefixes` yang boleh dipakai.
+
+    Entry yang umurnya masih di bawah `ttl` detik langsung dipakai. Setelah itu entry
+    divalidasi ulang dengan If-None-Match/If-Modified-Since sehingga body hanya diunduh
+    ulang bila upstream berubah. Total ukuran body terkompresi dibatasi `max_bytes` (LRU).
+    """
+
+    def __init__(self, ttl: int, max_bytes: int, compress_level: int = 6, minio_prefixes: Iterable[str] = ()):
+        self.ttl = ttl
+        self.compress_level = compress_level
+        self.minio_prefixes = tuple(prefix.strip("/") + "/" for prefix in minio_prefixes if prefix.strip("/"))
+        self._entries: LRUCache[str, SourceEntry] = LRUCache(
+            maxsize=None, max_bytes=max_bytes, sizeof=lambda entry: len(entry.body)
+        )
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def fetch(self, url: str) -> SourceEntry:
+        """
+        Ambil sumber data dari cache atau dari upstream.
+
+        Request bersamaan untuk URL yang sama digabung menjadi satu unduhan.
+
+        Args:
+            url: URL sumber data
+
+        Raises:
+            ForbiddenException: Jika objek MinIO berada di luar prefix yang diizinkan
+
+        Returns:
+            SourceEntry: Entry sumber data yang masih valid
+        """
+        if url.startswith(MINIO_SCHEME):
+            self._minio_object_name(url)
+
+        entry = self._entries.get(url)
+        if entry is not None and time.monotonic() - entry.fetched_at < self.ttl:
+            return entry
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, entry))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch(self, url: str, entry: Optional[SourceEntry]) -> SourceEntry:
+        if url.startswith(MINIO_SCHEME):
+            return await self._fetch_minio(url, entry)
+
+        headers = entry.validator_headers() if entry is not None else {}
+
+        try:
+            async with http_client.limit(url) as client:
+                async with client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+                        entry.fetched_at = time.monotonic()
+                        self._entries.set(url, entry)
+                        return entry
+
+                    response.raise_for_status()
+                    entry = await self._read_response(url, response)
+        except httpx.HTTPError as e:
+            raise BadRequestException(f"Gagal mengambil sumber data {url}: {str(e)}")
+
+        self._entries.set(url, entry)
+        return entry
+
+    async def _fetch_minio(self, url: str, entry: Optional[SourceEntry]) -> SourceEntry:
+        object_name = self._minio_object_name(url)
+        client = MinioClient()
+
+        try:
+            stat = await client.stat_file(object_name)
+            if entry is not None and entry.etag and entry.etag == stat["etag"]:
+                entry.fetched_at = time.monotonic()
+                self._entries.set(url, entry)
+                return entry
+
+            content = await client.read_file(object_name)
+        except HTTPException as e:
+            raise BadRequestException(f"Gagal mengambil sumber data {url}: {e.detail}")
+
+        writer = _EntryWriter(self.compress_level)
+        writer.update(content)
+        entry = writer.finish(url, etag=stat["etag"])
+        self._entries.set(url, entry)
+        return entry
+
+    def _minio_object_name(self, url: str) -> str:
+        object_name = url.removeprefix(MINIO_SCHEME).lstrip("/")
+        normalized = posixpath.normpath(object_name)
+        if normalized != object_name or not normalized.startswith(self.minio_prefixes):
+            raise ForbiddenException(f"Sumber data MinIO tidak diizinkan: {url}")
+        return object_name
+
+    def invalidate(self, url: str) -> None:
+        self._entries.pop(url)
+
+    async def _read_response(self, url: str, response: httpx.Response) -> SourceEntry:
+        writer = _EntryWriter(self.compress_level)
+        async for chunk in response.aiter_bytes():
+            writer.update(chunk)
+
+        return writer.finish(
+            url, etag=response.headers.get("etag"), last_modified=response.headers.get("last-modified")
+        )
+
+
+class _EntryWriter:
+    """Kompres body secara bertahap sambil menghitung digest dan ukurannya."""
+
+    def __init__(self, compress_level: int):
+        self._compressor = zlib.compressobj(compress_level)
+        self._digest = hashlib.sha256()
+        self._parts = []
+        self._size = 0
+
+    def update(self, chunk: bytes) -> None:
+        self._digest.update(chunk)
+        self._size += len(chunk)
+        self._parts.append(self._compressor.compress(chunk))
+
+    def finish(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> SourceEntry:
+        self._parts.append(self._compressor.flush())
+        return SourceEntry(
+            url=url,
+            body=b"".join(self._parts),
+            size=self._size,
+            digest=self._digest.hexdigest(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+
+source_cache = SourceCache(
+    settings.SOURCE_CACHE_TTL, settings.SOURCE_CACHE_MAX_BYTES, minio_prefixes=settings.SOURCE_MINIO_PREFIXES
+)
@@ -10,15 +10,27 @@ from fastapi_async_sqlalchemy import SQLAlchemyMiddleware
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1 import router as api_router
+from app.core.boundary_pyramid import boundary_pyramids
+from app.core.boundary_registry import boundary_registry
 from app.core.config import settings
 from app.core.exceptions import APIException, prepare_error_response
+from app.core.geoprocessing import geo_pool
+from app.core.http_client import http_client
+from app.core.job_manager import color_scale_jobs
+from app.core.search import fuzzy_server_settings
 from app.utils.system import optimize_system
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await optimize_system()
+    boundary_registry.load_all()
+    boundary_pyramids.build_all()
+    geo_pool.start()
     yield
+    await color_scale_jobs.shutdown()
+    geo_pool.shutdown()
+    await http_client.aclose()
 
 
 app = FastAPI(
@@ -39,7 +51,10 @@ app.add_middleware(
 app.add_middleware(
     SQLAlchemyMiddleware,
     db_url=settings.DATABASE_URL,
-    engine_args={"echo": settings.DEBUG},
+    engine_args={
+        "echo": settings.DEBUG,
+        "connect_args": {"server_settings": fuzzy_server_settings(settings.SEARCH_FUZZY_THRESHOLD)},
+    },
 )
 app.add_middleware(
     BrotliMiddleware,
@@ -1,3 +1,7 @@
+from sqlalchemy import event
+
+from app.core.search import SEARCH_CONFIG_DDL, TRIGRAM_EXTENSION_DDL
+
 from .base import Base
 from .category_model import CategoryModel
 from .classification_model import ClassificationModel
@@ -15,6 +19,11 @@ from .regional_model import RegionalModel
 from .role_model import RoleModel
 from .user_model import UserModel
 
+# Generated column `search_vector` dan index trigram membutuhkan text search configuration
+# dan extension pg_trgm saat `create_all`.
+event.listen(Base.metadata, "before_create", SEARCH_CONFIG_DDL)
+event.listen(Base.metadata, "before_create", TRIGRAM_EXTENSION_DDL)
+
 __all__ = [
     "Base",
     "OrganizationModel",
@@ -1,11 +1,14 @@
 import uuid6
 from sqlalchemy import UUID, Boolean, Column, Integer, String, Text, text
 
+from app.core.search import trigram_index
+
 from . import Base
 
 
 class CategoryModel(Base):
     __tablename__ = "categories"
+    __table_args__ = (trigram_index("ix_categories_name_trgm"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid6.uuid7)
     name = Column(String)
@@ -3,10 +3,12 @@ from enum import Enum
 
 import uuid6
 from pytz import timezone
-from sqlalchemy import UUID, Boolean, Column, DateTime, ForeignKey, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import UUID, Boolean, Column, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.config import settings
+from app.core.search import search_vector, trigram_index
 
 from . import Base
 
@@ -19,6 +21,10 @@ class MapsetStatus(str, Enum):
 
 class MapsetModel(Base):
     __tablename__ = "mapsets"
+    __table_args__ = (
+        Index("ix_mapsets_search_vector", "search_vector", postgresql_using="gin"),
+        trigram_index("ix_mapsets_name_trgm"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid6.uuid7)
     name = Column(String(255), nullable=False)
@@ -48,6 +54,7 @@ class MapsetModel(Base):
     )
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     updated_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    search_vector = deferred(Column(TSVECTOR, search_vector({"name": "A", "description": "B"})))
 
     projection_system = relationship("MapProjectionSystemModel", uselist=False, lazy="selectin")
     classification = relationship("ClassificationModel", uselist=False, lazy="selectin")
@@ -2,15 +2,19 @@ from datetime import datetime
 
 import uuid6
 from pytz import timezone
-from sqlalchemy import UUID, Boolean, Column, DateTime, String, Text, func
+from sqlalchemy import UUID, Boolean, Column, DateTime, Index, String, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from app.core.config import settings
+from app.core.search import search_vector
 
 from . import Base
 
 
 class NewsModel(Base):
     __tablename__ = "news"
+    __table_args__ = (Index("ix_news_search_vector", "search_vector", postgresql_using="gin"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid6.uuid7)
     name = Column(String)
@@ -27,3 +31,4 @@ class NewsModel(Base):
     )
     is_active = Column(Boolean, default=True)
     is_deleted = Column(Boolean, default=False)
+    search_vector = deferred(Column(TSVECTOR, search_vector({"name": "A", "description": "B"})))
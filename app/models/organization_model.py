@@ -2,16 +2,22 @@ from datetime import datetime
 
 import uuid6
 from pytz import timezone
-from sqlalchemy import UUID, Boolean, Column, DateTime, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import UUID, Boolean, Column, DateTime, Index, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.config import settings
+from app.core.search import search_vector, trigram_index
 
 from . import Base
 
 
 class OrganizationModel(Base):
     __tablename__ = "organizations"
+    __table_args__ = (
+        Index("ix_organizations_search_vector", "search_vector", postgresql_using="gin"),
+        trigram_index("ix_organizations_name_trgm"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid6.uuid7)
     name = Column(String(100), nullable=False)
@@ -30,6 +36,7 @@ class OrganizationModel(Base):
         default=datetime.now(timezone(settings.TIMEZONE)),
         onupdate=datetime.now(timezone(settings.TIMEZONE)),
     )
+    search_vector = deferred(Column(TSVECTOR, search_vector({"name": "A", "description": "B"})))
 
     users = relationship("UserModel", lazy="selectin")
     mapsets = relationship("MapsetModel", lazy="selectin")
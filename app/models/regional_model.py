@@ -5,12 +5,14 @@ from pytz import timezone
 from sqlalchemy import UUID, Boolean, Column, DateTime, String, Text
 
 from app.core.config import settings
+from app.core.search import trigram_index
 
 from . import Base
 
 
 class RegionalModel(Base):
     __tablename__ = "regionals"
+    __table_args__ = (trigram_index("ix_regionals_name_trgm"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid6.uuid7)
     code = Column(String(10), nullable=False)
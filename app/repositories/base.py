@@ -3,14 +3,41 @@ from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
 from fastapi_async_sqlalchemy import db
 from sqlalchemy import String, cast
 from sqlalchemy import delete as sqlalchemy_delete
-from sqlalchemy import func, or_, select
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy import update as sqlalchemy_update
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement
 from uuid6 import UUID
 
+from app.core.config import settings
 from app.core.database import Base
+from app.core.exceptions import UnprocessableEntity
+from app.core.pagination import (
+    CountMode,
+    Explain,
+    Page,
+    SortKey,
+    after_cursor,
+    decode_cursor,
+    encode_cursor,
+    order_by,
+    plan_rows,
+    sort_keys,
+)
+from app.core.search import (
+    SearchMode,
+    fuzzy_match,
+    fuzzy_rank,
+    search_match,
+    search_rank,
+)
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+_WINDOW_TOTAL = "_total_count"
+_WINDOW_SORT = "_sort_key_"
+_CURSOR_KEY = "_cursor_key_"
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository for database operations using SQLAlchemy."""
@@ -28,8 +55,17 @@ class BaseRepository(Generic[ModelType]):
         return result.scalar_one_or_none()
 
     async def find_all(
-        self, filters: list, sort: list = [], search: str = "", group_by: str = None, limit: int = 100, offset: int = 0
-    ) -> Tuple[List[ModelType], int]:
+        self,
+        filters: list,
+        sort: list = [],
+        search: str = "",
+        group_by: str = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.exact,
+        search_mode: SearchMode = SearchMode.fulltext,
+    ) -> Page[ModelType]:
         """Find all records with pagination."""
         query = select(self.model)
         if hasattr(self.model, "is_deleted"):
@@ -38,25 +74,202 @@ class BaseRepository(Generic[ModelType]):
         query = query.filter(*filters)
 
         if search:
-            query = query.filter(
-                or_(
-                    cast(getattr(self.model, col), String).ilike(f"%{search}%")
-                    for col in self.model.__table__.columns.keys()
-                )
-            )
+            query, sort = self._search(query, sort, search, cursor, search_mode)
 
         if group_by:
             query = query.group_by(getattr(self.model, group_by))
 
-        total = await db.session.scalar(select(func.count()).select_from(query.subquery()))
+        return await self._paginate(query, sort, limit, offset, cursor, count=count)
 
-        query = query.order_by(*sort)
-        query = query.limit(limit).offset(offset)
+    def _search(
+        self,
+        query: Select,
+        sort: list,
+        search: str,
+        cursor: Optional[str] = None,
+        search_mode: SearchMode = SearchMode.fulltext,
+    ) -> Tuple[Select, list]:
+        """
+        Terapkan parameter `search` pada query list.
 
-        result = await db.session.execute(query)
-        result = result.scalars().all()
+        Hasil diurutkan berdasarkan relevansi setelah sort dari request. Urutan relevansi
+        hanya untuk paginasi offset karena skor tidak bisa disimpan di cursor.
+
+        Returns:
+            Tuple[Select, list]: Query dan klausa sort
+        """
+        condition, rank = self._search_clauses(search, search_mode)
+        query = query.filter(condition)
+        if rank is not None and cursor is None:
+            sort = [*sort, rank.desc()]
+        return query, sort
+
+    def _search_clauses(
+        self, search: str, search_mode: SearchMode = SearchMode.fulltext
+    ) -> Tuple[ColumnElement, Optional[ColumnElement]]:
+        """
+        Kondisi WHERE dan skor relevansi untuk parameter `search`.
+
+        - fuzzy: kemiripan trigram pada kolom `name` (index `gin_trgm_ops`), ambang batas
+          `settings.SEARCH_FUZZY_THRESHOLD` diatur per koneksi (lihat `fuzzy_server_settings`)
+        - fulltext: `search_vector @@ tsquery` (index GIN) dengan skor `ts_rank`; model
+          tanpa `search_vector` memakai ILIKE pada semua kolom tanpa skor
+
+        Raises:
+            UnprocessableEntity: Jika mode fuzzy dipakai pada model tanpa kolom `name`
+
+        Returns:
+            Tuple[ColumnElement, Optional[ColumnElement]]: Kondisi dan skor (None jika tidak ada)
+        """
+        if search_mode == SearchMode.fuzzy:
+            if not hasattr(self.model, "name"):
+                raise UnprocessableEntity(f"Pencarian fuzzy tidak tersedia untuk {self.model.__tablename__}")
+
+            return fuzzy_match(self.model.name, search), fuzzy_rank(self.model.name, search)
+
+        if hasattr(self.model, "search_vector"):
+            return search_match(self.model.search_vector, search), search_rank(self.model.search_vector, search)
+
+        condition = or_(
+            cast(getattr(self.model, col), String).ilike(f"%{search}%") for col in self.model.__table__.columns.keys()
+        )
+        return condition, None
+
+    async def _paginate(
+        self,
+        query: Select,
+        sort: list,
+        limit: int,
+        offset: int,
+        cursor: Optional[str] = None,
+        count_query: Optional[Select] = None,
+        mappings: bool = False,
+        count: CountMode = CountMode.exact,
+    ) -> Page:
+        """
+        Jalankan query list dengan paginasi offset atau keyset (cursor).
+
+        Urutan selalu ditutup dengan `id` sebagai tie-breaker. Jika `cursor` bukan None,
+        `offset` diabaikan dan halaman diambil dengan kondisi WHERE setelah posisi cursor,
+        sehingga biaya halaman ke-N sama dengan halaman pertama. Cursor kosong berarti
+        halaman pertama mode cursor; pada mode cursor setiap key sort ikut dipilih sebagai
+        kolom tersembunyi dan `next_cursor` dibentuk dari kolom tersebut. `has_more` selalu
+        ditentukan dengan mengambil limit + 1 baris sehingga tidak bergantung pada total.
+
+        Args:
+            query: Query yang sudah difilter
+            sort: Klausa ORDER BY
+            limit: Jumlah item per halaman
+            offset: Jumlah item yang dilewati (mode offset)
+            cursor: Token `next_cursor` dari halaman sebelumnya
+            count_query: Query total, default `count(*)` dari `query`
+            mappings: Kembalikan baris sebagai RowMapping, bukan instance model
+            count: Cara menghitung total, lihat `CountMode`
+
+        Returns:
+            Page: Item halaman, total (None untuk `CountMode.none`), `has_more` dan `next_cursor`
+        """
+        if count_query is None:
+            count_query = select(func.count()).select_from(query.subquery())
+
+        total = None
+        if count == CountMode.exact:
+            total = await db.session.scalar(count_query)
+        elif count == CountMode.estimate:
+            total = await self._estimate_count(query, count_query)
+
+        keys = sort_keys(sort, self.model.id)
+        cursor_keys = keys
+        if count == CountMode.window:
+            page_query, keys = self._windowed(query, keys, mappings)
+        else:
+            page_query = query
+
+        page_query = page_query.order_by(*order_by(keys))
+        if cursor:
+            page_query = page_query.where(after_cursor(keys, decode_cursor(cursor_keys, cursor)))
+        elif cursor is None:
+            page_query = page_query.offset(offset)
+
+        if cursor is not None:
+            page_query = page_query.add_columns(
+                *(column.label(f"{_CURSOR_KEY}{i}") for i, (column, _) in enumerate(keys))
+            )
+
+        result = await db.session.execute(page_query.limit(limit + 1))
+        rows = result.mappings().all() if mappings else result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        # Kolom tersembunyi (total window, key cursor) dibaca berdasarkan nama.
+        named = rows if mappings else [row._mapping for row in rows]
+
+        if count == CountMode.window:
+            if rows:
+                total = named[0][_WINDOW_TOTAL]
+            elif not cursor and offset == 0:
+                total = 0
+            else:
+                # Halaman kosong tidak membawa nilai window, hitung terpisah.
+                total = await db.session.scalar(count_query)
+
+        if mappings:
+            hidden = (_WINDOW_TOTAL, _CURSOR_KEY)
+            items = [{key: value for key, value in row.items() if not key.startswith(hidden)} for row in rows]
+        else:
+            items = [row[0] for row in rows]
+
+        next_cursor = None
+        if cursor is not None and has_more:
+            next_cursor = encode_cursor(cursor_keys, [named[-1][f"{_CURSOR_KEY}{i}"] for i in range(len(keys))])
+
+        return Page(items, total, has_more, next_cursor)
+
+    def _windowed(self, query: Select, keys: List[SortKey], mappings: bool) -> Tuple[Select, List[SortKey]]:
+        """
+        Bungkus query dengan kolom `count(*) OVER ()`.
+
+        Window dihitung di subquery tersendiri, setelah DISTINCT/GROUP BY query asal dan
+        sebelum kondisi cursor, sehingga nilainya selalu total seluruh hasil. Key sort
+        dipetakan ke kolom subquery yang berasal dari kolom yang sama (bukan sekadar nama
+        yang sama); key lain, misal ekspresi `ts_rank` atau kolom model join yang tidak
+        dipilih, ikut dipilih di subquery sebagai kolom tersembunyi.
+        """
+        probe = query.subquery()
+        expressions = {
+            i: column for i, (column, _) in enumerate(keys) if probe.corresponding_column(column) is None
+        }
+        if expressions:
+            query = query.add_columns(*(column.label(f"{_WINDOW_SORT}{i}") for i, column in expressions.items()))
+
+        inner = query.subquery()
+        windowed = select(inner, func.count().over().label(_WINDOW_TOTAL)).subquery()
+        total_column = windowed.c[_WINDOW_TOTAL]
+
+        if mappings:
+            visible = (column for column in windowed.c if not column.key.startswith((_WINDOW_TOTAL, _WINDOW_SORT)))
+            page_query = select(*visible, total_column)
+        else:
+            page_query = select(aliased(self.model, windowed), total_column)
+
+        mapped = {i: windowed.c[f"{_WINDOW_SORT}{i}"] for i in expressions}
+        keys = [
+            (mapped[i] if i in mapped else windowed.corresponding_column(column), descending)
+            for i, (column, descending) in enumerate(keys)
+        ]
+        return page_query, keys
+
+    async def _estimate_count(self, query: Select, count_query: Select) -> int:
+        """
+        Estimasi jumlah baris dari planner PostgreSQL tanpa mengeksekusi query.
 
-        return result, total
+        Estimasi di bawah `settings.COUNT_ESTIMATE_THRESHOLD` dihitung exact karena
+        `count(*)` pada hasil sekecil itu murah dan estimasi planner paling meleset
+        untuk query yang sangat selektif.
+        """
+        estimate = plan_rows(await db.session.scalar(Explain(query)))
+        if estimate < settings.COUNT_ESTIMATE_THRESHOLD:
+            return await db.session.scalar(count_query)
+        return estimate
 
     async def create(self, data: Dict[str, Any]) -> ModelType:
         """Create a new record."""
@@ -1,11 +1,14 @@
 from ast import Dict
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, override
 from uuid import UUID
 
 from fastapi_async_sqlalchemy import db
-from sqlalchemy import String, and_, cast, func, or_, select, update
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.core.pagination import CountMode, Page
+from app.core.search import SearchMode, search_match, search_rank
 from app.models import (
     ClassificationModel,
     MapAccessModel,
@@ -30,22 +33,30 @@ class MapsetRepository(BaseRepository[MapsetModel]):
         group_by: str = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> Tuple[List[MapsetModel], int]:
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.exact,
+        search_mode: SearchMode = SearchMode.fulltext,
+    ) -> Page[MapsetModel]:
 
+        # Visibilitas dicek lewat subquery (bukan join ke map_access + DISTINCT) agar tiap mapset
+        # muncul sekali dan ORDER BY boleh memakai ekspresi seperti skor relevansi pencarian.
         if user is None:
             query = (
                 select(self.model)
-                .distinct()
                 .join(ClassificationModel, self.model.classification_id == ClassificationModel.id)
                 .filter(ClassificationModel.is_open == True)
             )
         elif user.role in {"administrator", "data_validator"}:
             query = select(self.model)
         else:
+            granted_mapset_ids = select(MapAccessModel.mapset_id).where(
+                or_(
+                    MapAccessModel.organization_id == user.organization.id,
+                    MapAccessModel.user_id == user.id,
+                )
+            )
             query = (
                 select(self.model)
-                .distinct()
-                .join(MapAccessModel, self.model.id == MapAccessModel.mapset_id, isouter=True)
                 .join(ClassificationModel, self.model.classification_id == ClassificationModel.id)
                 .filter(
                     or_(
@@ -53,15 +64,10 @@ class MapsetRepository(BaseRepository[MapsetModel]):
                         ClassificationModel.is_open.is_(True),
                         and_(
                             ClassificationModel.is_secret.is_(True),
-                            self.model.producer_id == user.organization.id,
-                        ),
-                        and_(
-                            ClassificationModel.is_secret.is_(True),
-                            MapAccessModel.organization_id == user.organization.id,
-                        ),
-                        and_(
-                            ClassificationModel.is_secret.is_(True),
-                            MapAccessModel.user_id == user.id,
+                            or_(
+                                self.model.producer_id == user.organization.id,
+                                self.model.id.in_(granted_mapset_ids),
+                            ),
                         ),
                     )
                 )
@@ -70,28 +76,12 @@ class MapsetRepository(BaseRepository[MapsetModel]):
         query = query.filter(*filters)
 
         if search:
-            query = query.filter(
-                or_(
-                    or_(
-                        cast(getattr(self.model, col), String).ilike(f"%{search}%")
-                        for col in self.model.__table__.columns.keys()
-                    ),
-                    OrganizationModel.name.ilike(f"%{search}%"),
-                )
-            )
+            query, sort = self._search(query, sort, search, cursor, search_mode)
 
         if group_by:
             query = query.group_by(getattr(self.model, group_by))
 
-        total = await db.session.scalar(select(func.count()).select_from(query.subquery()))
-
-        query = query.order_by(*sort)
-        query = query.limit(limit).offset(offset)
-
-        result = await db.session.execute(query)
-        result = result.scalars().all()
-
-        return result, total
+        return await self._paginate(query, sort, limit, offset, cursor, count=count)
 
     async def find_all_group_by_organization(
         self,
@@ -149,13 +139,7 @@ class MapsetRepository(BaseRepository[MapsetModel]):
             filtered_mapset_query = filtered_mapset_query.filter(*mapset_filters)
 
         if search:
-            search_filters = []
-            for col in self.model.__table__.columns.keys():
-                if hasattr(self.model, col):
-                    search_filters.append(cast(getattr(self.model, col), String).ilike(f"%{search}%"))
-
-            if search_filters:
-                filtered_mapset_query = filtered_mapset_query.filter(or_(*search_filters))
+            filtered_mapset_query = filtered_mapset_query.filter(self._search_condition(search))
 
         producer_ids_subquery = select(self.model.producer_id).select_from(filtered_mapset_query.subquery()).distinct()
 
@@ -165,13 +149,7 @@ class MapsetRepository(BaseRepository[MapsetModel]):
             org_query = org_query.filter(*organization_filters)
 
         if search:
-            org_search_filters = []
-            for col in OrganizationModel.__table__.columns.keys():
-                if hasattr(OrganizationModel, col):
-                    org_search_filters.append(cast(getattr(OrganizationModel, col), String).ilike(f"%{search}%"))
-
-            if org_search_filters:
-                org_query = org_query.filter(or_(*org_search_filters))
+            org_query = org_query.filter(search_match(OrganizationModel.search_vector, search))
 
         count_query = select(func.count()).select_from(
             select(OrganizationModel.id).select_from(org_query.subquery()).distinct()
@@ -214,6 +192,19 @@ class MapsetRepository(BaseRepository[MapsetModel]):
 
         return result_data, total
 
+    def _search_condition(self, search: str):
+        """Mapset cocok jika nama/deskripsinya atau nama/deskripsi organisasi produsennya cocok."""
+        producer_ids = select(OrganizationModel.id).where(search_match(OrganizationModel.search_vector, search))
+        return or_(search_match(self.model.search_vector, search), self.model.producer_id.in_(producer_ids))
+
+    @override
+    def _search_clauses(
+        self, search: str, search_mode: SearchMode = SearchMode.fulltext
+    ) -> Tuple[ColumnElement, Optional[ColumnElement]]:
+        if search_mode == SearchMode.fuzzy:
+            return super()._search_clauses(search, search_mode)
+        return self._search_condition(search), search_rank(self.model.search_vector, search)
+
     async def bulk_update_activation(self, mapset_ids: List[UUID], is_active: bool) -> None:
         for mapset_id in mapset_ids:
             await db.session.execute(update(self.model).where(self.model.id == mapset_id).values(is_active=is_active))
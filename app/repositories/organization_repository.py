@@ -1,20 +1,11 @@
-from typing import List, Optional, Tuple, override
+from typing import Optional, override
 from uuid import UUID
 
 from fastapi_async_sqlalchemy import db
-from sqlalchemy import (
-    Integer,
-    Numeric,
-    String,
-    Unicode,
-    UnicodeText,
-    and_,
-    cast,
-    func,
-    or_,
-    select,
-)
+from sqlalchemy import and_, func, or_, select
 
+from app.core.pagination import CountMode, Page
+from app.core.search import SearchMode
 from app.models.classification_model import ClassificationModel
 from app.models.map_access_model import MapAccessModel
 from app.models.mapset_model import MapsetModel
@@ -55,7 +46,10 @@ class OrganizationRepository(BaseRepository[OrganizationModel]):
         group_by: str = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> Tuple[List[OrganizationModel], int]:
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.exact,
+        search_mode: SearchMode = SearchMode.fulltext,
+    ) -> Page:
         """Find all records with pagination."""
         if sort is None:
             sort = []
@@ -129,20 +123,10 @@ class OrganizationRepository(BaseRepository[OrganizationModel]):
             query = query.filter(*filters)
 
         if search:
-            search_filters = []
-            for col in self.model.__table__.columns.keys():
-                column = getattr(self.model, col)
-                if isinstance(column.type, (String, Unicode, UnicodeText)):
-                    search_filters.append(column.ilike(f"%{search}%"))
-                elif isinstance(column.type, (Integer, Numeric)):
-                    try:
-                        num_val = float(search)
-                        search_filters.append(cast(column, String) == str(num_val))
-                    except (ValueError, TypeError):
-                        pass
-
-            if search_filters:
-                query = query.filter(or_(*search_filters))
+            search_condition, rank = self._search_clauses(search, search_mode)
+            query = query.filter(search_condition)
+            if cursor is None:
+                sort = [*sort, rank.desc()]
 
         group_columns = [self.model.id]
         if group_by and hasattr(self.model, group_by):
@@ -152,18 +136,14 @@ class OrganizationRepository(BaseRepository[OrganizationModel]):
 
         query = query.group_by(*group_columns)
 
-        count_query = select(func.count()).select_from(
+        count_query = (
             select(self.model.id)
             .outerjoin(self.mapset_model, self.model.id == self.mapset_model.producer_id)
             .outerjoin(ClassificationModel, self.mapset_model.classification_id == ClassificationModel.id)
         )
 
         if user is not None and user.role not in {"administrator", "data_validator"}:
-            count_query = count_query.select_from(
-                count_query.subquery().select_from.outerjoin(
-                    MapAccessModel, self.mapset_model.id == MapAccessModel.mapset_id
-                )
-            )
+            count_query = count_query.outerjoin(MapAccessModel, self.mapset_model.id == MapAccessModel.mapset_id)
 
         if user is None or user.role not in {"administrator", "data_validator"}:
             count_query = count_query.where(mapset_filter)
@@ -174,22 +154,15 @@ class OrganizationRepository(BaseRepository[OrganizationModel]):
         if filters:
             count_query = count_query.where(*filters)
 
-        if search and search_filters:
-            count_query = count_query.where(or_(*search_filters))
+        if search:
+            count_query = count_query.where(search_condition)
 
         count_query = count_query.group_by(self.model.id)
 
-        total = await db.session.scalar(select(func.count()).select_from(count_query.subquery()))
-
-        if sort:
-            query = query.order_by(*sort)
-
-        query = query.limit(limit).offset(offset)
-
-        result = await db.session.execute(query)
-        result = result.mappings().all()
-
-        return result, total
+        count_query = select(func.count()).select_from(count_query.subquery())
+        return await self._paginate(
+            query, sort, limit, offset, cursor, count_query=count_query, mappings=True, count=count
+        )
 
     @override
     async def find_by_id(self, user: UserSchema | None, id: UUID) -> Optional[OrganizationModel]:
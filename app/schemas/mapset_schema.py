@@ -11,6 +11,8 @@ from app.schemas.map_projection_system_schema import MapProjectionSystemSchema
 from app.schemas.map_source_schema import MapSourceSchema
 from app.schemas.organization_schema import OrganizationWithMapsetSchema
 from app.schemas.regional_schema import RegionalSchema
+from app.utils.aggregation import AggregateFunction
+from app.utils.class_breaks import ClassificationMethod
 
 
 class MapsetSchema(ORJSONBaseModel):
@@ -90,3 +92,15 @@ class MapsetUpdateSchema(ORJSONBaseModel):
     is_popular: Optional[bool] = Field(None)
     is_active: Optional[bool] = Field(None)
     notes: Optional[str] = Field(None)
+
+
+class ColorScaleRequestSchema(ORJSONBaseModel):
+    source_url: str
+    color_range: Optional[List[str]] = Field(None)
+    boundary: str = Field("jatim.json")
+    method: ClassificationMethod = Field(ClassificationMethod.quantile)
+    aggregate: AggregateFunction = Field(AggregateFunction.count)
+    field: Optional[str] = Field(None)
+    zoom: Optional[float] = Field(None, ge=0)
+    tolerance: Optional[float] = Field(None, ge=0)
+    projection_system_id: Optional[UUID7Field] = Field(None)
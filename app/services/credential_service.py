@@ -94,11 +94,11 @@ class CredentialService(BaseService[CredentialModel]):
             Tuple dari (credential_model, decrypted_data)
         """
 
-        credentials, total = await self.find_all(
+        page = await self.find_all(
             filters=filters, sort=sort, search=search, group_by=group_by, limit=limit, offset=offset
         )
         decrypted_credentials = []
-        for credential in credentials:
+        for credential in page.items:
             try:
                 decrypted_data = credential_encryption.decrypt(credential.encrypted_data, credential.encryption_iv)
                 temp = credential.to_dict()
@@ -109,7 +109,7 @@ class CredentialService(BaseService[CredentialModel]):
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to decrypt some credential data"
                 )
 
-        return decrypted_credentials, total
+        return decrypted_credentials, page.total
 
     async def update_credential(self, credential_id: UUID, data: Dict[str, Any], user_id: UUID) -> CredentialModel:
         """
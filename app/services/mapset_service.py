@@ -1,25 +1,50 @@
-import json
-import math
-import os
+import asyncio
 from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
-import numpy as np
-from colour import Color
 from fastapi import HTTPException, status
-from shapely.geometry import Point, shape
-from sqlalchemy import or_
 from uuid6 import UUID
 
-from app.core.exceptions import UnprocessableEntity
+from app.core.boundary_pyramid import boundary_pyramids
+from app.core.boundary_registry import boundary_registry
+from app.core.choropleth_cache import assignment_cache, choropleth_cache, cluster_cache, tile_cache
+from app.core.config import settings
+from app.core.exceptions import (
+    APIException,
+    BadRequestException,
+    ConflictException,
+    NotFoundException,
+    UnprocessableEntity,
+    UnsupportedMediaTypeException,
+)
+from app.core.filters import compile_filters, compile_sort
+from app.core.geoprocessing import (
+    aggregate_feature_points,
+    build_cluster_index,
+    compute_colorscale_bins,
+    compute_colorscale_incremental,
+    compute_colorscale_levels,
+    geo_pool,
+    render_tile,
+)
+from app.core.job_manager import JobStatus, color_scale_jobs
+from app.core.pagination import CountMode, Page
+from app.core.search import SearchMode
+from app.core.source_cache import SourceEntry, source_cache
 from app.models import MapsetModel
 from app.models.organization_model import OrganizationModel
 from app.repositories import (
+    MapProjectionSystemRepository,
     MapsetHistoryRepository,
     MapsetRepository,
     SourceUsageRepository,
 )
+from app.schemas.mapset_schema import ColorScaleRequestSchema
 from app.schemas.user_schema import UserSchema
+from app.utils.aggregation import AggregateFunction
+from app.utils.binning import BinShape
+from app.utils.class_breaks import ClassificationMethod
+from app.utils.reprojection import WGS84, get_transformer, normalize_crs
+from app.utils.source_formats import missing_dependency
 
 from . import BaseService
 
@@ -30,11 +55,13 @@ class MapsetService(BaseService[MapsetModel]):
         repository: MapsetRepository,
         history_repository: MapsetHistoryRepository,
         source_usage_repository: SourceUsageRepository,
+        projection_system_repository: MapProjectionSystemRepository,
     ):
         super().__init__(MapsetModel, repository)
         self.repository = repository
         self.history_repository = history_repository
         self.source_usage_repository = source_usage_repository
+        self.projection_system_repository = projection_system_repository
 
     async def find_all(
         self,
@@ -45,84 +72,17 @@ class MapsetService(BaseService[MapsetModel]):
         group_by: str = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> Tuple[List[MapsetModel] | int]:
-        list_model_filters = []
-        list_sort = []
-
-        if isinstance(filters, str):
-            filters = [filters]
-
-        filters.append("is_deleted=false")
-
-        for filter_item in filters:
-            if isinstance(filter_item, list):
-                or_filter = []
-                for values in filter_item:
-                    try:
-                        col, value = values.split("=")
-                    except ValueError:
-                        raise UnprocessableEntity(
-                            f"Invalid filter {filter_item} must be 'name=value' or '[[name=value],[name=value]]'"
-                        )
-
-                    if not hasattr(self.model_class, col):
-                        raise UnprocessableEntity(f"Invalid filter column: {col}")
-
-                    if col == "id":
-                        try:
-                            value = UUID(value)
-                        except:
-                            raise UnprocessableEntity(f"Invalid filter value {value}, please provide UUID")
-
-                    if isinstance(value, str) and value.lower() in {"true", "false", "t", "f"}:
-                        value = value.lower() in {"true", "t"}
-
-                    or_filter.append(getattr(self.model_class, col) == value)
-                list_model_filters.append(or_(*or_filter))
-                continue
-
-            try:
-                col, value = filter_item.split("=")
-            except ValueError:
-                raise UnprocessableEntity(
-                    f"Invalid filter {filter_item} must be 'name=value' or '[[name=value],[name=value]]'"
-                )
-
-            if not hasattr(self.model_class, col):
-                raise UnprocessableEntity(f"Invalid filter column: {col}")
-
-            if col == "id":
-                try:
-                    value = UUID(value)
-                except:
-                    raise UnprocessableEntity(f"Invalid filter value {value}, please provide UUID")
-
-            if isinstance(value, str) and value.lower() in {"true", "false", "t", "f"}:
-                value = value.lower() in {"true", "t"}
-                list_model_filters.append(getattr(self.model_class, col).is_(value))
-            else:
-                list_model_filters.append(getattr(self.model_class, col) == value)
-
-        if isinstance(sort, str):
-            sort = [sort]
-
-        for sort_item in sort:
-            try:
-                col, order = sort_item.split(":")
-            except ValueError:
-                raise UnprocessableEntity(f"Invalid sort {sort_item}. Must be 'name:asc' or 'name:desc'")
-
-            if not hasattr(self.model_class, col):
-                raise UnprocessableEntity(f"Invalid sort column: {col}")
-
-            if order.lower() == "asc":
-                list_sort.append(getattr(self.model_class, col).asc())
-            elif order.lower() == "desc":
-                list_sort.append(getattr(self.model_class, col).desc())
-            else:
-                raise UnprocessableEntity(f"Invalid sort order '{order}' for {col}")
-
-        return await self.repository.find_all(user, list_model_filters, list_sort, search, group_by, limit, offset)
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.exact,
+        search_mode: SearchMode = SearchMode.fulltext,
+    ) -> Page[MapsetModel]:
+        list_model_filters = compile_filters(filters, self.model_class).clauses()
+        list_model_filters.append(self.model_class.is_deleted.is_(False))
+        list_sort = compile_sort(sort, self.model_class)
+
+        return await self.repository.find_all(
+            user, list_model_filters, list_sort, search, group_by, limit, offset, cursor, count, search_mode
+        )
 
     async def find_all_group_by_organization(
         self,
@@ -137,87 +97,12 @@ class MapsetService(BaseService[MapsetModel]):
         Find organizations with filtered mapsets.
         Only returns the mapsets that match the filter for each organization.
         """
-        mapset_filters = []
-        organization_filters = []
-        list_sort = []
-
-        filters = filters or []
-
-        if isinstance(filters, str):
-            filters = [filters]
-
-        filters.append("is_deleted=false")
-
-        for filter_str in filters:
-            if isinstance(filter_str, list):
-                mapset_or_conditions = []
-                org_or_conditions = []
-
-                for value_str in filter_str:
-                    col, value = value_str.split("=")
-                    if hasattr(MapsetModel, col):
-                        if value.lower() in {"true", "false", "t", "f"}:
-                            value = value.lower() in {"true", "t"}
-                        mapset_or_conditions.append(getattr(MapsetModel, col) == value)
-                    elif hasattr(OrganizationModel, col):
-                        if value.lower() in {"true", "false", "t", "f"}:
-                            value = value.lower() in {"true", "t"}
-                        org_or_conditions.append(getattr(OrganizationModel, col) == value)
-                    else:
-                        raise UnprocessableEntity(f"Invalid filter column: {col}")
-
-                if mapset_or_conditions:
-                    mapset_filters.append(or_(*mapset_or_conditions))
-                if org_or_conditions:
-                    organization_filters.append(or_(*org_or_conditions))
-                continue
+        compiled = compile_filters(filters, (MapsetModel, OrganizationModel))
+        mapset_filters = compiled.clauses(MapsetModel)
+        mapset_filters.append(MapsetModel.is_deleted.is_(False))
+        organization_filters = compiled.clauses(OrganizationModel)
 
-            try:
-                col, value = filter_str.split("=")
-
-                # Konversi nilai boolean jika perlu
-                if value.lower() in {"true", "false", "t", "f"}:
-                    value = value.lower() in {"true", "t"}
-
-                # Tambahkan filter ke daftar yang sesuai
-                if hasattr(MapsetModel, col):
-                    mapset_filters.append(getattr(MapsetModel, col) == value)
-                elif hasattr(OrganizationModel, col):
-                    organization_filters.append(getattr(OrganizationModel, col) == value)
-                else:
-                    raise UnprocessableEntity(f"Invalid filter column: {col}")
-            except ValueError:
-                raise UnprocessableEntity(f"Invalid filter format: {filter_str}")
-
-        if isinstance(sort, str):
-            sort = [sort]
-
-        for sort_str in sort or []:
-            try:
-                col, order = sort_str.split(":")
-
-                if hasattr(OrganizationModel, col):
-                    sort_col = getattr(OrganizationModel, col)
-                elif hasattr(MapsetModel, col):
-                    # Untuk sort berdasarkan atribut mapset, kita perlu subquery
-                    # Ini tidak diimplementasi di sini untuk menjaga kesederhanaan
-                    # Namun Anda bisa mengembangkannya jika diperlukan
-                    # continue
-                    sort_col = getattr(MapsetModel, col)
-                else:
-                    raise UnprocessableEntity(f"Invalid sort column: {col}")
-
-                if order.lower() == "asc":
-                    list_sort.append(sort_col.asc())
-                elif order.lower() == "desc":
-                    list_sort.append(sort_col.desc())
-                else:
-                    raise UnprocessableEntity(f"Invalid sort order: {order}")
-            except ValueError:
-                raise UnprocessableEntity(f"Invalid sort format: {sort_str}")
-
-        if not list_sort:
-            list_sort = [OrganizationModel.name.asc()]
+        list_sort = compile_sort(sort, (OrganizationModel, MapsetModel)) or [OrganizationModel.name.asc()]
 
         return await self.repository.find_all_group_by_organization(
             user=user,
@@ -291,163 +176,576 @@ class MapsetService(BaseService[MapsetModel]):
         await self.repository.bulk_update_activation(mapset_ids, is_active)
 
     async def calculate_choropleth(
-        self, geojson_data: Dict, boundary_name: str = "jatim.json", coordinate_field: str = "coordinates"
+        self,
+        geojson_data: Dict,
+        boundary_name: str = "jatim.json",
+        coordinate_field: str = "coordinates",
+        aggregate: AggregateFunction = AggregateFunction.count,
+        field: Optional[str] = None,
+        zoom: Optional[float] = None,
+        tolerance: Optional[float] = None,
+        source_crs: Optional[str] = None,
     ) -> List[Dict]:
         """
-        Menghitung data choropleth berdasarkan jumlah titik dalam poligon.
+        Menghitung data choropleth berdasarkan agregasi titik dalam poligon.
 
         Args:
             geojson_data: GeoJSON data yang berisi titik-titik
             boundary_name: Nama file boundary GeoJSON di dalam folder assets
             coordinate_field: Nama field yang berisi koordinat di dalam geometri
+            aggregate: Fungsi agregasi (count, sum, mean, min, max)
+            field: Nama properti numerik yang diagregasi, wajib untuk selain count
+            zoom: Level zoom peta, dipakai memilih level piramida boundary
+            tolerance: Toleransi penyederhanaan boundary dalam derajat, menggantikan `zoom`
+            source_crs: Sistem proyeksi koordinat titik, None berarti WGS 84
 
         Returns:
-            List[Dict]: Data choropleth untuk setiap poligon dengan jumlah titik
+            List[Dict]: Data choropleth untuk setiap poligon dengan nilai agregat
         """
         if not geojson_data or not isinstance(geojson_data, dict) or "features" not in geojson_data:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid GeoJSON data format")
 
+        self._validate_aggregate(aggregate, field)
+        source_crs = self._validate_crs(source_crs)
+
         features = geojson_data.get("features", [])
+        boundary = boundary_registry.get(boundary_name)
+        level = boundary_pyramids.level_for(boundary, zoom, tolerance)
+
+        return await geo_pool.run(
+            aggregate_feature_points,
+            features,
+            boundary.name,
+            coordinate_field,
+            aggregate,
+            field,
+            settings.GEOJSON_CHUNK_SIZE,
+            level,
+            source_crs,
+        )
 
-        boundary_geojson = self._load_boundary_geojson(boundary_name)
-        polygon_features = boundary_geojson.get("features", [])
+    async def generate_colorscale(
+        self,
+        geojson_source: str,
+        color_range: List[str] = None,
+        boundary_name: str = "jatim.json",
+        method: ClassificationMethod = ClassificationMethod.quantile,
+        aggregate: AggregateFunction = AggregateFunction.count,
+        field: Optional[str] = None,
+        zoom: Optional[float] = None,
+        tolerance: Optional[float] = None,
+        source_crs: Optional[str] = None,
+    ) -> Tuple[List[Dict], List[Dict], str]:
+        """
+        Generate color scale untuk data choropleth.
+
+        Hasil di-cache berdasarkan digest isi sumber data, boundary dan color range,
+        sehingga perhitungan hanya diulang ketika GeoJSON upstream berubah.
 
-        choropleth_data = []
+        Args:
+            geojson_source: geojson_source url menuju data choropleth
+            color_range: Rentang warna yang akan digunakan
+            boundary_name: Nama file boundary GeoJSON di dalam folder assets
+            method: Metode klasifikasi class break
+            aggregate: Fungsi agregasi (count, sum, mean, min, max)
+            field: Nama properti numerik yang diagregasi, wajib untuk selain count
+            zoom: Level zoom peta, dipakai memilih level piramida boundary
+            tolerance: Toleransi penyederhanaan boundary dalam derajat, menggantikan `zoom`
+            source_crs: Sistem proyeksi koordinat sumber data, None berarti WGS 84
 
-        for polygon in polygon_features:
-            value = 0
-            polygon_shape = shape(polygon["geometry"])
+        Returns:
+            Tuple[List[Dict], List[Dict], str]:
+                - Data choropleth dengan warna
+                - Color scale untuk legenda
+                - Fingerprint hasil, dipakai untuk mengambil vector tile choropleth
+        """
+        if not color_range:
+            color_range = ["#ddffed", "#006430"]
 
-            for feature in features:
-                if feature.get("geometry", {}).get("type") == "Point" and coordinate_field in feature.get(
-                    "geometry", {}
-                ):
-                    coords = feature["geometry"]["coordinates"]
-                    if len(coords) >= 2:
-                        point = Point(coords[0], coords[1])
+        self._validate_aggregate(aggregate, field)
+        source_crs = self._validate_crs(source_crs)
+
+        source = await self._fetch_source(geojson_source)
+        boundary = boundary_registry.get(boundary_name)
+        level = boundary_pyramids.level_for(boundary, zoom, tolerance)
+        level_tolerance = boundary_pyramids.tolerances[level] if level is not None else None
+
+        cache_key = choropleth_cache.make_key(
+            source.digest,
+            boundary.name,
+            boundary.mtime,
+            color_range,
+            method,
+            aggregate,
+            field,
+            level_tolerance,
+            source_crs,
+        )
+        cached = await choropleth_cache.get(cache_key)
+        if cached is not None:
+            return cached[0], cached[1], cache_key
 
-                        if polygon_shape.contains(point):
-                            value += 1
+        # Hasil join per feature dari versi sumber sebelumnya dipakai ulang, sehingga hanya
+        # feature yang baru atau berpindah yang di-join ulang.
+        state_key = (geojson_source, boundary.name, boundary.mtime, level_tolerance, source_crs)
+        try:
+            result, rangelist, state = await geo_pool.run(
+                compute_colorscale_incremental,
+                source,
+                boundary.name,
+                color_range,
+                method,
+                aggregate,
+                field,
+                settings.GEOJSON_CHUNK_SIZE,
+                level,
+                assignment_cache.get(state_key),
+                source_crs,
+            )
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid GeoJSON data format")
 
-            choropleth_data.append({**polygon["properties"], "value": value})
+        assignment_cache.set(state_key, state)
+        await choropleth_cache.set(cache_key, (result, rangelist))
 
-        return choropleth_data
+        return result, rangelist, cache_key
 
-    async def generate_colorscale(
-        self, geojson_source: str, color_range: List[str] = None
-    ) -> Tuple[List[Dict], List[Dict]]:
+    async def generate_colorscale_levels(
+        self,
+        geojson_source: str,
+        boundary_names: List[str],
+        color_range: List[str] = None,
+        method: ClassificationMethod = ClassificationMethod.quantile,
+        aggregate: AggregateFunction = AggregateFunction.count,
+        field: Optional[str] = None,
+        source_crs: Optional[str] = None,
+    ) -> Dict[str, Dict]:
         """
-        Generate color scale untuk data choropleth.
+        Generate color scale untuk beberapa tingkat wilayah (misal provinsi, kabupaten, kecamatan).
+
+        Titik hanya di-join sekali ke boundary terhalus lalu digabung ke tingkat yang lebih
+        kasar berdasarkan kode wilayah. Hasil setiap tingkat di-cache dengan fingerprint yang
+        sama seperti `generate_colorscale`, sehingga bisa langsung dipakai untuk vector tile.
 
         Args:
             geojson_source: geojson_source url menuju data choropleth
+            boundary_names: Nama file boundary setiap tingkat wilayah
             color_range: Rentang warna yang akan digunakan
+            method: Metode klasifikasi class break
+            aggregate: Fungsi agregasi (count, sum, mean, min, max)
+            field: Nama properti numerik yang diagregasi, wajib untuk selain count
+            source_crs: Sistem proyeksi koordinat sumber data, None berarti WGS 84
 
         Returns:
-            Tuple[List[Dict], List[Dict]]:
-                - Data choropleth dengan warna
-                - Color scale untuk legenda
+            Dict[str, Dict]: Untuk setiap boundary berisi `data`, `rangelist` dan `fingerprint`
+        """
+        if not color_range:
+            color_range = ["#ddffed", "#006430"]
+        if not boundary_names:
+            raise UnprocessableEntity("Minimal satu boundary wajib diisi")
+
+        self._validate_aggregate(aggregate, field)
+        source_crs = self._validate_crs(source_crs)
+
+        source = await self._fetch_source(geojson_source)
+        boundaries = [boundary_registry.get(name) for name in boundary_names]
+
+        keys = {
+            boundary.name: choropleth_cache.make_key(
+                source.digest, boundary.name, boundary.mtime, color_range, method, aggregate, field, None, source_crs
+            )
+            for boundary in boundaries
+        }
+        results = {name: await choropleth_cache.get(key) for name, key in keys.items()}
+
+        missing = [name for name, cached in results.items() if cached is None]
+        if missing:
+            try:
+                computed = await geo_pool.run(
+                    compute_colorscale_levels,
+                    source,
+                    list(keys),
+                    color_range,
+                    method,
+                    aggregate,
+                    field,
+                    settings.GEOJSON_CHUNK_SIZE,
+                    source_crs,
+                )
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid GeoJSON data format")
+
+            for name in missing:
+                results[name] = computed[name]
+                await choropleth_cache.set(keys[name], computed[name])
+
+        return {
+            name: {"data": result, "rangelist": rangelist, "fingerprint": keys[name]}
+            for name, (result, rangelist) in results.items()
+        }
+
+    async def generate_colorscale_bins(
+        self,
+        geojson_source: str,
+        cell_size: float,
+        shape: BinShape = BinShape.hexagon,
+        color_range: List[str] = None,
+        method: ClassificationMethod = ClassificationMethod.quantile,
+        aggregate: AggregateFunction = AggregateFunction.count,
+        field: Optional[str] = None,
+        source_crs: Optional[str] = None,
+    ) -> Tuple[Dict, List[Dict]]:
         """
+        Generate color scale peta kepadatan titik pada grid hexagon/persegi.
+
+        Hasil di-cache berdasarkan digest isi sumber data, ukuran dan bentuk sel.
 
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.get(geojson_source)
-            geojson_data = response.json()
+        Args:
+            geojson_source: geojson_source url menuju data titik
+            cell_size: Ukuran sel dalam derajat (jari-jari hexagon atau sisi persegi)
+            shape: Bentuk sel
+            color_range: Rentang warna yang akan digunakan
+            method: Metode klasifikasi class break
+            aggregate: Fungsi agregasi (count, sum, mean, min, max)
+            field: Nama properti numerik yang diagregasi, wajib untuk selain count
+            source_crs: Sistem proyeksi koordinat sumber data, None berarti WGS 84
 
-        choropleth_data = await self.calculate_choropleth(geojson_data)
+        Returns:
+            Tuple[Dict, List[Dict]]:
+                - FeatureCollection sel dengan `value` dan `color`
+                - Color scale untuk legenda
+        """
         if not color_range:
             color_range = ["#ddffed", "#006430"]
 
-        arr_tobe_percentile = []
-        for row in choropleth_data:
-            arr_tobe_percentile.append(row["value"])
-
-        arr_tobe_percentile.sort()
-        arr_tobe_percentile = list(filter(lambda num: num != 0, arr_tobe_percentile))
-
-        count = 5
-        is_duplicate = False
-        arr_percentile = []
-
-        if len(arr_tobe_percentile) > 1:
-            while count >= 1:
-                diff = 100 / count
-                arr_percentile = []
-
-                for j in range(count + 1):
-                    perc = math.ceil(np.percentile(arr_tobe_percentile, j * diff))
-                    arr_percentile.append(perc)
-
-                is_duplicate = self._check_if_duplicates(arr_percentile)
-                if is_duplicate:
-                    count = count - 1
-                    arr_tobe_percentile = arr_percentile.copy()
-                else:
-                    break
-        elif len(arr_tobe_percentile) == 1:
-            arr_percentile = arr_tobe_percentile
-        else:
-            pass
-
-        if len(arr_percentile) > 1:
-            colors = list(Color(color_range[0]).range_to(Color(color_range[1]), len(arr_percentile) - 1))
-
-            rangelist = []
-            rangelist.append({"from": 0, "to": 0, "color": "#FFFFFFFF", "total_cluster": 0})
-
-            for i in range(len(arr_percentile) - 1):
-                if i == 0:
-                    rangelist.append(
-                        {
-                            "from": arr_percentile[i],
-                            "to": arr_percentile[i + 1],
-                            "color": colors[i].hex,
-                            "total_cluster": 0,
-                        }
-                    )
-                else:
-                    rangelist.append(
-                        {
-                            "from": arr_percentile[i] + 1,
-                            "to": arr_percentile[i + 1],
-                            "color": colors[i].hex,
-                            "total_cluster": 0,
-                        }
-                    )
-        elif len(arr_percentile) == 1:
-            colors = list(Color(color_range[0]).range_to(Color(color_range[1]), 1))
-
-            rangelist = []
-            rangelist.append({"from": 0, "to": 0, "color": "#FFFFFFFF", "total_cluster": 0})
-            rangelist.append(
-                {"from": arr_percentile[0], "to": arr_percentile[0], "color": colors[0].hex, "total_cluster": 0}
+        self._validate_aggregate(aggregate, field)
+        source_crs = self._validate_crs(source_crs)
+
+        source = await self._fetch_source(geojson_source)
+        cache_key = choropleth_cache.make_key(
+            source.digest, "bins", shape, cell_size, color_range, method, aggregate, field, source_crs
+        )
+
+        cached = await choropleth_cache.get(cache_key)
+        if cached is None:
+            try:
+                cached = await geo_pool.run(
+                    compute_colorscale_bins,
+                    source,
+                    cell_size,
+                    shape,
+                    color_range,
+                    method,
+                    aggregate,
+                    field,
+                    settings.GEOJSON_CHUNK_SIZE,
+                    source_crs,
+                )
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid GeoJSON data format")
+            await choropleth_cache.set(cache_key, cached)
+
+        features, rangelist = cached
+        return {"type": "FeatureCollection", "features": features}, rangelist
+
+    async def generate_colorscale_batch(self, jobs: List[ColorScaleRequestSchema]) -> List[Dict]:
+        """
+        Generate color scale untuk beberapa sumber data sekaligus.
+
+        Semua job dijalankan bersamaan: unduhan memakai client HTTP/2 bersama dan URL yang
+        sama hanya diunduh sekali. Kegagalan satu job tidak menggagalkan job lain.
+
+        Args:
+            jobs: Daftar permintaan color scale
+
+        Returns:
+            List[Dict]: Hasil setiap job sesuai urutan, berisi `data` dan `rangelist`
+                atau `error` jika job gagal
+        """
+        if len(jobs) > settings.COLOR_SCALE_BATCH_MAX_JOBS:
+            raise UnprocessableEntity(f"Jumlah job maksimal {settings.COLOR_SCALE_BATCH_MAX_JOBS}")
+
+        # Sistem proyeksi di-resolve berurutan sebelum job dijalankan bersamaan, karena
+        # session database tidak boleh dipakai paralel.
+        crs = {}
+        for job in jobs:
+            if job.projection_system_id not in crs:
+                crs[job.projection_system_id] = await self.get_source_crs(job.projection_system_id)
+
+        results = await asyncio.gather(
+            *(
+                self.generate_colorscale(
+                    job.source_url,
+                    job.color_range,
+                    boundary_name=job.boundary,
+                    method=job.method,
+                    aggregate=job.aggregate,
+                    field=job.field,
+                    zoom=job.zoom,
+                    tolerance=job.tolerance,
+                    source_crs=crs[job.projection_system_id],
+                )
+                for job in jobs
+            ),
+            return_exceptions=True,
+        )
+
+        response = []
+        for result in results:
+            if isinstance(result, (APIException, HTTPException)):
+                response.append({"error": self._error_message(result)})
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                data, rangelist, fingerprint = result
+                response.append({"data": data, "rangelist": rangelist, "fingerprint": fingerprint})
+
+        return response
+
+    async def submit_colorscale_job(self, job: ColorScaleRequestSchema) -> Dict:
+        """
+        Jalankan generate color scale sebagai job background.
+
+        Permintaan identik yang masih berjalan digabung ke job yang sama.
+
+        Args:
+            job: Permintaan color scale
+
+        Returns:
+            Dict: Status job beserta `job_id`
+        """
+        if not job.color_range:
+            job.color_range = ["#ddffed", "#006430"]
+
+        self._validate_aggregate(job.aggregate, job.field)
+        source_crs = self._validate_crs(await self.get_source_crs(job.projection_system_id))
+
+        key = choropleth_cache.make_key(
+            job.source_url,
+            job.color_range,
+            job.boundary,
+            job.method,
+            job.aggregate,
+            job.field,
+            job.zoom,
+            job.tolerance,
+            source_crs,
+        )
+        submitted = color_scale_jobs.submit(
+            key,
+            lambda: self.generate_colorscale(
+                job.source_url,
+                job.color_range,
+                boundary_name=job.boundary,
+                method=job.method,
+                aggregate=job.aggregate,
+                field=job.field,
+                zoom=job.zoom,
+                tolerance=job.tolerance,
+                source_crs=source_crs,
+            ),
+        )
+        return submitted.to_dict()
+
+    async def get_colorscale_job(self, job_id: str, wait: float = 0) -> Dict:
+        """
+        Ambil status job color scale.
+
+        Args:
+            job_id: ID job
+            wait: Lama maksimal (detik) menunggu job selesai sebelum status dikembalikan
+
+        Returns:
+            Dict: Status job, berisi `error` jika job gagal
+        """
+        job = await color_scale_jobs.wait(job_id, min(wait, settings.COLOR_SCALE_JOB_MAX_WAIT))
+
+        response = job.to_dict()
+        if job.status == JobStatus.failed:
+            response["error"] = self._error_message(job.error)
+        return response
+
+    def get_colorscale_job_result(self, job_id: str) -> Tuple[List[Dict], List[Dict], str]:
+        """Ambil hasil job color scale yang sudah selesai."""
+        job = color_scale_jobs.get(job_id)
+
+        if job.status == JobStatus.failed:
+            if isinstance(job.error, (APIException, HTTPException)):
+                raise job.error
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=self._error_message(job.error)
             )
-        else:
-            rangelist = []
-            rangelist.append({"from": 0, "to": 0, "color": "#FFFFFFFF", "total_cluster": 0})
+        if job.status != JobStatus.done:
+            raise ConflictException(f"Job belum selesai: {job.status.value}")
+
+        return job.result
+
+    def get_boundary(
+        self,
+        boundary_name: str,
+        zoom: Optional[float] = None,
+        tolerance: Optional[float] = None,
+        topojson: bool = False,
+    ) -> bytes:
+        """
+        Ambil boundary pada level piramida yang sesuai dengan `zoom`/`tolerance`.
+
+        Args:
+            boundary_name: Nama file boundary GeoJSON di dalam folder assets
+            zoom: Level zoom peta
+            tolerance: Toleransi penyederhanaan dalam derajat, menggantikan `zoom`
+            topojson: Kembalikan TopoJSON (arc bersama, koordinat terkuantisasi) alih-alih GeoJSON
+
+        Returns:
+            bytes: FeatureCollection GeoJSON atau Topology TopoJSON
+        """
+        boundary = boundary_registry.get(boundary_name)
+        level = boundary_pyramids.level_for(boundary, zoom, tolerance)
+
+        if topojson:
+            topology = boundary_pyramids.topology(boundary, level)
+            return topology.encode(boundary.name.removesuffix(".json"), boundary.properties)
+        return boundary_pyramids.geojson(boundary, level)
+
+    def encode_colorscale_topojson(
+        self,
+        boundary_name: str,
+        result: List[Dict],
+        rangelist: List[Dict],
+        fingerprint: str,
+        zoom: Optional[float] = None,
+        tolerance: Optional[float] = None,
+    ) -> bytes:
+        """
+        Gabungkan hasil color scale dengan geometri boundary sebagai dokumen TopoJSON.
+
+        Properties setiap geometri berisi data choropleth (termasuk `value` dan `color`),
+        sedangkan `rangelist` dan `fingerprint` disimpan sebagai member level atas.
+        """
+        boundary = boundary_registry.get(boundary_name)
+        level = boundary_pyramids.level_for(boundary, zoom, tolerance)
+        topology = boundary_pyramids.topology(boundary, level)
+        return topology.encode(
+            boundary.name.removesuffix(".json"), result, rangelist=rangelist, fingerprint=fingerprint
+        )
 
-        result = []
-        for item in choropleth_data:
-            temp = item.copy()
+    async def get_tile(self, boundary_name: str, z: int, x: int, y: int, fingerprint: Optional[str] = None) -> bytes:
+        """
+        Ambil vector tile (MVT) boundary, opsional dengan atribut `value`/`color` choropleth.
+
+        Tile di-cache berdasarkan boundary, fingerprint choropleth dan koordinat tile.
+
+        Args:
+            boundary_name: Nama file boundary GeoJSON di dalam folder assets
+            z, x, y: Koordinat tile (skema XYZ)
+            fingerprint: Fingerprint hasil color scale
 
-            for range_item in rangelist:
-                if temp["value"] >= range_item["from"] and temp["value"] <= range_item["to"]:
-                    temp["color"] = range_item["color"]
-                    range_item["total_cluster"] += 1
+        Returns:
+            bytes: Isi tile MVT
+        """
+        if not 0 <= z <= 24 or not 0 <= x < (1 << z) or not 0 <= y < (1 << z):
+            raise BadRequestException(f"Koordinat tile tidak valid: {z}/{x}/{y}")
+
+        boundary = boundary_registry.get(boundary_name)
+        key = (boundary.name, boundary.mtime, fingerprint, z, x, y)
+
+        tile = tile_cache.get(key)
+        if tile is not None:
+            return tile
+
+        attributes = None
+        if fingerprint:
+            cached = await choropleth_cache.get(fingerprint)
+            if cached is None:
+                raise NotFoundException("Choropleth tidak ditemukan, silakan generate ulang color scale")
+            attributes = cached[0]
+            if len(attributes) != len(boundary):
+                raise BadRequestException("Fingerprint tidak sesuai dengan boundary")
+
+        tile = await geo_pool.run(render_tile, boundary.name, z, x, y, attributes)
+        tile_cache.set(key, tile)
+        return tile
+
+    async def get_clusters(self, id: UUID, bbox: str, zoom: float) -> Dict:
+        """
+        Ambil titik mapset yang sudah di-cluster untuk area dan level zoom tertentu.
 
-            result.append(temp)
+        Index cluster dibangun sekali per versi sumber data (berdasarkan digest) lalu
+        di-cache, sehingga request berikutnya hanya melakukan query bbox pada index.
 
-        return result, rangelist
+        Args:
+            id: ID mapset
+            bbox: Area peta `minx,miny,maxx,maxy` dalam derajat
+            zoom: Level zoom peta
 
-    def _load_boundary_geojson(self, boundary_filename: str) -> Dict:
+        Returns:
+            Dict: FeatureCollection GeoJSON berisi cluster dan titik
+        """
         try:
-            boundary_path = os.path.join("assets", boundary_filename)
+            bounds = tuple(float(value) for value in bbox.split(","))
+        except ValueError:
+            bounds = ()
+        if len(bounds) != 4 or bounds[0] > bounds[2] or bounds[1] > bounds[3]:
+            raise BadRequestException(f"Format bbox tidak valid: {bbox}")
 
-            if not os.path.exists(boundary_path):
-                raise FileNotFoundError(f"File boundary tidak ditemukan: {boundary_path}")
+        mapset = await self.find_by_id(id)
+        if not mapset.layer_url:
+            raise UnprocessableEntity("Mapset tidak memiliki layer_url")
 
-            with open(boundary_path, encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Gagal membaca file boundary: {str(e)}"
+        source_crs = self._validate_crs(mapset.projection_system.name if mapset.projection_system else None)
+
+        source = await self._fetch_source(mapset.layer_url)
+        key = (mapset.layer_url, source.digest, source_crs)
+
+        index = cluster_cache.get(key)
+        if index is None:
+            try:
+                index = await geo_pool.run(build_cluster_index, source, settings.GEOJSON_CHUNK_SIZE, source_crs)
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid GeoJSON data format")
+            cluster_cache.set(key, index)
+
+        return {"type": "FeatureCollection", "features": index.query(bounds, zoom)}
+
+    async def get_source_crs(self, projection_system_id: Optional[UUID]) -> Optional[str]:
+        """Ambil nama sistem proyeksi (`MapProjectionSystemModel.name`) sumber data, None berarti WGS 84."""
+        if projection_system_id is None:
+            return None
+
+        projection_system = await self.projection_system_repository.find_by_id(projection_system_id)
+        if not projection_system:
+            raise NotFoundException(f"Sistem proyeksi tidak ditemukan: {projection_system_id}")
+        return projection_system.name
+
+    async def _fetch_source(self, url: str) -> SourceEntry:
+        """Ambil sumber data dan pastikan formatnya bisa dibaca dengan paket yang terpasang."""
+        source = await source_cache.fetch(url)
+        package = missing_dependency(source.format)
+        if package is not None:
+            raise UnsupportedMediaTypeException(
+                f"Format {source.format.value} membutuhkan paket opsional {package} yang belum terpasang"
             )
+        return source
+
+    def _validate_crs(self, source_crs: Optional[str]) -> Optional[str]:
+        """Normalisasi CRS sumber data dan pastikan bisa direproyeksi ke WGS 84; None jika sudah WGS 84."""
+        source_crs = normalize_crs(source_crs)
+        if source_crs == WGS84:
+            return None
+
+        try:
+            get_transformer(source_crs)
+        except ValueError as e:
+            raise UnprocessableEntity(str(e))
+        return source_crs
+
+    def _error_message(self, error: Optional[BaseException]) -> str:
+        if isinstance(error, APIException):
+            return error.message
+        if isinstance(error, HTTPException):
+            return error.detail
+        return "Job gagal diproses"
+
+    def _validate_aggregate(self, aggregate: AggregateFunction, field: Optional[str]) -> None:
+        if aggregate != AggregateFunction.count and not field:
+            raise UnprocessableEntity(f"Field wajib diisi untuk agregasi {aggregate.value}")
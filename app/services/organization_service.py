@@ -1,10 +1,12 @@
 from typing import Dict, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_
 from uuid6 import UUID
 
-from app.core.exceptions import NotFoundException, UnprocessableEntity
+from app.core.exceptions import NotFoundException
+from app.core.filters import compile_filters, compile_sort
+from app.core.pagination import CountMode
+from app.core.search import SearchMode
 from app.models.organization_model import OrganizationModel
 from app.repositories.organization_repository import OrganizationRepository
 from app.schemas.user_schema import UserSchema
@@ -33,83 +35,24 @@ class OrganizationService(BaseService[OrganizationModel]):
         except HTTPException as e:
             raise HTTPException(status_code=e.status_code, detail=e.detail)
 
-    async def find_all(self, user: UserSchema | None, filters, sort, search="", group_by=None, limit=100, offset=0):
-        list_model_filters = []
-        list_sort = []
-
-        if isinstance(filters, str):
-            filters = [filters]
-
+    async def find_all(
+        self,
+        user: UserSchema | None,
+        filters,
+        sort,
+        search="",
+        group_by=None,
+        limit=100,
+        offset=0,
+        cursor=None,
+        count=CountMode.exact,
+        search_mode=SearchMode.fulltext,
+    ):
+        list_model_filters = compile_filters(filters, self.model_class).clauses()
         if hasattr(self.model_class, "is_deleted"):
-            filters.append("is_deleted=false")
-
-        for filter_item in filters:
-            if isinstance(filter_item, list):
-                or_filter = []
-                for values in filter_item:
-                    try:
-                        col, value = values.split("=")
-                    except ValueError:
-                        raise UnprocessableEntity(
-                            f"Invalid filter {filter_item} must be 'name=value' or '[[name=value],[name=value]]'"
-                        )
-
-                    if not hasattr(self.model_class, col):
-                        raise UnprocessableEntity(f"Invalid filter column: {col}")
-
-                    if col == "id":
-                        try:
-                            value = UUID(value)
-                        except:
-                            raise UnprocessableEntity(f"Invalid filter value {value}, please provide UUID")
-
-                    if isinstance(value, str) and value.lower() in {"true", "false", "t", "f"}:
-                        value = value.lower() in {"true", "t"}
-
-                    or_filter.append(getattr(self.model_class, col) == value)
-                list_model_filters.append(or_(*or_filter))
-                continue
-
-            try:
-                col, value = filter_item.split("=")
-            except ValueError:
-                raise UnprocessableEntity(
-                    f"Invalid filter {filter_item} must be 'name=value' or '[[name=value],[name=value]]'"
-                )
-
-            if not hasattr(self.model_class, col):
-                raise UnprocessableEntity(f"Invalid filter column: {col}")
-
-            if col == "id":
-                try:
-                    value = UUID(value)
-                except:
-                    raise UnprocessableEntity(f"Invalid filter value {value}, please provide UUID")
-
-            if isinstance(value, str) and value.lower() in {"true", "false", "t", "f"}:
-                value = value.lower() in {"true", "t"}
-                list_model_filters.append(getattr(self.model_class, col).is_(value))
-            else:
-                list_model_filters.append(getattr(self.model_class, col) == value)
-
-        if isinstance(sort, str):
-            sort = [sort]
-
-        for sort_item in sort:
-            try:
-                col, order = sort_item.split(":")
-            except ValueError:
-                raise UnprocessableEntity(f"Invalid sort {sort_item}. Must be 'name:asc' or 'name:desc'")
-
-            if not hasattr(self.model_class, col):
-                raise UnprocessableEntity(f"Invalid sort column: {col}")
-
-            if order.lower() == "asc":
-                list_sort.append(getattr(self.model_class, col).asc())
-            elif order.lower() == "desc":
-                list_sort.append(getattr(self.model_class, col).desc())
-            else:
-                raise UnprocessableEntity(f"Invalid sort order '{order}' for {col}")
+            list_model_filters.append(self.model_class.is_deleted.is_(False))
+
+        list_sort = compile_sort(sort, self.model_class)
 
         return await self.repository.find_all(
             user,
@@ -119,6 +62,9 @@ class OrganizationService(BaseService[OrganizationModel]):
             group_by=group_by,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            count=count,
+            search_mode=search_mode,
         )
 
     async def create(self, data: Dict[str, str]) -> OrganizationModel:
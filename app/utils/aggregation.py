@@ -0,0 +1,95 @@
+from enum import Enum
+from typing import Optional
+
+import numpy as np
+
+
+class AggregateFunction(str, Enum):
+    count = "count"
+    sum = "sum"
+    mean = "mean"
+    min = "min"
+    max = "max"
+
+
+class PolygonAggregator:
+    """
+    Akumulator agregat per poligon hasil spatial join.
+
+    Semua agregat dihitung bersamaan dengan group-by NumPy (`bincount` dan `ufunc.at`
+    atas indeks poligon), sehingga chunk titik cukup diproses sekali apa pun agregat
+    yang diminta. Nilai NaN (properti kosong atau bukan angka) tidak ikut dihitung
+    selain pada `count`.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.count = np.zeros(size, dtype=np.int64)
+        self.value_count = np.zeros(size, dtype=np.int64)
+        self.sum = np.zeros(size, dtype=np.float64)
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+
+    def update(self, polygon_idx: np.ndarray, values: Optional[np.ndarray] = None) -> None:
+        """
+        Tambahkan hasil spatial join satu chunk.
+
+        Args:
+            polygon_idx: Indeks poligon untuk setiap pasangan titik-poligon
+            values: Nilai properti untuk setiap pasangan, sejajar dengan `polygon_idx`
+        """
+        self.count += np.bincount(polygon_idx, minlength=self.size)
+        if values is None:
+            return
+
+        valid = ~np.isnan(values)
+        polygon_idx = polygon_idx[valid]
+        values = values[valid]
+
+        self.value_count += np.bincount(polygon_idx, minlength=self.size)
+        self.sum += np.bincount(polygon_idx, weights=values, minlength=self.size)
+        np.minimum.at(self.min, polygon_idx, values)
+        np.maximum.at(self.max, polygon_idx, values)
+
+    def rollup(self, parent_idx: np.ndarray, size: int) -> "PolygonAggregator":
+        """
+        Gabungkan akumulator ke tingkat wilayah yang lebih kasar.
+
+        Args:
+            parent_idx: Indeks poligon induk untuk setiap poligon (-1 jika tidak punya induk)
+            size: Jumlah poligon induk
+
+        Returns:
+            PolygonAggregator: Akumulator untuk poligon induk
+        """
+        parent = PolygonAggregator(size)
+        valid = parent_idx >= 0
+        index = parent_idx[valid]
+
+        parent.count += np.bincount(index, weights=self.count[valid], minlength=size).astype(np.int64)
+        parent.value_count += np.bincount(index, weights=self.value_count[valid], minlength=size).astype(np.int64)
+        parent.sum += np.bincount(index, weights=self.sum[valid], minlength=size)
+        np.minimum.at(parent.min, index, self.min[valid])
+        np.maximum.at(parent.max, index, self.max[valid])
+        return parent
+
+    def result(self, function: AggregateFunction) -> np.ndarray:
+        """Nilai agregat per poligon. Poligon tanpa nilai bernilai NaN untuk semua agregat selain count."""
+        if function == AggregateFunction.count:
+            return self.count
+
+        empty = self.value_count == 0
+        if function == AggregateFunction.sum:
+            result = self.sum.copy()
+        elif function == AggregateFunction.mean:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = self.sum / self.value_count
+        elif function == AggregateFunction.min:
+            result = self.min.copy()
+        elif function == AggregateFunction.max:
+            result = self.max.copy()
+        else:
+            raise ValueError(f"Fungsi agregasi tidak dikenal: {function}")
+
+        result[empty] = np.nan
+        return result
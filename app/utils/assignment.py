@@ -0,0 +1,152 @@
+from typing import Any, Iterable, Tuple
+
+import numpy as np
+
+from app.utils.aggregation import PolygonAggregator
+from app.utils.spatial import PointInPolygonEngine
+
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def mix64(values: np.ndarray) -> np.ndarray:
+    """Hash 64-bit (finalizer splitmix64) yang stabil antar proses, tervektorisasi."""
+    values = np.asarray(values, dtype=np.uint64)
+    values = (values ^ (values >> np.uint64(30))) * _MIX_1
+    values = (values ^ (values >> np.uint64(27))) * _MIX_2
+    return values ^ (values >> np.uint64(31))
+
+
+def coordinate_hash(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Hash 64-bit dari pasangan koordinat float64."""
+    x_bits = np.ascontiguousarray(xs, dtype=np.float64).view(np.uint64)
+    y_bits = np.ascontiguousarray(ys, dtype=np.float64).view(np.uint64)
+    return mix64(x_bits ^ mix64(y_bits))
+
+
+def feature_keys(keys: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Key state setiap feature: gabungan key feature dan hash koordinatnya.
+
+    Key berubah jika feature berpindah koordinat, sehingga key yang sama berarti hasil
+    join yang sama. Feature kembar (key dan koordinat sama) memang selalu jatuh ke
+    poligon yang sama sehingga tidak perlu dibedakan.
+    """
+    return mix64(mix64(np.asarray(keys, dtype=np.uint64)) ^ coordinate_hash(xs, ys))
+
+
+class AssignmentState:
+    """
+    Hasil spatial join per feature dari perhitungan sebelumnya untuk satu sumber data.
+
+    Disimpan ringkas, sekitar 12 byte per feature: key feature terurut (lihat
+    `feature_keys`) dan poligon pertama setiap feature (-1 jika di luar semua poligon).
+    Feature di poligon yang tumpang tindih menyimpan poligon berikutnya di pasangan
+    `extra_owners`/`extra_polygons`, sehingga tercatat sekali per poligon seperti join penuh.
+    """
+
+    def __init__(self, keys: np.ndarray, polygons: np.ndarray, extra_owners: np.ndarray, extra_polygons: np.ndarray):
+        self.keys = keys
+        self.polygons = polygons
+        self.extra_owners = extra_owners
+        self.extra_polygons = extra_polygons
+
+    @classmethod
+    def empty(cls) -> "AssignmentState":
+        empty_idx = np.empty(0, dtype=np.int32)
+        return cls(np.empty(0, dtype=np.uint64), empty_idx, np.empty(0, dtype=np.intp), empty_idx)
+
+    @property
+    def nbytes(self) -> int:
+        return self.keys.nbytes + self.polygons.nbytes + self.extra_owners.nbytes + self.extra_polygons.nbytes
+
+    def update(
+        self,
+        engine: PointInPolygonEngine,
+        point_chunks: Iterable[Any],
+        aggregator: PolygonAggregator,
+    ) -> Tuple["AssignmentState", int]:
+        """
+        Terapkan dokumen baru terhadap state ini, chunk demi chunk.
+
+        Feature yang key dan koordinatnya tidak berubah memakai poligon dari state lama;
+        hanya feature baru atau yang berpindah yang di-join ulang. Pasangan (feature,
+        poligon) setiap chunk langsung dimasukkan ke `aggregator`, sehingga yang ditahan
+        di memori hanya satu chunk titik ditambah state baru.
+
+        Args:
+            engine: Engine point-in-polygon boundary
+            point_chunks: `PointChunk` dokumen baru, wajib memiliki `keys`
+            aggregator: Akumulator agregat per poligon
+
+        Returns:
+            Tuple[AssignmentState, int]: State baru dan jumlah feature yang di-join ulang
+        """
+        keys, polygons, extra_owners, extra_polygons = [], [], [], []
+        offset = 0
+        joined = 0
+
+        for chunk in point_chunks:
+            chunk_keys = feature_keys(chunk.keys, chunk.x, chunk.y)
+            chunk_polygons = np.full(chunk_keys.size, -1, dtype=np.int32)
+
+            reused = np.zeros(chunk_keys.size, dtype=bool)
+            if self.keys.size:
+                pos = np.minimum(np.searchsorted(self.keys, chunk_keys), self.keys.size - 1)
+                reused = self.keys[pos] == chunk_keys
+                chunk_polygons[reused] = self.polygons[pos[reused]]
+                extra_points, extra_idx = self._extras(np.flatnonzero(reused), pos[reused])
+            else:
+                extra_points, extra_idx = _EMPTY_PAIRS
+
+            changed = np.flatnonzero(~reused)
+            point_idx, polygon_idx = engine.join(chunk.x[changed], chunk.y[changed])
+            point_idx = changed[point_idx]
+            first = np.zeros(point_idx.size, dtype=bool)
+            first[np.unique(point_idx, return_index=True)[1]] = True
+            chunk_polygons[point_idx[first]] = polygon_idx[first]
+            extra_points = np.concatenate((extra_points, point_idx[~first]))
+            extra_idx = np.concatenate((extra_idx, polygon_idx[~first])).astype(np.int32)
+
+            inside = np.flatnonzero(chunk_polygons >= 0)
+            pair_points = np.concatenate((inside, extra_points))
+            pair_polygons = np.concatenate((chunk_polygons[inside], extra_idx))
+            aggregator.update(pair_polygons, chunk.values[pair_points] if chunk.values is not None else None)
+
+            keys.append(chunk_keys)
+            polygons.append(chunk_polygons)
+            extra_owners.append(extra_points + offset)
+            extra_polygons.append(extra_idx)
+            offset += chunk_keys.size
+            joined += int(changed.size)
+
+        if not keys:
+            return AssignmentState.empty(), 0
+
+        keys = np.concatenate(keys)
+        order = np.argsort(keys, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+
+        owners = rank[np.concatenate(extra_owners)]
+        extra_order = np.argsort(owners, kind="stable")
+        state = AssignmentState(
+            keys[order], np.concatenate(polygons)[order], owners[extra_order], np.concatenate(extra_polygons)[extra_order]
+        )
+        return state, joined
+
+    def _extras(self, points: np.ndarray, old_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Poligon tambahan dari state lama untuk feature yang dipakai ulang."""
+        if not self.extra_owners.size or not points.size:
+            return _EMPTY_PAIRS
+
+        starts = np.searchsorted(self.extra_owners, old_idx, "left")
+        counts = np.searchsorted(self.extra_owners, old_idx, "right") - starts
+        if not counts.any():
+            return _EMPTY_PAIRS
+
+        flat = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return np.repeat(points, counts), self.extra_polygons[flat]
+
+
+_EMPTY_PAIRS = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int32))
@@ -0,0 +1,86 @@
+import math
+from enum import Enum
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+_SQRT3 = math.sqrt(3)
+
+# Offset sudut hexagon pointy-top (sudut 30 + 60k derajat) untuk jari-jari 1.
+_HEXAGON_CORNERS = np.array(
+    [(math.cos(math.radians(30 + 60 * k)), math.sin(math.radians(30 + 60 * k))) for k in range(6)]
+)
+_SQUARE_CORNERS = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=np.float64)
+
+
+class BinShape(str, Enum):
+    hexagon = "hexagon"
+    square = "square"
+
+
+def bin_cells(xs: np.ndarray, ys: np.ndarray, cell_size: float, shape: BinShape) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tentukan sel grid setiap titik.
+
+    Hexagon memakai koordinat axial (q, r) pointy-top dengan `cell_size` sebagai jari-jari
+    (pusat ke sudut); titik dibulatkan ke hexagon terdekat lewat pembulatan koordinat
+    kubus. Persegi memakai indeks kolom/baris dengan `cell_size` sebagai panjang sisi.
+
+    Args:
+        xs, ys: Koordinat titik dalam derajat
+        cell_size: Ukuran sel dalam derajat
+        shape: Bentuk sel
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Indeks sel (kolom/q, baris/r) setiap titik
+    """
+    if shape == BinShape.square:
+        return np.floor(xs / cell_size).astype(np.int64), np.floor(ys / cell_size).astype(np.int64)
+
+    q = (_SQRT3 / 3 * xs - ys / 3) / cell_size
+    r = (2 / 3 * ys) / cell_size
+    s = -q - r
+
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+def group_cells(columns: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kelompokkan indeks sel menjadi daftar sel unik.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Kolom dan baris setiap sel unik, serta
+        posisi sel unik untuk setiap titik
+    """
+    if columns.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    column_min = columns.min()
+    width = int(columns.max() - column_min) + 1
+    keys = (rows - rows.min()) * width + (columns - column_min)
+
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return columns[first], rows[first], inverse
+
+
+def cell_polygons(
+    columns: np.ndarray, rows: np.ndarray, cell_size: float, shape: BinShape
+) -> List[Dict[str, List]]:
+    """Geometri GeoJSON Polygon untuk setiap sel."""
+    if shape == BinShape.square:
+        origins = np.column_stack((columns, rows)).astype(np.float64) * cell_size
+        corners = origins[:, None, :] + _SQUARE_CORNERS[None, :, :] * cell_size
+    else:
+        centers = np.column_stack((cell_size * _SQRT3 * (columns + rows / 2), cell_size * 1.5 * rows))
+        corners = centers[:, None, :] + _HEXAGON_CORNERS[None, :, :] * cell_size
+
+    rings = np.concatenate((corners, corners[:, :1, :]), axis=1).tolist()
+    return [{"type": "Polygon", "coordinates": [ring]} for ring in rings]
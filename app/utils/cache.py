@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Cache LRU thread-safe yang dibatasi jumlah item dan/atau total ukuran.
+
+    Args:
+        maxsize: Jumlah item maksimal, None berarti tidak dibatasi
+        max_bytes: Total ukuran maksimal menurut `sizeof`, None berarti tidak dibatasi
+        sizeof: Fungsi untuk menghitung ukuran sebuah value
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda value: 0)
+        self.current_bytes = 0
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: K, value: V) -> None:
+        """Simpan value. Value yang lebih besar dari `max_bytes` tidak disimpan."""
+        with self._lock:
+            self.pop(key)
+
+            size = self.sizeof(value)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            self._data[key] = value
+            self.current_bytes += size
+            self._evict()
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            if key not in self._data:
+                return default
+            value = self._data.pop(key)
+            self.current_bytes -= self.sizeof(value)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.current_bytes = 0
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self.maxsize is not None and len(self._data) > self.maxsize)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            _, value = self._data.popitem(last=False)
+            self.current_bytes -= self.sizeof(value)
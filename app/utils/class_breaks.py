@@ -0,0 +1,238 @@
+from enum import Enum
+from typing import Dict, List, Tuple
+
+import numpy as np
+from colour import Color
+
+NO_DATA_COLOR = "#FFFFFFFF"
+DEFAULT_CLASSES = 5
+
+
+class ClassificationMethod(str, Enum):
+    quantile = "quantile"
+    equal_interval = "equal_interval"
+    natural_breaks = "natural_breaks"
+    std_dev = "std_dev"
+
+
+def compute_breaks(
+    values: np.ndarray,
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    classes: int = DEFAULT_CLASSES,
+    integer: bool = True,
+    zero_is_no_data: bool = True,
+) -> np.ndarray:
+    """
+    Hitung batas kelas (class break) dari nilai choropleth.
+
+    Nilai tanpa data (NaN, serta 0 jika `zero_is_no_data`) diabaikan karena masuk kelas
+    "tanpa data". Untuk data integer (misal jumlah titik) batas kelas dibulatkan ke atas.
+
+    Args:
+        values: Nilai choropleth per poligon
+        method: Metode klasifikasi
+        classes: Jumlah kelas yang diinginkan
+        integer: Bulatkan batas kelas ke atas
+        zero_is_no_data: Nilai 0 berarti tanpa data, seperti jumlah titik pada agregat count
+
+    Returns:
+        np.ndarray: Batas kelas terurut, termasuk nilai minimum dan maksimum
+    """
+    data = np.sort(np.asarray(values, dtype=np.float64))
+    data = data[~_no_data(data, zero_is_no_data)]
+
+    if data.size <= 1:
+        return _round(data, integer)
+
+    if method == ClassificationMethod.quantile:
+        return _quantile_breaks(data, classes, integer)
+
+    if method == ClassificationMethod.equal_interval:
+        breaks = np.linspace(data[0], data[-1], classes + 1)
+    elif method == ClassificationMethod.natural_breaks:
+        breaks = _jenks_breaks(data, classes)
+    elif method == ClassificationMethod.std_dev:
+        offsets = np.arange(1, classes) - classes / 2
+        inner = data.mean() + offsets * data.std()
+        inner = inner[(inner > data[0]) & (inner < data[-1])]
+        breaks = np.concatenate(([data[0]], inner, [data[-1]]))
+    else:
+        raise ValueError(f"Metode klasifikasi tidak dikenal: {method}")
+
+    return np.unique(_round(breaks, integer))
+
+
+def build_rangelist(
+    breaks: np.ndarray, color_range: List[str], integer: bool = True, zero_is_no_data: bool = True
+) -> List[Dict]:
+    """
+    Susun daftar rentang kelas untuk legenda.
+
+    Rentang pertama selalu kelas "tanpa data": `from`/`to` bernilai 0 jika 0 berarti tanpa
+    data, selain itu None. Untuk data integer, batas bawah setiap kelas setelah kelas
+    pertama adalah batas atas kelas sebelumnya + 1.
+    """
+    no_data = 0 if zero_is_no_data else None
+    rangelist = [{"from": no_data, "to": no_data, "color": NO_DATA_COLOR, "total_cluster": 0}]
+    breaks = [_to_python(value) for value in breaks]
+
+    if len(breaks) > 1:
+        colors = list(Color(color_range[0]).range_to(Color(color_range[1]), len(breaks) - 1))
+        for i in range(len(breaks) - 1):
+            lower = breaks[i] + 1 if integer and i > 0 else breaks[i]
+            rangelist.append({"from": lower, "to": breaks[i + 1], "color": colors[i].hex, "total_cluster": 0})
+    elif len(breaks) == 1:
+        colors = list(Color(color_range[0]).range_to(Color(color_range[1]), 1))
+        rangelist.append({"from": breaks[0], "to": breaks[0], "color": colors[0].hex, "total_cluster": 0})
+
+    return rangelist
+
+
+def assign_classes(values: np.ndarray, rangelist: List[Dict], zero_is_no_data: bool = True) -> np.ndarray:
+    """
+    Tentukan indeks rentang untuk setiap nilai.
+
+    Nilai tanpa data mendapat indeks 0. Nilai lain dicari dengan `np.searchsorted` atas
+    batas atas kelas data (`rangelist[1:]`, terurut naik), sehingga nilai negatif dan 0
+    tetap masuk kelasnya. Nilai pada batas dua rentang masuk ke rentang yang lebih rendah;
+    nilai yang tidak masuk rentang mana pun mendapat indeks -1. `total_cluster` di
+    `rangelist` ikut diperbarui.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    classes = rangelist[1:]
+    lowers = np.array([item["from"] for item in classes], dtype=np.float64)
+    uppers = np.array([item["to"] for item in classes], dtype=np.float64)
+
+    no_data = _no_data(values, zero_is_no_data)
+    position = np.searchsorted(uppers, values, side="left")
+    in_range = ~no_data & (position < len(classes))
+    in_range[in_range] = values[in_range] >= lowers[position[in_range]]
+
+    index = np.where(in_range, position + 1, -1)
+    index[no_data] = 0
+
+    totals = np.bincount(index[index >= 0], minlength=len(rangelist))
+    for item, total in zip(rangelist, totals):
+        item["total_cluster"] = int(total)
+
+    return index
+
+
+def classify(
+    values: np.ndarray,
+    color_range: List[str],
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    classes: int = DEFAULT_CLASSES,
+    integer: bool = True,
+    zero_is_no_data: bool = True,
+) -> Tuple[np.ndarray, List[Dict]]:
+    """
+    Klasifikasikan nilai choropleth.
+
+    Returns:
+        Tuple[np.ndarray, List[Dict]]:
+            - Indeks rentang untuk setiap nilai (0 untuk tanpa data, -1 jika tidak masuk rentang)
+            - Daftar rentang untuk legenda
+    """
+    breaks = compute_breaks(values, method, classes, integer, zero_is_no_data)
+    rangelist = build_rangelist(breaks, color_range, integer, zero_is_no_data)
+    return assign_classes(values, rangelist, zero_is_no_data), rangelist
+
+
+def _quantile_breaks(data: np.ndarray, classes: int, integer: bool) -> np.ndarray:
+    # Jumlah kelas dikurangi selama masih ada batas kelas yang sama, seperti perilaku awal.
+    breaks = data
+    for count in range(classes, 0, -1):
+        breaks = _round(np.percentile(data, np.arange(count + 1) * (100 / count)), integer)
+        if np.unique(breaks).size == breaks.size:
+            break
+        data = breaks
+
+    return breaks
+
+
+def _jenks_breaks(data: np.ndarray, classes: int) -> np.ndarray:
+    """
+    Natural breaks (Fisher-Jenks) dengan dynamic programming atas nilai unik berbobot.
+
+    Titik potong optimal bersifat monoton terhadap batas akhir kelas, sehingga setiap
+    lapisan DP diselesaikan dengan divide-and-conquer. Semua interval pada satu level
+    rekursi dihitung sekaligus dengan operasi NumPy, total O(k * n log n).
+    """
+    uniques, weights = np.unique(data, return_counts=True)
+    n = uniques.size
+    if n <= classes:
+        return uniques
+
+    weights = weights.astype(np.float64)
+    cum_w = np.concatenate(([0.0], np.cumsum(weights)))
+    cum_x = np.concatenate(([0.0], np.cumsum(weights * uniques)))
+    cum_x2 = np.concatenate(([0.0], np.cumsum(weights * uniques**2)))
+
+    def segment_cost(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        seg_x = cum_x[ends] - cum_x[starts]
+        return cum_x2[ends] - cum_x2[starts] - seg_x**2 / (cum_w[ends] - cum_w[starts])
+
+    # cost[c, j]: SSD minimum untuk membagi j nilai pertama ke dalam c kelas.
+    cost = np.full((classes + 1, n + 1), np.inf)
+    cost[1, 1:] = segment_cost(np.zeros(n, dtype=np.intp), np.arange(1, n + 1))
+    back = np.zeros((classes + 1, n + 1), dtype=np.intp)
+
+    for c in range(2, classes + 1):
+        # Setiap interval: batas akhir [lo, hi] dengan kandidat titik potong [opt_lo, opt_hi].
+        lo = np.array([c])
+        hi = np.array([n])
+        opt_lo = np.array([c - 1])
+        opt_hi = np.array([n - 1])
+
+        while lo.size:
+            mid = (lo + hi) // 2
+            cand_hi = np.minimum(mid - 1, opt_hi)
+            lengths = cand_hi - opt_lo + 1
+
+            owner = np.repeat(np.arange(mid.size), lengths)
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            starts = opt_lo[owner] + np.arange(owner.size) - offsets[owner]
+            ends = mid[owner]
+
+            total = cost[c - 1, starts] + segment_cost(starts, ends)
+            minimum = np.minimum.reduceat(total, offsets)
+            first = np.flatnonzero(total == minimum[owner])
+            _, best_pos = np.unique(owner[first], return_index=True)
+            best = starts[first[best_pos]]
+
+            cost[c, mid] = minimum
+            back[c, mid] = best
+
+            left = mid - 1 >= lo
+            right = mid + 1 <= hi
+            lo, hi, opt_lo, opt_hi = (
+                np.concatenate((lo[left], mid[right] + 1)),
+                np.concatenate((mid[left] - 1, hi[right])),
+                np.concatenate((opt_lo[left], best[right])),
+                np.concatenate((best[left], opt_hi[right])),
+            )
+
+    class_ends = []
+    end = n
+    for c in range(classes, 0, -1):
+        class_ends.append(end)
+        end = back[c, end]
+
+    return np.array([uniques[0]] + [uniques[end - 1] for end in reversed(class_ends)])
+
+
+def _no_data(values: np.ndarray, zero_is_no_data: bool) -> np.ndarray:
+    no_data = np.isnan(values)
+    if zero_is_no_data:
+        no_data |= values == 0
+    return no_data
+
+
+def _round(values: np.ndarray, integer: bool) -> np.ndarray:
+    return np.ceil(values) if integer else np.asarray(values, dtype=np.float64)
+
+
+def _to_python(value: float) -> float | int:
+    value = float(value)
+    return int(value) if value.is_integer() else value
@@ -0,0 +1,197 @@
+import math
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+def lonlat_to_unit(lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Proyeksikan lon/lat ke Web Mercator ternormalisasi [0, 1] (sumbu y ke bawah)."""
+    lat = np.clip(lat, -85.05112878, 85.05112878)
+    x = np.asarray(lon, dtype=np.float64) / 360 + 0.5
+    sin = np.sin(np.radians(lat))
+    y = 0.5 - 0.25 * np.log((1 + sin) / (1 - sin)) / math.pi
+    return x, np.clip(y, 0, 1)
+
+
+def unit_to_lonlat(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    lon = (x - 0.5) * 360
+    lat = np.degrees(2 * np.arctan(np.exp((0.5 - y) * 2 * math.pi)) - math.pi / 2)
+    return lon, lat
+
+
+class _Level:
+    """Titik/cluster pada satu level zoom, terurut berdasarkan x untuk query bbox."""
+
+    __slots__ = ("x", "y", "count", "parent", "child", "expansion_zoom")
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, count: np.ndarray, child: np.ndarray):
+        self.x = x
+        self.y = y
+        self.count = count
+        self.child = child
+        self.parent = np.empty(0, dtype=np.int64)
+        self.expansion_zoom = np.empty(0, dtype=np.int16)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+
+class ClusterIndex:
+    """
+    Index cluster titik hierarkis berbasis grid (gaya supercluster).
+
+    Untuk setiap zoom dari `max_zoom` hingga `min_zoom`, cluster level sebelumnya
+    dikelompokkan ke grid berukuran `radius` piksel (tile `extent` piksel) dengan
+    centroid berbobot jumlah titik. Ukuran sel berlipat dua setiap naik satu level
+    sehingga cluster bersarang sempurna. Index dibangun sekali dengan operasi NumPy;
+    query bbox cukup `searchsorted` pada level yang diminta.
+
+    Level `max_zoom + 1` berisi titik asli.
+    """
+
+    def __init__(
+        self,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        min_zoom: int = 0,
+        max_zoom: int = 16,
+        radius: float = 40,
+        extent: int = 512,
+    ):
+        x, y = lonlat_to_unit(lon, lat)
+        self._build(x, y, min_zoom, max_zoom, radius, extent)
+
+    @classmethod
+    def from_chunks(
+        cls,
+        point_chunks: Iterable[Any],
+        min_zoom: int = 0,
+        max_zoom: int = 16,
+        radius: float = 40,
+        extent: int = 512,
+    ) -> "ClusterIndex":
+        """
+        Bangun index dari chunk titik (`PointChunk`) yang di-stream.
+
+        Koordinat diproyeksikan per chunk dan hanya hasil proyeksinya yang disimpan,
+        sehingga chunk sumber (beserta nilai dan key-nya) tidak ditahan sampai index selesai.
+        """
+        xs, ys = [], []
+        for chunk in point_chunks:
+            x, y = lonlat_to_unit(chunk.x, chunk.y)
+            xs.append(x)
+            ys.append(y)
+
+        x = np.concatenate(xs) if xs else np.empty(0)
+        y = np.concatenate(ys) if ys else np.empty(0)
+        del xs, ys
+
+        index = cls.__new__(cls)
+        index._build(x, y, min_zoom, max_zoom, radius, extent)
+        return index
+
+    def _build(self, x: np.ndarray, y: np.ndarray, min_zoom: int, max_zoom: int, radius: float, extent: int) -> None:
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.levels: Dict[int, _Level] = {}
+
+        order = np.argsort(x, kind="stable")
+        self.levels[max_zoom + 1] = _Level(x[order], y[order], np.ones(order.size, dtype=np.int64), order)
+
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            self.levels[zoom] = self._cluster(self.levels[zoom + 1], radius / (extent * 2**zoom))
+
+        self._set_expansion_zoom()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(level.nbytes for level in self.levels.values())
+
+    def __len__(self) -> int:
+        return self.levels[self.max_zoom + 1].x.size
+
+    def query(self, bbox: Tuple[float, float, float, float], zoom: float) -> List[Dict]:
+        """
+        Ambil cluster/titik di dalam bbox pada level zoom tertentu.
+
+        Args:
+            bbox: (min lon, min lat, max lon, max lat)
+            zoom: Level zoom peta
+
+        Returns:
+            List[Dict]: Feature GeoJSON Point; cluster memiliki `cluster`, `point_count`,
+            `cluster_id` dan `expansion_zoom`, titik asli memiliki `index` (urutan di sumber data)
+        """
+        zoom = int(min(max(math.floor(zoom), self.min_zoom), self.max_zoom + 1))
+        level = self.levels[zoom]
+
+        # Sumbu y Web Mercator ternormalisasi mengarah ke bawah: lintang minimum menjadi y maksimum.
+        (min_x, max_x), (max_y, min_y) = lonlat_to_unit(np.array(bbox[0::2], float), np.array(bbox[1::2], float))
+        candidates = np.arange(np.searchsorted(level.x, min_x, "left"), np.searchsorted(level.x, max_x, "right"))
+        candidates = candidates[(level.y[candidates] >= min_y) & (level.y[candidates] <= max_y)]
+
+        lon, lat = unit_to_lonlat(level.x[candidates], level.y[candidates])
+        features = []
+        for i, item_lon, item_lat in zip(candidates.tolist(), lon.tolist(), lat.tolist()):
+            count = int(level.count[i])
+            if count > 1:
+                properties = {
+                    "cluster": True,
+                    "cluster_id": self.cluster_id(zoom, i),
+                    "point_count": count,
+                    "expansion_zoom": int(level.expansion_zoom[i]),
+                }
+            else:
+                properties = {"cluster": False, "point_count": 1, "index": self._leaf_index(zoom, i)}
+            geometry = {"type": "Point", "coordinates": [item_lon, item_lat]}
+            features.append({"type": "Feature", "geometry": geometry, "properties": properties})
+        return features
+
+    def cluster_id(self, zoom: int, index: int) -> int:
+        return (index << 5) | zoom
+
+    def _leaf_index(self, zoom: int, index: int) -> int:
+        # Cluster berisi satu titik hanya punya satu anak di setiap level di bawahnya.
+        while zoom <= self.max_zoom:
+            index = int(self.levels[zoom].child[index])
+            zoom += 1
+        return int(self.levels[zoom].child[index])
+
+    def _cluster(self, child: _Level, cell: float) -> _Level:
+        if child.x.size == 0:
+            empty = np.empty(0, dtype=np.int64)
+            child.parent = empty
+            return _Level(child.x, child.y, child.count, empty)
+
+        columns = np.floor(child.x / cell).astype(np.int64)
+        rows = np.floor(child.y / cell).astype(np.int64)
+        cells = rows * (int(1 / cell) + 2) + columns
+
+        _, first, parent = np.unique(cells, return_index=True, return_inverse=True)
+        weights = child.count.astype(np.float64)
+        count = np.bincount(parent, weights=weights).astype(np.int64)
+        x = np.bincount(parent, weights=child.x * weights) / count
+        y = np.bincount(parent, weights=child.y * weights) / count
+
+        order = np.argsort(x, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        child.parent = rank[parent]
+
+        return _Level(x[order], y[order], count[order], first[order])
+
+    def _set_expansion_zoom(self) -> None:
+        # Zoom ekspansi: zoom pertama di mana cluster pecah menjadi lebih dari satu anak.
+        deepest = self.levels[self.max_zoom + 1]
+        deepest.expansion_zoom = np.full(deepest.x.size, self.max_zoom + 1, dtype=np.int16)
+
+        for zoom in range(self.max_zoom, self.min_zoom - 1, -1):
+            level = self.levels[zoom]
+            child = self.levels[zoom + 1]
+            children = np.bincount(child.parent, minlength=level.x.size)
+
+            expansion = np.full(level.x.size, zoom + 1, dtype=np.int16)
+            single = children == 1
+            expansion[single] = child.expansion_zoom[level.child[single]]
+            level.expansion_zoom = expansion
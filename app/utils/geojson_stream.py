@@ -0,0 +1,174 @@
+import codecs
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional
+
+import numpy as np
+import orjson
+
+from app.utils.assignment import coordinate_hash
+
+FEATURES_ARRAY_PATTERN = re.compile(r'"features"\s*:\s*\[')
+WHITESPACE = " \t\n\r"
+
+
+def iter_features(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse FeatureCollection GeoJSON secara bertahap dan hasilkan feature satu per satu.
+
+    Hanya satu feature (plus sisa chunk yang belum di-parse) yang ada di memori pada
+    satu waktu, sehingga dokumen besar tidak perlu dimuat utuh.
+
+    Args:
+        chunks: Potongan bytes dokumen GeoJSON secara berurutan
+
+    Raises:
+        ValueError: Jika dokumen tidak memiliki array `features` atau formatnya rusak
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+
+    buffer = ""
+    pos = 0
+    exhausted = False
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, exhausted
+        for chunk in chunks:
+            text = text_decoder.decode(chunk)
+            if text:
+                buffer = buffer[pos:] + text
+                pos = 0
+                return True
+        if not exhausted:
+            exhausted = True
+            buffer = buffer[pos:] + text_decoder.decode(b"", final=True)
+            pos = 0
+        return False
+
+    while True:
+        match = FEATURES_ARRAY_PATTERN.search(buffer, pos)
+        if match:
+            pos = match.end()
+            break
+        pos = max(pos, len(buffer) - 32)
+        if not read_more():
+            raise ValueError("GeoJSON tidak memiliki array features")
+
+    min_length = 0
+    while True:
+        while pos < len(buffer) and buffer[pos] in WHITESPACE + ",":
+            pos += 1
+
+        if pos >= len(buffer) or (len(buffer) - pos < min_length and not exhausted):
+            if not read_more() and pos >= len(buffer):
+                raise ValueError("Array features GeoJSON tidak ditutup")
+            continue
+
+        if buffer[pos] == "]":
+            return
+
+        try:
+            feature, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise ValueError("Format GeoJSON tidak valid")
+            # Feature belum lengkap: tunggu sampai buffer cukup besar agar feature
+            # yang panjang tidak di-parse ulang pada setiap chunk.
+            min_length = 2 * (len(buffer) - pos)
+            read_more()
+            continue
+
+        min_length = 0
+        pos = end
+        yield feature
+
+
+class PointChunk(NamedTuple):
+    x: np.ndarray
+    y: np.ndarray
+    values: Optional[np.ndarray] = None
+    keys: Optional[np.ndarray] = None
+
+
+def iter_point_chunks(
+    features: Iterable[Dict[str, Any]],
+    coordinate_field: str = "coordinates",
+    chunk_size: int = 65536,
+    value_field: Optional[str] = None,
+    with_keys: bool = False,
+) -> Iterator[PointChunk]:
+    """
+    Kumpulkan koordinat feature Point ke dalam array NumPy berukuran tetap.
+
+    Args:
+        features: Iterable feature GeoJSON
+        coordinate_field: Nama field yang berisi koordinat di dalam geometri
+        chunk_size: Jumlah titik maksimal per chunk
+        value_field: Nama properti numerik yang ikut diambil, NaN jika kosong atau bukan angka
+        with_keys: Sertakan key 64-bit setiap feature, dari hash `id` feature atau dari
+            hash koordinat jika feature tidak memiliki `id`
+
+    Raises:
+        ValueError: Jika koordinat titik bukan angka
+
+    Returns:
+        Iterator[PointChunk]: Chunk koordinat (dan nilai properti) titik
+    """
+    xs = np.empty(chunk_size, dtype=np.float64)
+    ys = np.empty(chunk_size, dtype=np.float64)
+    values = np.empty(chunk_size, dtype=np.float64) if value_field else None
+    keys = np.empty(chunk_size, dtype=np.uint64) if with_keys else None
+    has_id = np.empty(chunk_size, dtype=bool) if with_keys else None
+    size = 0
+
+    def flush(size: int) -> PointChunk:
+        chunk_keys = None
+        if with_keys:
+            chunk_keys = keys[:size].copy()
+            no_id = ~has_id[:size]
+            chunk_keys[no_id] = coordinate_hash(xs[:size][no_id], ys[:size][no_id])
+        return PointChunk(xs[:size].copy(), ys[:size].copy(), values[:size].copy() if value_field else None, chunk_keys)
+
+    for feature in features:
+        geometry = feature.get("geometry") if isinstance(feature, dict) else None
+        if not isinstance(geometry, dict) or geometry.get("type") != "Point" or coordinate_field not in geometry:
+            continue
+
+        coords = geometry[coordinate_field]
+        if not isinstance(coords, (list, tuple)) or len(coords) < 2:
+            continue
+
+        try:
+            xs[size] = coords[0]
+            ys[size] = coords[1]
+        except (TypeError, ValueError):
+            raise ValueError("Koordinat titik GeoJSON tidak valid")
+        if value_field:
+            properties = feature.get("properties")
+            values[size] = _to_float(properties.get(value_field) if isinstance(properties, dict) else None)
+        if with_keys:
+            feature_id = feature.get("id")
+            has_id[size] = feature_id is not None
+            keys[size] = _id_hash(feature_id) if feature_id is not None else 0
+        size += 1
+
+        if size == chunk_size:
+            yield flush(size)
+            size = 0
+
+    if size:
+        yield flush(size)
+
+
+def _id_hash(value: Any) -> int:
+    return int.from_bytes(hashlib.blake2b(orjson.dumps(value), digest_size=8).digest(), "little")
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -0,0 +1,247 @@
+import math
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+EXTENT = 4096
+EARTH_HALF_CIRCUMFERENCE = 20037508.342789244
+
+_GEOM_POLYGON = 3
+_CMD_MOVE_TO = 1
+_CMD_LINE_TO = 2
+_CMD_CLOSE_PATH = 7
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """Batas tile dalam koordinat Web Mercator (EPSG:3857): (minx, miny, maxx, maxy)."""
+    size = 2 * EARTH_HALF_CIRCUMFERENCE / (1 << z)
+    minx = -EARTH_HALF_CIRCUMFERENCE + x * size
+    maxy = EARTH_HALF_CIRCUMFERENCE - y * size
+    return minx, maxy - size, minx + size, maxy
+
+
+def lonlat_to_mercator(coords: np.ndarray) -> np.ndarray:
+    """Proyeksikan koordinat (lon, lat) ke Web Mercator. Dipakai dengan `shapely.transform`."""
+    lon = coords[:, 0]
+    lat = np.clip(coords[:, 1], -85.05112878, 85.05112878)
+    x = lon * EARTH_HALF_CIRCUMFERENCE / 180
+    y = np.log(np.tan((90 + lat) * math.pi / 360)) * EARTH_HALF_CIRCUMFERENCE / math.pi
+    return np.column_stack((x, y))
+
+
+def to_tile_geometry(
+    geometry: BaseGeometry,
+    bounds: Tuple[float, float, float, float],
+    extent: int = EXTENT,
+    buffer: int = 64,
+) -> Optional[BaseGeometry]:
+    """
+    Potong dan sederhanakan geometri Web Mercator lalu ubah ke koordinat integer tile.
+
+    Geometri disederhanakan dengan toleransi satu unit tile sehingga jumlah vertex
+    sebanding dengan resolusi tile, lalu dipotong ke area tile ditambah `buffer` unit.
+
+    Returns:
+        Optional[BaseGeometry]: Geometri dalam koordinat tile (sumbu y ke bawah), atau None
+        jika tidak ada bagian yang tersisa setelah dipotong
+    """
+    minx, miny, maxx, maxy = bounds
+    scale = extent / (maxx - minx)
+    margin = buffer / scale
+
+    geometry = shapely.clip_by_rect(geometry, minx - margin, miny - margin, maxx + margin, maxy + margin)
+    if geometry.is_empty:
+        return None
+
+    geometry = shapely.simplify(geometry, 1 / scale, preserve_topology=True)
+    geometry = shapely.transform(
+        geometry, lambda coords: np.column_stack(((coords[:, 0] - minx) * scale, (maxy - coords[:, 1]) * scale))
+    )
+    geometry = shapely.set_precision(geometry, 1.0)
+    if geometry.is_empty:
+        return None
+
+    return geometry
+
+
+def encode_tile(layers: Iterable[Tuple[str, Sequence[Optional[BaseGeometry]], Sequence[Dict[str, Any]]]]) -> bytes:
+    """
+    Encode Mapbox Vector Tile (spesifikasi v2) tanpa dependensi protobuf.
+
+    Args:
+        layers: Tuple (nama layer, geometri dalam koordinat tile, atribut per feature).
+            Geometri None atau kosong dilewati; indeks geometri dipakai sebagai id feature.
+
+    Returns:
+        bytes: Isi tile dalam format protobuf
+    """
+    tile = bytearray()
+    for name, geometries, attributes in layers:
+        layer = _encode_layer(name, geometries, attributes)
+        if layer:
+            tile += _field_bytes(3, layer)
+    return bytes(tile)
+
+
+def _encode_layer(
+    name: str, geometries: Sequence[Optional[BaseGeometry]], attributes: Sequence[Dict[str, Any]]
+) -> bytes:
+    keys: Dict[str, int] = {}
+    values: Dict[Tuple[str, Any], int] = {}
+    features = bytearray()
+
+    for feature_id, (geometry, properties) in enumerate(zip(geometries, attributes)):
+        if geometry is None or geometry.is_empty:
+            continue
+
+        commands = _encode_polygons(geometry)
+        if not commands:
+            continue
+
+        tags = []
+        for key, value in properties.items():
+            encoded = _value_key(value)
+            if encoded is None:
+                continue
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault(encoded, len(values)))
+
+        feature = bytearray()
+        feature += _field_varint(1, feature_id)
+        if tags:
+            feature += _field_bytes(2, _packed(tags))
+        feature += _field_varint(3, _GEOM_POLYGON)
+        feature += _field_bytes(4, _packed(commands))
+        features += _field_bytes(2, feature)
+
+    if not features:
+        return b""
+
+    layer = bytearray()
+    layer += _field_varint(15, 2)
+    layer += _field_bytes(1, name.encode())
+    layer += features
+    for key in keys:
+        layer += _field_bytes(3, key.encode())
+    for value in values:
+        layer += _field_bytes(4, _encode_value(value))
+    layer += _field_varint(5, EXTENT)
+    return bytes(layer)
+
+
+def _encode_polygons(geometry: BaseGeometry) -> List[int]:
+    commands: List[int] = []
+    cursor = [0, 0]
+
+    for polygon in shapely.get_parts(geometry):
+        if not isinstance(polygon, shapely.Polygon) or polygon.is_empty:
+            continue
+
+        exterior = _ring_coords(polygon.exterior, clockwise=True)
+        if exterior is None:
+            continue
+        _encode_ring(exterior, commands, cursor)
+
+        for interior in polygon.interiors:
+            ring = _ring_coords(interior, clockwise=False)
+            if ring is not None:
+                _encode_ring(ring, commands, cursor)
+
+    return commands
+
+
+def _ring_coords(ring: BaseGeometry, clockwise: bool) -> Optional[np.ndarray]:
+    coords = shapely.get_coordinates(ring).astype(np.int64)[:-1]
+    if len(coords) < 3:
+        return None
+
+    # Buang vertex berurutan yang sama setelah pembulatan ke grid tile.
+    keep = np.any(coords != np.roll(coords, 1, axis=0), axis=1)
+    coords = coords[keep]
+    if len(coords) < 3:
+        return None
+
+    # Di koordinat tile (sumbu y ke bawah), luas positif berarti searah jarum jam.
+    x, y = coords[:, 0], coords[:, 1]
+    area = np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+    if area == 0:
+        return None
+    if (area > 0) != clockwise:
+        coords = coords[::-1]
+    return coords
+
+
+def _encode_ring(coords: np.ndarray, commands: List[int], cursor: List[int]) -> None:
+    deltas = np.diff(coords, axis=0, prepend=[cursor])
+    zigzag = (deltas << 1) ^ (deltas >> 63)
+
+    commands.append(_command(_CMD_MOVE_TO, 1))
+    commands.extend(zigzag[0].tolist())
+    commands.append(_command(_CMD_LINE_TO, len(coords) - 1))
+    commands.extend(zigzag[1:].ravel().tolist())
+    commands.append(_command(_CMD_CLOSE_PATH, 1))
+
+    cursor[0], cursor[1] = int(coords[-1, 0]), int(coords[-1, 1])
+
+
+def _command(command_id: int, count: int) -> int:
+    return (command_id & 0x7) | (count << 3)
+
+
+def _value_key(value: Any) -> Optional[Tuple[str, Any]]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return ("bool", value)
+    if isinstance(value, int):
+        return ("int", value)
+    if isinstance(value, float):
+        return None if math.isnan(value) else ("double", value)
+    if isinstance(value, str):
+        return ("string", value)
+    return ("string", orjson.dumps(value).decode())
+
+
+def _encode_value(value: Tuple[str, Any]) -> bytes:
+    kind, data = value
+    if kind == "string":
+        return _field_bytes(1, data.encode())
+    if kind == "double":
+        return _tag(3, 1) + struct.pack("<d", data)
+    if kind == "bool":
+        return _field_varint(7, int(data))
+    if data >= 0:
+        return _field_varint(5, data)
+    return _field_varint(6, (data << 1) ^ (data >> 63))
+
+
+def _packed(values: Iterable[int]) -> bytes:
+    out = bytearray()
+    for value in values:
+        out += _varint(value)
+    return bytes(out)
+
+
+def _field_varint(field: int, value: int) -> bytes:
+    return _tag(field, 0) + _varint(value)
+
+
+def _field_bytes(field: int, data: bytes) -> bytes:
+    return _tag(field, 2) + _varint(len(data)) + data
+
+
+def _tag(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
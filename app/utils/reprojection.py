@@ -0,0 +1,168 @@
+import math
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from app.utils.geojson_stream import PointChunk
+
+WGS84 = "EPSG:4326"
+WEB_MERCATOR = "EPSG:3857"
+
+Transformer = Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+_EPSG_PATTERN = re.compile(r"^(?:EPSG\s*:?\s*)?(\d{4,5})$")
+_UTM_PATTERN = re.compile(r"^(?:WGS\s*84\s*/\s*)?UTM\s*(?:ZONE\s*)?(\d{1,2})\s*([NS])$")
+_WGS84_NAMES = {"WGS84", "WGS 84", "GEOGRAPHIC", "LATLONG", "LAT/LONG", "CRS84", "OGC:CRS84"}
+_WEB_MERCATOR_NAMES = {"WEB MERCATOR", "PSEUDO-MERCATOR", "WGS 84 / PSEUDO-MERCATOR", "GOOGLE MERCATOR", "EPSG:900913"}
+
+# Parameter elipsoid WGS84 dan proyeksi UTM.
+_A = 6378137.0
+_F = 1 / 298.257223563
+_E2 = _F * (2 - _F)
+_EP2 = _E2 / (1 - _E2)
+_K0 = 0.9996
+
+
+def normalize_crs(name: Optional[str]) -> str:
+    """
+    Normalisasi nama sistem proyeksi (misal `MapProjectionSystemModel.name`) menjadi kode EPSG.
+
+    Dikenali: kode EPSG (`EPSG:32749`, `4326`), nama WGS 84, Web Mercator dan zona UTM
+    WGS 84 (`UTM 49S`, `WGS 84 / UTM zone 49S`). Nama lain dikembalikan apa adanya agar
+    bisa diurai oleh pyproj.
+
+    Args:
+        name: Nama sistem proyeksi, None berarti WGS 84
+
+    Returns:
+        str: Kode CRS
+    """
+    if not name or not name.strip():
+        return WGS84
+
+    value = " ".join(name.strip().upper().split())
+    match = _EPSG_PATTERN.match(value)
+    if match:
+        return f"EPSG:{match.group(1)}"
+    if value in _WGS84_NAMES:
+        return WGS84
+    if value in _WEB_MERCATOR_NAMES:
+        return WEB_MERCATOR
+
+    match = _UTM_PATTERN.match(value)
+    if match and 1 <= int(match.group(1)) <= 60:
+        return f"EPSG:{(32600 if match.group(2) == 'N' else 32700) + int(match.group(1))}"
+
+    return name.strip()
+
+
+@lru_cache(maxsize=64)
+def get_transformer(source_crs: str, target_crs: str = WGS84) -> Optional[Transformer]:
+    """
+    Ambil fungsi transformasi koordinat tervektorisasi untuk pasangan CRS.
+
+    Web Mercator dan UTM WGS 84 ke WGS 84 dihitung langsung dengan NumPy. Pasangan lain
+    memakai pyproj (opsional). Transformer di-cache per pasangan CRS.
+
+    Args:
+        source_crs: CRS koordinat sumber data
+        target_crs: CRS boundary
+
+    Returns:
+        Optional[Transformer]: Fungsi `(xs, ys) -> (xs, ys)`, None jika CRS sama
+    """
+    source_crs = normalize_crs(source_crs)
+    target_crs = normalize_crs(target_crs)
+    if source_crs == target_crs:
+        return None
+
+    if target_crs == WGS84:
+        if source_crs == WEB_MERCATOR:
+            return _mercator_to_wgs84
+        zone = _utm_zone(source_crs)
+        if zone is not None:
+            return lambda xs, ys: _utm_to_wgs84(xs, ys, *zone)
+
+    return _pyproj_transformer(source_crs, target_crs)
+
+
+def reproject_chunks(point_chunks: Iterable[PointChunk], source_crs: Optional[str]) -> Iterator[PointChunk]:
+    """Transformasikan koordinat setiap chunk titik ke WGS 84, satu panggilan per chunk."""
+    transformer = get_transformer(normalize_crs(source_crs))
+    if transformer is None:
+        yield from point_chunks
+        return
+
+    for chunk in point_chunks:
+        xs, ys = transformer(chunk.x, chunk.y)
+        yield PointChunk(xs, ys, chunk.values, chunk.keys)
+
+
+def _utm_zone(crs: str) -> Optional[Tuple[int, bool]]:
+    match = re.fullmatch(r"EPSG:327(\d{2})|EPSG:326(\d{2})", crs)
+    if not match:
+        return None
+    zone = int(match.group(1) or match.group(2))
+    return (zone, match.group(1) is not None) if 1 <= zone <= 60 else None
+
+
+def _mercator_to_wgs84(xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    lon = np.degrees(xs / _A)
+    lat = np.degrees(2 * np.arctan(np.exp(ys / _A)) - math.pi / 2)
+    return lon, lat
+
+
+def _utm_to_wgs84(xs: np.ndarray, ys: np.ndarray, zone: int, south: bool) -> Tuple[np.ndarray, np.ndarray]:
+    # Invers Transverse Mercator (Snyder, "Map Projections: A Working Manual", hlm. 63-64).
+    x = xs - 500000.0
+    y = ys - 10000000.0 if south else ys
+
+    e1 = (1 - math.sqrt(1 - _E2)) / (1 + math.sqrt(1 - _E2))
+    mu = y / _K0 / (_A * (1 - _E2 / 4 - 3 * _E2**2 / 64 - 5 * _E2**3 / 256))
+    phi1 = (
+        mu
+        + (3 * e1 / 2 - 27 * e1**3 / 32) * np.sin(2 * mu)
+        + (21 * e1**2 / 16 - 55 * e1**4 / 32) * np.sin(4 * mu)
+        + (151 * e1**3 / 96) * np.sin(6 * mu)
+        + (1097 * e1**4 / 512) * np.sin(8 * mu)
+    )
+
+    sin_phi1 = np.sin(phi1)
+    cos_phi1 = np.cos(phi1)
+    tan_phi1 = np.tan(phi1)
+    c1 = _EP2 * cos_phi1**2
+    t1 = tan_phi1**2
+    n1 = _A / np.sqrt(1 - _E2 * sin_phi1**2)
+    r1 = _A * (1 - _E2) / (1 - _E2 * sin_phi1**2) ** 1.5
+    d = x / (n1 * _K0)
+
+    lat = phi1 - (n1 * tan_phi1 / r1) * (
+        d**2 / 2
+        - (5 + 3 * t1 + 10 * c1 - 4 * c1**2 - 9 * _EP2) * d**4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1**2 - 252 * _EP2 - 3 * c1**2) * d**6 / 720
+    )
+    lon = (
+        d - (1 + 2 * t1 + c1) * d**3 / 6 + (5 - 2 * c1 + 28 * t1 - 3 * c1**2 + 8 * _EP2 + 24 * t1**2) * d**5 / 120
+    ) / cos_phi1
+
+    return np.degrees(lon) + (zone * 6 - 183), np.degrees(lat)
+
+
+def _pyproj_transformer(source_crs: str, target_crs: str) -> Transformer:
+    try:
+        from pyproj import Transformer as ProjTransformer
+        from pyproj.exceptions import CRSError
+    except ImportError:
+        raise ValueError(
+            f"Reproyeksi dari {source_crs} ke {target_crs} membutuhkan paket opsional pyproj (extra `reprojection`); "
+            "tanpa pyproj hanya WGS 84, Web Mercator dan UTM WGS 84 yang didukung"
+        )
+
+    try:
+        transformer = ProjTransformer.from_crs(source_crs, target_crs, always_xy=True)
+    except CRSError:
+        raise ValueError(f"Sistem proyeksi tidak dikenali: {source_crs}")
+
+    return lambda xs, ys: transformer.transform(xs, ys)
@@ -0,0 +1,200 @@
+import importlib.util
+import json
+from enum import Enum
+from typing import Any, Iterator, Optional, Tuple
+
+import numpy as np
+import shapely
+
+from app.utils import flatgeobuf
+from app.utils.assignment import coordinate_hash
+from app.utils.geojson_stream import PointChunk, iter_features
+from app.utils.geojson_stream import iter_point_chunks as iter_geojson_point_chunks
+
+PARQUET_MAGIC = b"PAR1"
+ARROW_FILE_MAGIC = b"ARROW1"
+ARROW_STREAM_CONTINUATION = b"\xff\xff\xff\xff"
+
+# Nama kolom koordinat yang dikenali jika tabel Arrow tidak memiliki kolom geometri.
+COORDINATE_COLUMNS = (("x", "y"), ("lon", "lat"), ("longitude", "latitude"), ("lng", "lat"))
+
+
+class SourceFormat(str, Enum):
+    geojson = "geojson"
+    geoparquet = "geoparquet"
+    arrow = "arrow"
+    flatgeobuf = "flatgeobuf"
+
+
+def detect_format(head: bytes) -> SourceFormat:
+    """Tentukan format sumber data dari magic bytes di awal isi file."""
+    if head[:4] == PARQUET_MAGIC:
+        return SourceFormat.geoparquet
+    if head[:6] == ARROW_FILE_MAGIC or head[:4] == ARROW_STREAM_CONTINUATION:
+        return SourceFormat.arrow
+    if flatgeobuf.is_flatgeobuf(head):
+        return SourceFormat.flatgeobuf
+    return SourceFormat.geojson
+
+
+def missing_dependency(source_format: SourceFormat) -> Optional[str]:
+    """Nama paket opsional yang dibutuhkan untuk membaca `source_format` tetapi belum terpasang."""
+    if source_format in (SourceFormat.geoparquet, SourceFormat.arrow) and importlib.util.find_spec("pyarrow") is None:
+        return "pyarrow"
+    return None
+
+
+def iter_source_point_chunks(
+    source: Any,
+    chunk_size: int = 65536,
+    value_field: Optional[str] = None,
+    with_keys: bool = False,
+) -> Iterator[PointChunk]:
+    """
+    Baca titik dari sumber data sesuai formatnya.
+
+    GeoJSON di-parse bertahap. GeoParquet, Arrow IPC dan FlatGeobuf dibaca kolom/buffer
+    langsung ke array NumPy tanpa membuat dict per feature. Untuk format kolumnar, key
+    feature (jika diminta) selalu diambil dari hash koordinat.
+
+    Args:
+        source: `SourceEntry` sumber data
+        chunk_size: Jumlah titik maksimal per chunk
+        value_field: Nama properti/kolom numerik yang ikut diambil
+        with_keys: Sertakan key 64-bit setiap feature
+
+    Returns:
+        Iterator[PointChunk]: Chunk koordinat titik
+    """
+    source_format = source.format
+    if source_format == SourceFormat.geojson:
+        yield from iter_geojson_point_chunks(
+            iter_features(source.iter_chunks()), chunk_size=chunk_size, value_field=value_field, with_keys=with_keys
+        )
+        return
+
+    if source_format == SourceFormat.flatgeobuf:
+        chunks = flatgeobuf.iter_point_chunks(source.read(), chunk_size, value_field)
+    elif source_format == SourceFormat.geoparquet:
+        chunks = _iter_geoparquet(source.read(), chunk_size, value_field)
+    else:
+        chunks = _iter_arrow(source.read(), chunk_size, value_field)
+
+    for xs, ys, values in chunks:
+        yield PointChunk(xs, ys, values, coordinate_hash(xs, ys) if with_keys else None)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Format GeoParquet/Arrow membutuhkan paket pyarrow")
+    return pyarrow
+
+
+def _iter_geoparquet(
+    data: bytes, chunk_size: int, value_field: Optional[str]
+) -> Iterator[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+    pa = _import_pyarrow()
+    parquet = pa.parquet.ParquetFile(pa.BufferReader(data))
+    schema = parquet.schema_arrow
+
+    metadata = json.loads((schema.metadata or {}).get(b"geo", b"{}"))
+    column = metadata.get("primary_column", "geometry")
+    encoding = metadata.get("columns", {}).get(column, {}).get("encoding", "WKB").lower()
+
+    columns = [column] + ([value_field] if value_field and value_field in schema.names else [])
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=columns):
+        yield _batch_points(batch, column, encoding, value_field)
+
+
+def _iter_arrow(
+    data: bytes, chunk_size: int, value_field: Optional[str]
+) -> Iterator[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+    pa = _import_pyarrow()
+    buffer = pa.BufferReader(data)
+    if data[:6] == ARROW_FILE_MAGIC:
+        reader = pa.ipc.open_file(buffer)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        reader = pa.ipc.open_stream(buffer)
+        batches = iter(reader)
+
+    column, encoding = _geometry_column(reader.schema)
+    for batch in batches:
+        for offset in range(0, batch.num_rows, chunk_size):
+            yield _batch_points(batch.slice(offset, chunk_size), column, encoding, value_field)
+
+
+def _geometry_column(schema: Any) -> Tuple[Any, str]:
+    """Cari kolom geometri Arrow: extension GeoArrow, kolom `geometry`, atau pasangan kolom koordinat."""
+    for field in schema:
+        extension = (field.metadata or {}).get(b"ARROW:extension:name", b"").decode()
+        if extension.startswith("geoarrow."):
+            return field.name, extension.removeprefix("geoarrow.")
+
+    if "geometry" in schema.names:
+        pa = _import_pyarrow()
+        field_type = schema.field("geometry").type
+        is_binary = pa.types.is_binary(field_type) or pa.types.is_large_binary(field_type)
+        return "geometry", "wkb" if is_binary else "point"
+
+    names = {name.lower(): name for name in schema.names}
+    for x_name, y_name in COORDINATE_COLUMNS:
+        if x_name in names and y_name in names:
+            return (names[x_name], names[y_name]), "columns"
+
+    raise ValueError("Kolom geometri tidak ditemukan di tabel Arrow")
+
+
+def _batch_points(
+    batch: Any, column: Any, encoding: str, value_field: Optional[str]
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    if encoding == "columns":
+        xs = _float_array(batch.column(column[0]))
+        ys = _float_array(batch.column(column[1]))
+    elif encoding == "wkb":
+        geometries = shapely.from_wkb(batch.column(column).to_numpy(zero_copy_only=False))
+        is_point = shapely.get_type_id(geometries) == shapely.GeometryType.POINT
+        xs = np.where(is_point, shapely.get_x(geometries), np.nan)
+        ys = np.where(is_point, shapely.get_y(geometries), np.nan)
+    elif encoding == "point":
+        points = batch.column(column)
+        if hasattr(points.type, "list_size"):
+            coords = _float_array(points.flatten()).reshape(-1, points.type.list_size)
+            xs, ys = coords[:, 0].copy(), coords[:, 1].copy()
+        else:
+            xs = _float_array(points.field("x"))
+            ys = _float_array(points.field("y"))
+    else:
+        raise ValueError(f"Encoding geometri tidak didukung: {encoding}")
+
+    values = None
+    if value_field:
+        if value_field in batch.schema.names:
+            values = _float_array(batch.column(value_field))
+        else:
+            values = np.full(len(xs), np.nan)
+
+    valid = ~(np.isnan(xs) | np.isnan(ys))
+    if valid.all():
+        return xs, ys, values
+    return xs[valid], ys[valid], values[valid] if values is not None else None
+
+
+def _float_array(array: Any) -> np.ndarray:
+    pa = _import_pyarrow()
+    try:
+        array = array.cast(pa.float64())
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return np.array([_to_float(value) for value in array.to_pylist()], dtype=np.float64)
+    return array.fill_null(np.nan).to_numpy(zero_copy_only=False)
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import orjson
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+from app.utils.topology import extract_topology
+
+TOPOJSON_MEDIA_TYPE = "application/topo+json"
+
+
+def accepts_topojson(accept: Optional[str]) -> bool:
+    """Cek apakah header Accept meminta TopoJSON."""
+    return bool(accept) and TOPOJSON_MEDIA_TYPE in accept.lower()
+
+
+class QuantizedTopology:
+    """
+    Topologi TopoJSON dari geometri poligon dengan arc bersama dan koordinat terkuantisasi.
+
+    Batas yang dipakai bersama poligon bertetangga disimpan sekali sebagai arc. Koordinat
+    arc dikuantisasi ke grid `quantization` x `quantization` di dalam bbox lalu disimpan
+    sebagai selisih (delta) integer dari titik sebelumnya. Arc sudah di-serialize sekali
+    saat dibuat sehingga `encode` hanya perlu menambahkan properties.
+    """
+
+    def __init__(self, geometries: Sequence[BaseGeometry], quantization: int = 100000):
+        geometries = np.asarray(geometries, dtype=object)
+        arcs, topology = extract_topology(geometries)
+
+        x0, y0, x1, y1 = shapely.total_bounds(geometries) if len(geometries) else (0.0, 0.0, 0.0, 0.0)
+        kx = (x1 - x0) / (quantization - 1) if x1 > x0 else 1.0
+        ky = (y1 - y0) / (quantization - 1) if y1 > y0 else 1.0
+
+        self.bbox = [float(x0), float(y0), float(x1), float(y1)]
+        self.transform = {"scale": [kx, ky], "translate": [float(x0), float(y0)]}
+        self.arcs = orjson.dumps([_quantize_arc(arc, x0, y0, kx, ky) for arc in arcs])
+        self.geometries = [_geometry_object(polygons) for polygons in topology]
+
+    def encode(self, object_name: str, properties: Sequence[Dict[str, Any]], **members: Any) -> bytes:
+        """
+        Serialize topologi menjadi dokumen TopoJSON.
+
+        Args:
+            object_name: Nama object di dalam `objects`
+            properties: Properties per geometri, sesuai urutan geometri
+            **members: Member tambahan di level atas dokumen, misal `rangelist`
+
+        Returns:
+            bytes: Dokumen TopoJSON
+        """
+        document = {
+            "type": "Topology",
+            "bbox": self.bbox,
+            "transform": self.transform,
+            "objects": {
+                object_name: {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {**geometry, "properties": item} for geometry, item in zip(self.geometries, properties)
+                    ],
+                }
+            },
+            **members,
+        }
+        content = orjson.dumps(document, option=orjson.OPT_SERIALIZE_NUMPY)
+        return content[:-1] + b',"arcs":' + self.arcs + b"}"
+
+
+def _quantize_arc(arc: np.ndarray, x0: float, y0: float, kx: float, ky: float) -> List[List[int]]:
+    points = np.column_stack((np.round((arc[:, 0] - x0) / kx), np.round((arc[:, 1] - y0) / ky))).astype(np.int64)
+
+    # Titik berurutan yang jatuh ke sel grid yang sama dibuang, kecuali titik awal dan akhir.
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+    keep[-1] = True
+    points = points[keep]
+
+    deltas = np.diff(points, axis=0, prepend=[[0, 0]])
+    return deltas.tolist()
+
+
+def _geometry_object(polygons: List[List[List[int]]]) -> Dict[str, Any]:
+    if not polygons:
+        return {"type": None}
+    if len(polygons) == 1:
+        return {"type": "Polygon", "arcs": polygons[0]}
+    return {"type": "MultiPolygon", "arcs": polygons}
@@ -0,0 +1,150 @@
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+Point = Tuple[float, float]
+# Ring berisi indeks arc; indeks negatif `~i` berarti arc ke-i dibaca terbalik (konvensi TopoJSON).
+Ring = List[int]
+Topology = List[List[List[Ring]]]
+
+
+def extract_topology(geometries: Sequence[BaseGeometry]) -> Tuple[List[np.ndarray], Topology]:
+    """
+    Pecah ring poligon menjadi arc yang dipakai bersama antar poligon bertetangga.
+
+    Titik junction adalah vertex yang muncul dengan pasangan tetangga berbeda, yaitu
+    awal dan akhir batas yang dipakai bersama. Setiap ring dipotong di junction, lalu
+    arc yang sama (searah maupun terbalik) disimpan sekali.
+
+    Args:
+        geometries: Geometri Polygon/MultiPolygon
+
+    Returns:
+        Tuple[List[np.ndarray], Topology]:
+            - Daftar arc, masing-masing array koordinat (n, 2)
+            - Untuk setiap geometri: daftar poligon, setiap poligon daftar ring, setiap
+              ring daftar indeks arc
+    """
+    shapes = [[[_ring_points(ring) for ring in _rings(polygon)] for polygon in _polygons(g)] for g in geometries]
+
+    first_pair: Dict[Point, frozenset] = {}
+    junctions = set()
+    for polygons in shapes:
+        for rings in polygons:
+            for points in rings:
+                n = len(points)
+                for i, point in enumerate(points):
+                    pair = frozenset((points[i - 1], points[(i + 1) % n]))
+                    if first_pair.setdefault(point, pair) != pair:
+                        junctions.add(point)
+
+    arcs: List[List[Point]] = []
+    index: Dict[Tuple[Point, ...], int] = {}
+
+    def add_arc(points: List[Point]) -> int:
+        key = tuple(points)
+        if key in index:
+            return index[key]
+        reverse = key[::-1]
+        if reverse in index:
+            return ~index[reverse]
+        index[key] = len(arcs)
+        arcs.append(points)
+        return index[key]
+
+    topology: Topology = []
+    for polygons in shapes:
+        geometry_rings = []
+        for rings in polygons:
+            polygon_rings = []
+            for points in rings:
+                if len(points) < 3:
+                    continue
+                polygon_rings.append(_split_ring(points, junctions, add_arc))
+            if polygon_rings:
+                geometry_rings.append(polygon_rings)
+        topology.append(geometry_rings)
+
+    return [np.asarray(arc, dtype=np.float64) for arc in arcs], topology
+
+
+def build_geometries(arcs: Sequence[np.ndarray], topology: Topology) -> np.ndarray:
+    """Susun kembali geometri Polygon/MultiPolygon dari arc dan topologi hasil `extract_topology`."""
+    geometries = []
+    for polygons in topology:
+        parts = []
+        for rings in polygons:
+            coords = [_ring_from_arcs(arcs, ring) for ring in rings]
+            if len(coords[0]) < 4:
+                continue
+            holes = [ring for ring in coords[1:] if len(ring) >= 4]
+            parts.append(shapely.Polygon(coords[0], holes))
+
+        if not parts:
+            geometries.append(shapely.Polygon())
+        elif len(parts) == 1:
+            geometries.append(parts[0])
+        else:
+            geometries.append(shapely.MultiPolygon(parts))
+
+    return np.asarray(geometries, dtype=object)
+
+
+def simplify_arcs(arcs: Sequence[np.ndarray], tolerance: float) -> List[np.ndarray]:
+    """
+    Sederhanakan setiap arc dengan Douglas-Peucker.
+
+    Titik awal dan akhir arc (junction) tidak berubah sehingga poligon bertetangga
+    tetap berbagi batas yang sama setelah disederhanakan.
+    """
+    if not arcs:
+        return []
+
+    lines = shapely.linestrings(np.concatenate(arcs), indices=np.repeat(np.arange(len(arcs)), [len(a) for a in arcs]))
+    simplified = shapely.simplify(lines, tolerance, preserve_topology=True)
+    coords, owner = shapely.get_coordinates(simplified, return_index=True)
+
+    bounds = np.searchsorted(owner, np.arange(len(arcs) + 1))
+    return [coords[bounds[i] : bounds[i + 1]] for i in range(len(arcs))]
+
+
+def _split_ring(points: List[Point], junctions: set, add_arc: Callable[[List[Point]], int]) -> Ring:
+    cuts = [i for i, point in enumerate(points) if point in junctions]
+
+    if not cuts:
+        # Ring tanpa junction disimpan utuh, dimulai dari vertex terkecil agar ring yang
+        # sama dari poligon lain menghasilkan arc yang sama.
+        start = points.index(min(points))
+        rotated = points[start:] + points[:start]
+        return [add_arc(rotated + rotated[:1])]
+
+    rotated = points[cuts[0] :] + points[: cuts[0]]
+    cuts = [i - cuts[0] for i in cuts] + [len(points)]
+    rotated = rotated + rotated[:1]
+    return [add_arc(rotated[cuts[i] : cuts[i + 1] + 1]) for i in range(len(cuts) - 1)]
+
+
+def _ring_from_arcs(arcs: Sequence[np.ndarray], ring: Ring) -> np.ndarray:
+    parts = []
+    for i, ref in enumerate(ring):
+        arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+        parts.append(arc if i == 0 else arc[1:])
+    return np.concatenate(parts)
+
+
+def _polygons(geometry: BaseGeometry) -> List[BaseGeometry]:
+    if geometry is None or geometry.is_empty:
+        return []
+    return [part for part in shapely.get_parts(geometry) if isinstance(part, shapely.Polygon) and not part.is_empty]
+
+
+def _rings(polygon: BaseGeometry) -> List[BaseGeometry]:
+    return [polygon.exterior, *polygon.interiors]
+
+
+def _ring_points(ring: BaseGeometry) -> List[Point]:
+    points = [tuple(point) for point in shapely.get_coordinates(ring).tolist()][:-1]
+    # Buang vertex berurutan yang sama.
+    return [point for i, point in enumerate(points) if point != points[i - 1]] if len(points) > 1 else points
@@ -0,0 +1,319 @@
+"""
+Benchmark perhitungan choropleth dan color scale.
+
+Titik acak dibangkitkan di dalam bbox boundary, lalu setiap tahap diukur terpisah:
+parsing sumber data, spatial join + agregasi, class break dan serialisasi respons.
+Jalur sumber data (`source`) dan jalur `calculate_choropleth` (`features`, GeoJSON yang
+sudah di-parse menjadi dict) dijalankan di proses terpisah untuk setiap ukuran N.
+
+Memori dilaporkan per tahap sebagai puncak alokasi tambahan selama tahap berjalan
+(`tracemalloc`, satu putaran terpisah agar durasi tidak terpengaruh overhead tracing).
+Alokasi di luar allocator Python, misal GEOS di dalam shapely, tidak ikut terhitung.
+`peak_rss_mb` adalah peak RSS seluruh proses termasuk data sintetis, `setup_rss_mb`
+adalah RSS setelah data sintetis siap sebagai pembanding.
+
+Contoh:
+    python -m benchmarks.choropleth --sizes 1000 100000 1000000 --output report.json
+    python -m benchmarks.choropleth --sizes 1000 100000 1000000 --baseline report.json
+"""
+
+import argparse
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+import numpy as np
+import orjson
+import psutil
+import shapely
+
+from app.core.boundary_registry import boundary_registry
+from app.core.geoprocessing import aggregate_feature_points, aggregate_points, classify_choropleth
+from app.core.source_cache import SourceEntry
+from app.utils.aggregation import AggregateFunction
+from app.utils.class_breaks import ClassificationMethod
+from app.utils.source_formats import iter_source_point_chunks
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 5_000_000]
+SOURCE_PATH = "source"
+FEATURES_PATH = "features"
+COLOR_RANGE = ["#ddffed", "#006430"]
+VALUE_FIELD = "value"
+
+T = TypeVar("T")
+
+
+def generate_points(bounds: Tuple[float, float, float, float], size: int, seed: int = 0) -> Tuple[np.ndarray, ...]:
+    """Bangkitkan `size` titik acak seragam di dalam bbox beserta nilai numeriknya."""
+    rng = np.random.default_rng(seed)
+    xs = rng.uniform(bounds[0], bounds[2], size)
+    ys = rng.uniform(bounds[1], bounds[3], size)
+    values = rng.gamma(2.0, 50.0, size).round(2)
+    return xs, ys, values
+
+
+def encode_geojson(xs: np.ndarray, ys: np.ndarray, values: np.ndarray, batch_size: int = 100_000) -> bytes:
+    """Serialize titik menjadi FeatureCollection GeoJSON, per batch agar memori tetap kecil."""
+    parts = []
+    for start in range(0, len(xs), batch_size):
+        features = [
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [x, y]}, "properties": {VALUE_FIELD: v}}
+            for x, y, v in zip(
+                xs[start : start + batch_size].tolist(),
+                ys[start : start + batch_size].tolist(),
+                values[start : start + batch_size].tolist(),
+            )
+        ]
+        parts.append(orjson.dumps(features)[1:-1])
+
+    return b'{"type":"FeatureCollection","features":[' + b",".join(parts) + b"]}"
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS proses saat ini dalam MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb() -> float:
+    """RSS proses saat ini dalam MiB."""
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def run_size(
+    boundary_name: str,
+    size: int,
+    repeat: int = 3,
+    aggregate: AggregateFunction = AggregateFunction.count,
+    method: ClassificationMethod = ClassificationMethod.quantile,
+    chunk_size: int = 65536,
+    path: str = SOURCE_PATH,
+    seed: int = 0,
+) -> Dict:
+    """
+    Jalankan benchmark untuk satu ukuran N pada satu jalur.
+
+    Args:
+        path: `source` (sumber data terkompresi, jalur color scale) atau `features`
+            (GeoJSON di-parse menjadi dict, jalur `calculate_choropleth`)
+
+    Returns:
+        Dict: Durasi setiap tahap (detik, minimum dan median dari `repeat` kali) dan puncak
+        alokasinya (MiB), ukuran sumber data serta RSS proses
+    """
+    boundary_registry.load_all()
+    boundary = boundary_registry.get(boundary_name)
+    field = VALUE_FIELD if aggregate != AggregateFunction.count else None
+
+    xs, ys, values = generate_points(tuple(shapely.total_bounds(boundary.geometries)), size, seed)
+    document = encode_geojson(xs, ys, values)
+    del xs, ys, values
+
+    source_bytes = len(document)
+    report = {"points": size, "path": path, "polygons": len(boundary), "source_bytes": source_bytes}
+
+    if path == SOURCE_PATH:
+        body = zlib.compress(document, 1)
+        report["source_compressed_bytes"] = len(body)
+        source = SourceEntry("benchmark://synthetic", body, source_bytes, str(size))
+        del document
+
+        def stages(timed: Callable) -> None:
+            chunks = timed("parse", lambda: list(iter_source_point_chunks(source, chunk_size, field)))
+            rows = timed("join", lambda: aggregate_points(boundary.name, chunks, aggregate))
+            result, rangelist = timed(
+                "classify",
+                lambda: classify_choropleth(rows, COLOR_RANGE, method, integer=aggregate == AggregateFunction.count),
+            )
+            timed(
+                "serialize",
+                lambda: orjson.dumps({"data": result, "rangelist": rangelist}, option=orjson.OPT_SERIALIZE_NUMPY),
+            )
+
+    elif path == FEATURES_PATH:
+
+        def stages(timed: Callable) -> None:
+            features = timed("features_parse", lambda: orjson.loads(document)["features"])
+            timed(
+                "features_join",
+                lambda: aggregate_feature_points(features, boundary.name, aggregate=aggregate, field=field),
+            )
+
+    else:
+        raise ValueError(f"Jalur benchmark tidak dikenal: {path}")
+
+    report["setup_rss_mb"] = round(current_rss_mb(), 1)
+
+    timings: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        stages(lambda stage, fn: _timed(timings, stage, fn))
+
+    allocations: Dict[str, float] = {}
+    tracemalloc.start()
+    try:
+        stages(lambda stage, fn: _traced(allocations, stage, fn))
+    finally:
+        tracemalloc.stop()
+
+    report["stages"] = {
+        stage: {
+            "min": min(samples),
+            "median": float(np.median(samples)),
+            "samples": samples,
+            "peak_alloc_mb": round(allocations[stage], 1),
+        }
+        for stage, samples in timings.items()
+    }
+    report["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    return report
+
+
+def _timed(timings: Dict[str, List[float]], stage: str, fn: Callable[[], T]) -> T:
+    start = time.perf_counter()
+    result = fn()
+    timings.setdefault(stage, []).append(time.perf_counter() - start)
+    return result
+
+
+def _traced(allocations: Dict[str, float], stage: str, fn: Callable[[], T]) -> T:
+    """Jalankan satu tahap dan catat puncak alokasi di atas memori yang sudah terpakai sebelumnya."""
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    allocations[stage] = (tracemalloc.get_traced_memory()[1] - before) / (1024 * 1024)
+    return result
+
+
+def compare(baseline: Dict, results: List[Dict]) -> List[Dict]:
+    """
+    Bandingkan hasil dengan laporan sebelumnya.
+
+    Returns:
+        List[Dict]: Untuk setiap ukuran dan jalur yang ada di kedua laporan, rasio durasi
+        minimum per tahap (baseline / sekarang, > 1 berarti lebih cepat), selisih puncak
+        alokasi per tahap dan selisih peak RSS
+    """
+    previous = {(result["points"], result.get("path", SOURCE_PATH)): result for result in baseline.get("results", [])}
+
+    comparison = []
+    for result in results:
+        before = previous.get((result["points"], result["path"]))
+        if before is None:
+            continue
+
+        speedup = {}
+        alloc_delta = {}
+        for stage, timing in result["stages"].items():
+            previous_stage = before["stages"].get(stage)
+            if previous_stage is None:
+                continue
+            if timing["min"] > 0:
+                speedup[stage] = round(previous_stage["min"] / timing["min"], 3)
+            if "peak_alloc_mb" in previous_stage:
+                alloc_delta[stage] = round(timing["peak_alloc_mb"] - previous_stage["peak_alloc_mb"], 1)
+        comparison.append(
+            {
+                "points": result["points"],
+                "path": result["path"],
+                "speedup": speedup,
+                "peak_alloc_mb_delta": alloc_delta,
+                "peak_rss_mb_delta": round(result["peak_rss_mb"] - before["peak_rss_mb"], 1),
+            }
+        )
+    return comparison
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    parser = argparse.ArgumentParser(description="Benchmark choropleth dan color scale")
+    parser.add_argument("--boundary", default="jatim.json", help="Nama file boundary di folder assets")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Jumlah titik yang diuji")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan per ukuran")
+    parser.add_argument("--aggregate", type=AggregateFunction, default=AggregateFunction.count)
+    parser.add_argument("--method", type=ClassificationMethod, default=ClassificationMethod.quantile)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--skip-features", action="store_true", help="Lewati jalur calculate_choropleth")
+    parser.add_argument("--output", help="Simpan laporan JSON ke file, default stdout")
+    parser.add_argument("--baseline", help="Laporan JSON sebelumnya sebagai pembanding")
+    args = parser.parse_args(argv)
+
+    paths = [SOURCE_PATH] if args.skip_features else [SOURCE_PATH, FEATURES_PATH]
+
+    results = []
+    for size in args.sizes:
+        for path in paths:
+            # Proses baru per ukuran dan jalur sehingga peak RSS yang tercatat hanya milik keduanya.
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                result = executor.submit(
+                    run_size,
+                    args.boundary,
+                    size,
+                    args.repeat,
+                    args.aggregate,
+                    args.method,
+                    args.chunk_size,
+                    path,
+                ).result()
+
+            results.append(result)
+            stages = ", ".join(
+                f"{stage} {timing['min']:.3f}s/{timing['peak_alloc_mb']} MiB"
+                for stage, timing in result["stages"].items()
+            )
+            print(
+                f"N={size} {path}: {stages}, RSS {result['setup_rss_mb']} -> peak {result['peak_rss_mb']} MiB",
+                file=sys.stderr,
+            )
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": multiprocessing.cpu_count(),
+        "boundary": args.boundary,
+        "aggregate": args.aggregate.value,
+        "method": args.method.value,
+        "chunk_size": args.chunk_size,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    if args.baseline:
+        with open(args.baseline, "rb") as file:
+            baseline = orjson.loads(file.read())
+        report["baseline"] = baseline.get("revision")
+        report["comparison"] = compare(baseline, results)
+        for item in report["comparison"]:
+            speedup = ", ".join(f"{stage} x{ratio}" for stage, ratio in item["speedup"].items())
+            print(
+                f"N={item['points']} {item['path']} vs baseline: {speedup}, RSS {item['peak_rss_mb_delta']:+} MiB",
+                file=sys.stderr,
+            )
+
+    content = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(content)
+    else:
+        sys.stdout.buffer.write(content + b"\n")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""add full text search
+
+Revision ID: 6f9327146196
+Revises:
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "6f9327146196"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_TABLES = ("mapsets", "organizations", "news")
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('satu_peta', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('satu_peta', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'satu_peta') THEN
+                IF EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'indonesian') THEN
+                    CREATE TEXT SEARCH CONFIGURATION satu_peta (COPY = pg_catalog.indonesian);
+                ELSE
+                    CREATE TEXT SEARCH CONFIGURATION satu_peta (COPY = pg_catalog.simple);
+                END IF;
+            END IF;
+        END
+        $$;
+        """
+    )
+
+    for table in SEARCH_TABLES:
+        op.add_column(
+            table,
+            sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True)),
+        )
+        op.create_index(f"ix_{table}_search_vector", table, ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SEARCH_TABLES:
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
+
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS satu_peta")
@@ -0,0 +1,39 @@
+"""add trigram name indexes
+
+Revision ID: 9a00542c87d4
+Revises: 6f9327146196
+Create Date: 2026-10-17 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a00542c87d4"
+down_revision: Union[str, None] = "6f9327146196"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_TABLES = ("mapsets", "organizations", "regionals", "categories")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table in TRIGRAM_TABLES:
+        op.create_index(
+            f"ix_{table}_name_trgm",
+            table,
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Extension pg_trgm dibiarkan karena bisa dipakai objek database lain.
+    for table in TRIGRAM_TABLES:
+        op.drop_index(f"ix_{table}_name_trgm", table_name=table)
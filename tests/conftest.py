@@ -0,0 +1,12 @@
+import os
+
+# Settings dibaca saat `app` diimport, jadi environment harus siap sebelum modul test mana pun
+# mengimport aplikasi. Test database memakai TEST_DATABASE_URL agar tidak pernah menyentuh
+# DATABASE_URL milik environment development.
+if os.environ.get("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://postgres@localhost:5432/satu_peta_test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("MINIO_ROOT_USER", "minio")
+os.environ.setdefault("MINIO_ROOT_PASSWORD", "minio-secret")
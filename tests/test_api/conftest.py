@@ -0,0 +1,121 @@
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.search import TRIGRAM_EXTENSION_DDL
+from app.main import app
+from app.models import (
+    Base,
+    CategoryModel,
+    ClassificationModel,
+    MapProjectionSystemModel,
+    MapsetModel,
+    OrganizationModel,
+)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@contextmanager
+def _without_trigram_indexes():
+    """Lepas sementara extension dan index `gin_trgm_ops` dari metadata untuk server tanpa pg_trgm."""
+    event.remove(Base.metadata, "before_create", TRIGRAM_EXTENSION_DDL)
+    removed = []
+    for table in Base.metadata.tables.values():
+        for index in list(table.indexes):
+            if "gin_trgm_ops" in (index.dialect_options["postgresql"].get("ops") or {}).values():
+                table.indexes.remove(index)
+                removed.append((table, index))
+    try:
+        yield
+    finally:
+        for table, index in removed:
+            table.indexes.add(index)
+        event.listen(Base.metadata, "before_create", TRIGRAM_EXTENSION_DDL)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def database():
+    """Schema baru di TEST_DATABASE_URL; test di-skip jika variabel tersebut tidak diatur."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL tidak diatur")
+
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    async with engine.begin() as conn:
+        trigram = await conn.scalar(text("SELECT count(*) FROM pg_available_extensions WHERE name = 'pg_trgm'"))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        if trigram:
+            await conn.run_sync(Base.metadata.create_all)
+        else:
+            with _without_trigram_indexes():
+                await conn.run_sync(Base.metadata.create_all)
+
+    yield SimpleNamespace(engine=engine, trigram=bool(trigram))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture
+def trigram(database):
+    if not database.trigram:
+        pytest.skip("extension pg_trgm tidak tersedia")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(database):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # Request pertama membangun middleware stack, termasuk session factory `db`.
+        await client.get("/")
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seed(database):
+    """Dua organisasi dengan mapset terbuka dan rahasia."""
+    now = datetime.now(timezone.utc)
+    open_class = ClassificationModel(name="Terbuka", is_open=True)
+    secret_class = ClassificationModel(name="Rahasia", is_open=False, is_secret=True)
+    category = CategoryModel(name="Batas Wilayah")
+    projection = MapProjectionSystemModel(name="WGS 84")
+    producer = OrganizationModel(name="Dinas Kehutanan", description="Pengelolaan hutan provinsi", created_at=now)
+    other = OrganizationModel(name="Badan Pusat Statistik", description="Statistik daerah", created_at=now)
+
+    def mapset(name, description, classification, organization):
+        return MapsetModel(
+            name=name,
+            description=description,
+            scale="1:25000",
+            data_status="final",
+            data_update_period="tahunan",
+            data_version="2024",
+            category=category,
+            classification=classification,
+            projection_system=projection,
+            producer=organization,
+            created_at=now,
+            updated_at=now,
+        )
+
+    mapsets = {
+        "forest": mapset("Tutupan Hutan Lindung", "Sebaran hutan lindung", open_class, producer),
+        "forest_secret": mapset("Hutan Produksi Terbatas", "Batas konsesi hutan", secret_class, producer),
+        "population": mapset("Kepadatan Penduduk", "Penduduk per kecamatan", open_class, other),
+    }
+
+    async with AsyncSession(database.engine, expire_on_commit=False) as session:
+        session.add_all(mapsets.values())
+        await session.commit()
+
+    return {"producer": producer, "other": other, "mapsets": mapsets}
@@ -0,0 +1,45 @@
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.mark.parametrize("path, total", [("/mapsets", 2), ("/organizations", 2)])
+@pytest.mark.parametrize("count", ["exact", "window", "estimate"])
+async def test_count_modes_report_total(client, seed, path, total, count):
+    response = await client.get(path, params={"limit": 1, "count": count})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["items"]) == 1
+    assert body["total"] == total
+    assert body["has_more"] is True
+
+
+async def test_count_none_omits_total(client, seed):
+    response = await client.get("/mapsets", params={"limit": 1, "count": "none"})
+
+    body = response.json()
+    assert body["total"] is None
+    assert body["has_more"] is True
+
+
+async def test_last_page_has_no_more(client, seed):
+    for count in ("exact", "window", "none"):
+        body = (await client.get("/mapsets", params={"limit": 1, "offset": 1, "count": count})).json()
+        assert len(body["items"]) == 1
+        assert body["has_more"] is False
+
+
+async def test_window_total_on_page_past_the_end(client, seed):
+    body = (await client.get("/mapsets", params={"limit": 1, "offset": 5, "count": "window"})).json()
+
+    assert body["items"] == []
+    assert body["total"] == 2
+
+
+async def test_large_estimate_uses_planner(client, seed, monkeypatch):
+    monkeypatch.setattr(settings, "COUNT_ESTIMATE_THRESHOLD", 0)
+
+    body = (await client.get("/mapsets", params={"limit": 1, "count": "estimate"})).json()
+
+    assert isinstance(body["total"], int) and body["total"] >= 1
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.pagination import CountMode
+from app.models import MapsetModel
+from app.repositories import MapsetRepository
+
+
+async def test_anonymous_search_ranks_open_mapsets(client, seed):
+    response = await client.get("/mapsets", params={"search": "hutan"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["name"] for item in body["items"]] == ["Tutupan Hutan Lindung"]
+    assert body["total"] == 1
+
+
+async def test_anonymous_search_matches_producer(client, seed):
+    response = await client.get("/mapsets", params={"search": "statistik"})
+
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == ["Kepadatan Penduduk"]
+
+
+async def test_member_search_includes_own_secret_mapsets(client, seed):
+    producer = seed["producer"]
+    user = SimpleNamespace(id=None, role="user", organization=SimpleNamespace(id=producer.id))
+
+    async with db():
+        page = await MapsetRepository(MapsetModel).find_all(user, [], [], search="hutan", count=CountMode.window)
+
+    assert sorted(mapset.name for mapset in page.items) == ["Hutan Produksi Terbatas", "Tutupan Hutan Lindung"]
+    assert page.total == 2
+
+
+async def test_member_search_exact_count_orders_by_rank(client, seed):
+    other = seed["other"]
+    user = SimpleNamespace(id=None, role="user", organization=SimpleNamespace(id=other.id))
+
+    async with db():
+        page = await MapsetRepository(MapsetModel).find_all(user, [], [], search="hutan")
+
+    assert [mapset.name for mapset in page.items] == ["Tutupan Hutan Lindung"]
+    assert page.total == 1
+
+
+async def test_fuzzy_threshold_is_set_per_connection(client):
+    async with db():
+        threshold = await db.session.scalar(text("SELECT current_setting('pg_trgm.word_similarity_threshold')"))
+
+    assert float(threshold) == settings.SEARCH_FUZZY_THRESHOLD
+
+
+async def test_anonymous_fuzzy_search_tolerates_typos(client, seed, trigram):
+    response = await client.get("/mapsets", params={"search": "hutann lindung", "search_mode": "fuzzy"})
+
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == ["Tutupan Hutan Lindung"]
@@ -0,0 +1,45 @@
+import pytest
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import func
+
+from app.core.pagination import CountMode
+from app.models import ClassificationModel, MapsetModel, OrganizationModel
+from app.repositories import MapsetRepository, OrganizationRepository
+
+
+async def _walk(repository, sort, count):
+    """Ambil semua halaman mode cursor anonim dengan satu item per halaman."""
+    names, cursor = [], ""
+    async with db():
+        while cursor is not None:
+            page = await repository.find_all(None, [], sort, limit=1, cursor=cursor, count=count)
+            names.extend(item["name"] if isinstance(item, dict) else item.name for item in page.items)
+            cursor = page.next_cursor
+    return names
+
+
+@pytest.mark.parametrize("count", [CountMode.none, CountMode.window])
+async def test_cursor_sorted_by_joined_model_column(client, seed, count):
+    sort = [ClassificationModel.name.desc(), MapsetModel.name.asc()]
+
+    names = await _walk(MapsetRepository(MapsetModel), sort, count)
+
+    assert names == ["Kepadatan Penduduk", "Tutupan Hutan Lindung"]
+
+
+@pytest.mark.parametrize("count", [CountMode.none, CountMode.window])
+async def test_cursor_sorted_by_expression(client, seed, count):
+    sort = [func.length(MapsetModel.name).desc()]
+
+    names = await _walk(MapsetRepository(MapsetModel), sort, count)
+
+    assert names == ["Tutupan Hutan Lindung", "Kepadatan Penduduk"]
+
+
+@pytest.mark.parametrize("count", [CountMode.none, CountMode.window])
+async def test_cursor_over_mapping_rows(client, seed, count):
+    sort = [OrganizationModel.name.asc()]
+
+    names = await _walk(OrganizationRepository(OrganizationModel, MapsetModel), sort, count)
+
+    assert names == ["Badan Pusat Statistik", "Dinas Kehutanan"]
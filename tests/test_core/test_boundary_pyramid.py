@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+import shapely
+
+from app.core.boundary_pyramid import BoundaryPyramid, BoundaryPyramidStore
+from app.core.boundary_registry import Boundary
+
+TOLERANCES = [0.05, 0.0, 0.01]
+
+
+def wavy_boundary(mtime=1.0):
+    # Dua poligon bertetangga dengan batas bersama yang bergelombang.
+    t = np.linspace(0, 1, 200)
+    shared = np.column_stack([1 + 0.1 * np.sin(t * 12 * np.pi) + 0.003 * np.cos(t * 90), t])
+    left = np.vstack([[[0, 1], [0, 0]], shared])
+    right = np.vstack([shared[::-1], [[2, 0], [2, 1]]])
+    features = [
+        {"properties": {"kode": code}, "geometry": shapely.geometry.mapping(shapely.Polygon(ring))}
+        for code, ring in (("35", left), ("36", right))
+    ]
+    return Boundary("uji.json", "uji.json", mtime, features)
+
+
+def test_build_and_reopen_round_trip(tmp_path):
+    boundary = wavy_boundary()
+    path = str(tmp_path / "uji.pyr")
+
+    BoundaryPyramid.build(boundary, TOLERANCES, path).close()
+    pyramid = BoundaryPyramid(path)
+
+    assert pyramid.tolerances == sorted(TOLERANCES)
+    assert pyramid.count == len(boundary)
+    assert pyramid.source_mtime == boundary.mtime
+
+    vertices = []
+    for level, tolerance in enumerate(pyramid.tolerances):
+        geometries = pyramid.geometries(level)
+        assert shapely.is_valid(geometries).all() and not shapely.is_empty(geometries).any()
+        distances = shapely.hausdorff_distance(geometries, boundary.geometries)
+        assert (distances <= tolerance + 1e-9).all(), (tolerance, distances)
+        # Batas bersama disederhanakan sekali sehingga tidak ada celah atau tumpang tindih.
+        assert shapely.area(shapely.intersection(geometries[0], geometries[1])) == pytest.approx(0, abs=1e-12)
+        assert shapely.area(shapely.union_all(geometries)) == pytest.approx(2.0)
+        vertices.append(int(shapely.get_num_coordinates(geometries).sum()))
+
+    assert shapely.equals(pyramid.geometries(0), boundary.geometries).all()
+    assert vertices == sorted(vertices, reverse=True) and vertices[-1] < vertices[0]
+
+    assert pyramid.select_level(0.001) == 0
+    assert pyramid.select_level(0.02) == 1
+    assert pyramid.select_level(1) == 2
+    assert pyramid.select_level(-1) is None
+    pyramid.close()
+
+
+def test_store_reuses_file_until_source_changes(tmp_path):
+    store = BoundaryPyramidStore(str(tmp_path), TOLERANCES)
+    boundary = wavy_boundary()
+
+    path = store.get(boundary).path
+    store._pyramids.clear()
+    built_at = (tmp_path / "uji.pyr").stat().st_mtime_ns
+    reopened = store.get(boundary)
+    assert reopened.path == path and (tmp_path / "uji.pyr").stat().st_mtime_ns == built_at
+
+    changed = wavy_boundary(mtime=2.0)
+    assert store.get(changed) is not reopened
+    assert store.get(changed).source_mtime == 2.0
+
+
+def test_store_rebuilds_corrupted_file(tmp_path):
+    (tmp_path / "uji.pyr").write_bytes(b"bukan piramida")
+    store = BoundaryPyramidStore(str(tmp_path), TOLERANCES)
+
+    pyramid = store.get(wavy_boundary())
+
+    assert pyramid.count == 2 and len(pyramid) == len(TOLERANCES)
@@ -0,0 +1,141 @@
+import importlib
+import os
+
+import numpy as np
+import orjson
+import pytest
+
+from app.core import geoprocessing
+from app.core.boundary_registry import BoundaryRegistry
+from app.core.exceptions import NotFoundException, UnprocessableEntity
+from app.utils.aggregation import AggregateFunction
+from app.utils.geojson_stream import PointChunk
+
+registry_module = importlib.import_module("app.core.boundary_registry")
+
+PROVINSI = {"35": (0, 0, 2, 2), "36": (2, 0, 4, 2)}
+KABUPATEN = {"35.01": (0, 0, 1, 2), "35.02": (1, 0, 2, 2), "36.01": (2, 0, 4, 2)}
+KECAMATAN = {
+    "35.01.01": (0, 0, 1, 1),
+    "35.01.02": (0, 1, 1, 2),
+    "35.02.01": (1, 0, 2, 2),
+    "36.01.01": (2, 0, 4, 2),
+    "37.01.01": (4, 0, 5, 2),
+}
+
+
+def box(minx, miny, maxx, maxy):
+    return {"type": "Polygon", "coordinates": [[[minx, miny], [maxx, miny], [maxx, maxy], [minx, maxy], [minx, miny]]]}
+
+
+def write_boundary(directory, name, regions):
+    features = [
+        {"type": "Feature", "properties": {"kode": code}, "geometry": box(*bounds)} for code, bounds in regions.items()
+    ]
+    (directory / name).write_bytes(orjson.dumps({"type": "FeatureCollection", "features": features}))
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    write_boundary(tmp_path, "provinsi.json", PROVINSI)
+    write_boundary(tmp_path, "kabupaten.json", KABUPATEN)
+    write_boundary(tmp_path, "kecamatan.json", KECAMATAN)
+    registry = BoundaryRegistry(str(tmp_path))
+    monkeypatch.setattr(geoprocessing, "boundary_registry", registry)
+    return registry
+
+
+def random_points(size=2000):
+    rng = np.random.default_rng(7)
+    return PointChunk(rng.uniform(0, 5, size), rng.uniform(0, 2, size), rng.uniform(-10, 100, size))
+
+
+def test_hierarchy_orders_levels_and_links_parents(registry):
+    hierarchy = registry.hierarchy(["provinsi", "kecamatan.json", "kabupaten"])
+
+    assert [boundary.name for boundary, _ in hierarchy] == ["kecamatan.json", "kabupaten.json", "provinsi.json"]
+    assert hierarchy[0][1].tolist() == [0, 1, 2, 3, 4]
+    assert hierarchy[1][1].tolist() == [0, 0, 1, 2, -1]
+    assert hierarchy[2][1].tolist() == [0, 0, 0, 1, -1]
+
+
+@pytest.mark.parametrize("aggregate", [AggregateFunction.count, AggregateFunction.sum, AggregateFunction.max])
+def test_parent_totals_equal_sum_of_children(registry, aggregate):
+    chunk = random_points()
+    names = ["kecamatan", "kabupaten", "provinsi"]
+
+    result = geoprocessing.aggregate_points_hierarchy(names, [chunk], aggregate)
+    values = {name: {row["kode"]: row["value"] for row in rows} for name, rows in result.items()}
+
+    combine = max if aggregate == AggregateFunction.max else sum
+    for child, parent in (("kecamatan.json", "kabupaten.json"), ("kabupaten.json", "provinsi.json")):
+        for code, value in values[parent].items():
+            children = [v for c, v in values[child].items() if c.startswith(code + ".")]
+            assert value == pytest.approx(combine(children))
+
+    # Setiap level sama dengan agregasi langsung ke boundary itu sendiri.
+    for name in names:
+        direct = geoprocessing.aggregate_points(name, [chunk], aggregate)
+        assert [row["value"] for row in direct] == pytest.approx([row["value"] for row in result[f"{name}.json"]])
+
+
+def test_code_without_geometric_containment_is_rejected(registry, tmp_path):
+    write_boundary(tmp_path, "kabupaten.json", {**KABUPATEN, "35.01": (2, 0, 3, 2)})
+
+    with pytest.raises(UnprocessableEntity, match="3501"):
+        registry.hierarchy(["kabupaten", "provinsi"])
+
+
+def test_boundary_without_codes_is_rejected(registry, tmp_path):
+    (tmp_path / "tanpa_kode.json").write_bytes(
+        orjson.dumps({"type": "FeatureCollection", "features": [{"properties": {}, "geometry": box(0, 0, 1, 1)}]})
+    )
+
+    with pytest.raises(UnprocessableEntity, match="tidak memiliki kode"):
+        registry.hierarchy(["tanpa_kode", "provinsi"])
+
+
+class FakeClock:
+    now = 1000.0
+
+    @classmethod
+    def monotonic(cls):
+        return cls.now
+
+
+def test_changed_file_is_reloaded_after_check_interval(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "time", FakeClock)
+    write_boundary(tmp_path, "provinsi.json", PROVINSI)
+    write_boundary(tmp_path, "kabupaten.json", KABUPATEN)
+    registry = BoundaryRegistry(str(tmp_path), check_interval=30)
+    registry.load_all()
+    provinsi = registry.get("provinsi")
+    kabupaten = registry.get("kabupaten")
+
+    write_boundary(tmp_path, "provinsi.json", {"35": (10, 10, 11, 11)})
+    os.utime(tmp_path / "provinsi.json", (provinsi.mtime + 10, provinsi.mtime + 10))
+
+    # Sebelum interval lewat, entry lama tetap dipakai tanpa menyentuh disk.
+    FakeClock.now += 29
+    assert registry.get("provinsi") is provinsi
+
+    FakeClock.now += 2
+    reloaded = registry.get("provinsi")
+    assert reloaded is not provinsi
+    assert len(reloaded) == 1 and reloaded.geometries[0].bounds == (10.0, 10.0, 11.0, 11.0)
+    assert registry.get("provinsi") is reloaded
+    assert registry.get("kabupaten") is kabupaten
+
+
+def test_deleted_file_is_dropped_after_check_interval(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "time", FakeClock)
+    write_boundary(tmp_path, "provinsi.json", PROVINSI)
+    registry = BoundaryRegistry(str(tmp_path), check_interval=30)
+    registry.get("provinsi")
+
+    os.remove(tmp_path / "provinsi.json")
+    FakeClock.now += 31
+
+    with pytest.raises(NotFoundException):
+        registry.get("provinsi")
+    assert registry.names() == []
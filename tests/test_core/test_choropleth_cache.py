@@ -0,0 +1,67 @@
+import asyncio
+
+import aiohttp
+import orjson
+import pytest
+
+from app.core import choropleth_cache as module
+from app.core.choropleth_cache import ChoroplethCache
+
+RESULT = ([{"id": 1, "value": 3, "color": "#800026"}], [{"from": 0, "to": 0}])
+
+
+class FailingMinio:
+    error: Exception = aiohttp.ClientConnectionError("connection refused")
+
+    async def read_file(self, object_name):
+        raise self.error
+
+    async def upload_file(self, **kwargs):
+        raise self.error
+
+
+class MemoryMinio:
+    objects = {}
+
+    async def read_file(self, object_name):
+        return self.objects[object_name]
+
+    async def upload_file(self, file_data, object_name, **kwargs):
+        self.objects[object_name] = file_data.read()
+
+
+@pytest.mark.parametrize(
+    "error", [aiohttp.ClientConnectionError("connection refused"), asyncio.TimeoutError(), ConnectionResetError()]
+)
+async def test_minio_errors_are_cache_misses(monkeypatch, error):
+    monkeypatch.setattr(FailingMinio, "error", error)
+    monkeypatch.setattr(module, "MinioClient", FailingMinio)
+    cache = ChoroplethCache(maxsize=2, use_minio=True)
+
+    await cache.set("key", RESULT)
+    assert await cache.get("key") == RESULT
+
+    assert await cache.get("missing") is None
+
+
+async def test_corrupt_minio_object_is_a_miss(monkeypatch):
+    monkeypatch.setattr(module, "MinioClient", MemoryMinio)
+    cache = ChoroplethCache(maxsize=2, use_minio=True)
+    MemoryMinio.objects[cache.object_name("corrupt")] = b"{not json"
+
+    assert await cache.get("corrupt") is None
+
+
+async def test_minio_spill_survives_memory_eviction(monkeypatch):
+    monkeypatch.setattr(module, "MinioClient", MemoryMinio)
+    cache = ChoroplethCache(maxsize=1, use_minio=True)
+
+    await cache.set("first", RESULT)
+    await cache.set("second", RESULT)
+
+    assert orjson.loads(MemoryMinio.objects[cache.object_name("first")])["data"] == RESULT[0]
+    assert await cache.get("first") == (RESULT[0], RESULT[1])
+
+
+def test_make_key_ignores_dict_order():
+    assert ChoroplethCache.make_key({"a": 1, "b": 2}, "x") == ChoroplethCache.make_key({"b": 2, "a": 1}, "x")
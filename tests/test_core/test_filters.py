@@ -0,0 +1,113 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.core.exceptions import UnprocessableEntity
+from app.core.filters import compile_filters, compile_sort
+from app.models import MapsetModel, OrganizationModel
+
+
+def sql(clause):
+    compiled = clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    # Paramstyle pyformat menggandakan `%` pada SQL hasil compile.
+    return str(compiled).replace("%%", "%")
+
+
+def compile_sql(filters, models=MapsetModel):
+    return [sql(clause) for clause in compile_filters(filters, models).clauses()]
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ("name=Hutan", "mapsets.name = 'Hutan'"),
+        ("scale!=1:25000", "mapsets.scale != '1:25000'"),
+        ("is_active=true", "mapsets.is_active IS true"),
+        ("layer_url=null", "mapsets.layer_url IS NULL"),
+        ("layer_url!=NULL", "mapsets.layer_url IS NOT NULL"),
+        ("name~hutan", "mapsets.name ILIKE '%hutan%'"),
+        ("name~hutan_lindung", "mapsets.name ILIKE 'hutan_lindung'"),
+        ({"field": "data_status", "op": "in", "value": ["final", "draf"]}, "mapsets.data_status IN ('final', 'draf')"),
+        ({"field": "layer_url", "op": "is_null", "value": False}, "mapsets.layer_url IS NOT NULL"),
+    ],
+)
+def test_single_condition(filters, expected):
+    assert compile_sql(filters) == [expected]
+
+
+def test_between_with_open_bound():
+    compiled = compile_filters({"field": "name", "op": "between", "value": ["A", None]}, MapsetModel)
+
+    assert [sql(clause) for clause in compiled.clauses()] == ["mapsets.name >= 'A'"]
+
+
+def test_date_filter_is_index_friendly_range():
+    compiled = compile_filters({"field": "created_at", "op": "date", "value": "2024-05-01"}, MapsetModel)
+
+    (clause,) = compiled.clauses()
+    low, high = (condition.right.value for condition in clause.clauses)
+    start = datetime(2024, 5, 1, tzinfo=ZoneInfo(settings.TIMEZONE))
+    assert (low, high) == (start, start + timedelta(days=1))
+
+
+def test_or_group_and_models():
+    filters = [["name~hutan", "is_active=false"], {"field": "address", "op": "ilike", "value": "Jalan"}]
+    compiled = compile_filters(filters, (MapsetModel, OrganizationModel))
+
+    assert [sql(clause) for clause in compiled.clauses(MapsetModel)] == [
+        "mapsets.name ILIKE '%hutan%' OR mapsets.is_active IS false"
+    ]
+    assert [sql(clause) for clause in compiled.clauses(OrganizationModel)] == ["organizations.address ILIKE '%Jalan%'"]
+
+
+def test_compiled_filters_are_cached():
+    first = compile_filters([{"field": "name", "op": "eq", "value": "Hutan"}], MapsetModel)
+
+    assert compile_filters([{"op": "eq", "value": "Hutan", "field": "name"}], MapsetModel) is first
+    assert compile_filters([{"field": "name", "op": "eq", "value": "Hutan"}], OrganizationModel) is not first
+
+
+@pytest.mark.parametrize(
+    "filters, message",
+    [
+        ("tidak_ada=1", "Invalid filter column"),
+        ("name", "must be 'name=value'"),
+        ([["name=a", ["name=b"]]], "cannot be nested"),
+        ({"field": "name", "op": "regex", "value": "a"}, "valid 'op'"),
+        ({"field": "is_active", "op": "eq", "value": "mungkin"}, "expected true or false"),
+        ({"field": "id", "op": "eq", "value": "bukan-uuid"}, "Invalid filter value"),
+        ({"field": "name", "op": "in", "value": "a"}, "requires a list"),
+        ({"field": "name", "op": "between", "value": [None, None]}, "requires \\[min, max\\]"),
+        ({"field": "created_at", "op": "date", "value": "kemarin"}, "expected YYYY-MM-DD"),
+        (42, "Invalid filter"),
+    ],
+)
+def test_invalid_filters(filters, message):
+    with pytest.raises(UnprocessableEntity, match=message):
+        compile_filters(filters, MapsetModel)
+
+
+def test_compile_sort():
+    sort = compile_sort(["name:desc", "created_at:ASC"], MapsetModel)
+
+    assert [sql(clause) for clause in sort] == ["mapsets.name DESC", "mapsets.created_at ASC"]
+    assert [sql(clause) for clause in compile_sort("name:asc", (OrganizationModel, MapsetModel))] == [
+        "organizations.name ASC"
+    ]
+
+
+@pytest.mark.parametrize("sort", ["name", "name:up", "tidak_ada:asc", 1])
+def test_invalid_sort(sort):
+    with pytest.raises(UnprocessableEntity):
+        compile_sort(sort, MapsetModel)
+
+
+def test_date_to_includes_whole_day():
+    compiled = compile_filters({"field": "created_at", "op": "date_to", "value": date(2024, 5, 1)}, MapsetModel)
+
+    (clause,) = compiled.clauses()
+
+    assert clause.right.value == datetime(2024, 5, 2, tzinfo=ZoneInfo(settings.TIMEZONE))
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import signal
+import threading
+
+import pytest
+
+from app.core.exceptions import ServiceUnavailableException
+from app.core.geoprocessing import GeoProcessPool
+
+
+def add(a, b):
+    return a + b
+
+
+def crash():
+    os._exit(1)
+
+
+def worker_pid():
+    return os.getpid()
+
+
+def crash_once(marker):
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return "ok"
+
+
+@pytest.fixture
+def pool():
+    pool = GeoProcessPool(max_workers=1, queue_size=1, queue_timeout=1)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+async def test_run_without_workers_uses_thread():
+    pool = GeoProcessPool(max_workers=0, queue_size=1, queue_timeout=1)
+    pool.start()
+
+    assert await pool.run(add, 1, 2) == 3
+
+
+async def test_dead_worker_is_replaced_and_job_retried(pool, tmp_path):
+    broken = pool._executor
+
+    assert await pool.run(crash_once, str(tmp_path / "crashed")) == "ok"
+    assert pool._executor is not broken
+
+
+async def test_repeated_crash_returns_503_and_pool_recovers(pool):
+    with pytest.raises(ServiceUnavailableException):
+        await pool.run(crash)
+
+    assert await pool.run(add, 2, 3) == 5
+    assert pool._slots._value == 2
+
+
+async def test_killed_worker_is_replaced_on_next_submit(pool):
+    broken = pool._executor
+    pid = await pool.run(worker_pid)
+
+    os.kill(pid, signal.SIGKILL)
+
+    assert await pool.run(add, 3, 4) == 7
+    assert pool._executor is not broken
+    assert await pool.run(worker_pid) != pid
+    assert pool._slots._value == 2
+
+
+async def test_queue_is_bounded_by_semaphore():
+    pool = GeoProcessPool(max_workers=0, queue_size=1, queue_timeout=0.2)
+    pool.start()
+    release = threading.Event()
+
+    # Satu slot kerja ditambah satu slot antrean: pekerjaan ketiga ditolak setelah timeout.
+    running = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    with pytest.raises(ServiceUnavailableException):
+        await pool.run(add, 1, 1)
+
+    release.set()
+    assert await asyncio.gather(*running) == [True, True]
+    assert pool._slots._value == 2
+    assert await pool.run(add, 1, 1) == 2
@@ -0,0 +1,53 @@
+import asyncio
+from collections import Counter
+
+import httpx
+
+from app.core.http_client import HttpClientPool
+
+
+class ConcurrencyTracker:
+    """Transport palsu yang mencatat jumlah request bersamaan per host."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = Counter()
+        self.peak = Counter()
+        self.peak_total = 0
+
+    async def __call__(self, request):
+        host = request.url.host
+        self.active[host] += 1
+        self.peak[host] = max(self.peak[host], self.active[host])
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        await asyncio.sleep(self.delay)
+        self.active[host] -= 1
+        return httpx.Response(200, content=b"ok")
+
+
+async def test_concurrency_is_capped_per_host():
+    tracker = ConcurrencyTracker()
+    pool = HttpClientPool(max_connections=10, max_per_host=2, timeout=5)
+    pool._client = httpx.AsyncClient(transport=httpx.MockTransport(tracker))
+
+    async def fetch(url):
+        async with pool.limit(url) as client:
+            return (await client.get(url)).status_code
+
+    urls = [f"https://{host}/titik-{i}.geojson" for host in ("a.example.com", "b.example.com") for i in range(6)]
+    assert await asyncio.gather(*(fetch(url) for url in urls)) == [200] * len(urls)
+
+    assert tracker.peak == {"a.example.com": 2, "b.example.com": 2}
+    # Slot dibatasi per host, bukan global.
+    assert tracker.peak_total == 4
+    await pool.aclose()
+
+
+async def test_closed_client_is_recreated():
+    pool = HttpClientPool(max_connections=10, max_per_host=2, timeout=5)
+    client = pool.client
+    assert pool.client is client
+
+    await pool.aclose()
+    assert pool.client is not client and not pool.client.is_closed
+    await pool.aclose()
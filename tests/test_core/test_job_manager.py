@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.exceptions import NotFoundException, ServiceUnavailableException, TooManyRequestsException
+from app.core.job_manager import JobManager, JobStatus
+
+
+def make_manager(max_workers=2, result_ttl=60, max_pending=10, max_retained=10):
+    return JobManager(max_workers, result_ttl, max_pending, max_retained)
+
+
+async def test_same_key_is_deduplicated():
+    manager = make_manager()
+    release = asyncio.Event()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "hasil"
+
+    first = manager.submit("sama", work)
+    second = manager.submit("sama", work)
+    other = manager.submit("lain", work)
+    release.set()
+    await manager.wait(first.id, 1)
+    await manager.wait(other.id, 1)
+
+    assert first is second and first is not other
+    assert calls == 2
+    assert first.status == JobStatus.done and first.result == "hasil"
+
+    # Setelah selesai, key yang sama menjalankan job baru.
+    third = manager.submit("sama", work)
+    assert third is not first
+    await manager.wait(third.id, 1)
+
+
+async def test_failed_job_keeps_error():
+    manager = make_manager()
+
+    async def work():
+        raise ValueError("rusak")
+
+    job = manager.submit("gagal", work)
+    job = await manager.wait(job.id, 1)
+
+    assert job.status == JobStatus.failed
+    assert isinstance(job.error, ValueError)
+    assert job.finished_at is not None
+    assert manager.get(job.id) is job
+
+
+async def test_finished_jobs_expire_after_ttl(monkeypatch):
+    manager = make_manager(result_ttl=60)
+
+    async def work():
+        return 1
+
+    job = manager.submit("a", work)
+    await manager.wait(job.id, 1)
+    assert manager.get(job.id) is job
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    with pytest.raises(NotFoundException):
+        manager.get(job.id)
+
+
+async def test_pending_limit_rejects_new_jobs():
+    manager = make_manager(max_workers=1, max_pending=2)
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+
+    jobs = [manager.submit(key, work) for key in ("a", "b")]
+    with pytest.raises(TooManyRequestsException):
+        manager.submit("c", work)
+    # Key yang sedang berjalan tetap digabung walaupun antrean penuh.
+    assert manager.submit("a", work) is jobs[0]
+
+    release.set()
+    for job in jobs:
+        await manager.wait(job.id, 1)
+    job = manager.submit("c", work)
+    await manager.wait(job.id, 1)
+
+
+async def test_retained_limit_evicts_oldest_finished_jobs():
+    manager = make_manager(max_pending=5, max_retained=2)
+    release = asyncio.Event()
+
+    async def quick():
+        return 1
+
+    async def slow():
+        await release.wait()
+
+    first = await manager.wait(manager.submit("a", quick).id, 1)
+    second = await manager.wait(manager.submit("b", quick).id, 1)
+    third = manager.submit("c", slow)
+
+    with pytest.raises(NotFoundException):
+        manager.get(first.id)
+    assert manager.get(second.id) is second
+
+    fourth = manager.submit("d", slow)
+    with pytest.raises(NotFoundException):
+        manager.get(second.id)
+
+    # Semua job tersimpan masih berjalan, jadi tidak ada yang bisa dibuang.
+    with pytest.raises(ServiceUnavailableException):
+        manager.submit("e", slow)
+
+    release.set()
+    await manager.wait(third.id, 1)
+    await manager.wait(fourth.id, 1)
@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.exceptions import UnprocessableEntity
+from app.core.pagination import decode_cursor, encode_cursor, sort_keys
+from app.models import CategoryModel, MapsetModel
+
+
+def _keys(*sort):
+    return sort_keys(list(sort), MapsetModel.id)
+
+
+def test_cursor_round_trip_restores_column_types():
+    keys = _keys(MapsetModel.created_at.desc(), MapsetModel.name.asc())
+    values = [datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc), "Tutupan Hutan", uuid.uuid4()]
+
+    assert decode_cursor(keys, encode_cursor(keys, values)) == values
+
+
+def test_cursor_round_trip_keeps_null():
+    keys = _keys(MapsetModel.name.asc())
+    values = [None, uuid.uuid4()]
+
+    assert decode_cursor(keys, encode_cursor(keys, values)) == values
+
+
+@pytest.mark.parametrize("position", [0, -1])
+def test_cursor_rejects_tampered_token(position):
+    keys = _keys(MapsetModel.name.asc())
+    payload, mac = encode_cursor(keys, ["Hutan", uuid.uuid4()]).split(".")
+    if position == 0:
+        payload = payload[:-2] + ("AA" if payload[-2:] != "AA" else "BB")
+    else:
+        mac = mac[:-2] + ("AA" if mac[-2:] != "AA" else "BB")
+
+    with pytest.raises(UnprocessableEntity, match="Cursor tidak valid"):
+        decode_cursor(keys, f"{payload}.{mac}")
+
+
+@pytest.mark.parametrize("cursor", ["", "tanpa-titik", "a.b.c", "!!!.???", "e30.AAAA"])
+def test_cursor_rejects_garbage(cursor):
+    with pytest.raises(UnprocessableEntity, match="Cursor tidak valid"):
+        decode_cursor(_keys(), cursor)
+
+
+def test_cursor_rejects_different_sort():
+    cursor = encode_cursor(_keys(MapsetModel.name.asc()), ["Hutan", uuid.uuid4()])
+
+    with pytest.raises(UnprocessableEntity, match="urutan sort"):
+        decode_cursor(_keys(MapsetModel.name.desc()), cursor)
+
+
+def test_cursor_distinguishes_same_column_name_on_other_model():
+    cursor = encode_cursor(_keys(MapsetModel.name.asc()), ["Hutan", uuid.uuid4()])
+
+    with pytest.raises(UnprocessableEntity, match="urutan sort"):
+        decode_cursor(_keys(CategoryModel.name.asc()), cursor)
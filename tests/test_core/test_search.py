@@ -0,0 +1,48 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.search import (
+    SEARCH_CONFIG,
+    fuzzy_match,
+    fuzzy_rank,
+    fuzzy_server_settings,
+    search_match,
+    search_rank,
+)
+from app.models import MapsetModel
+
+
+def compile_sql(statement):
+    compiled = statement.compile(dialect=postgresql.dialect())
+    return str(compiled), list(compiled.params.values())
+
+
+def test_search_match_uses_websearch_tsquery():
+    sql, params = compile_sql(select(MapsetModel.id).where(search_match(MapsetModel.search_vector, "hutan -lindung")))
+
+    assert "mapsets.search_vector @@ websearch_to_tsquery(" in sql
+    assert params == [SEARCH_CONFIG, "hutan -lindung"]
+
+
+def test_search_rank_orders_by_ts_rank():
+    sql, params = compile_sql(select(MapsetModel.id).order_by(search_rank(MapsetModel.search_vector, "hutan").desc()))
+
+    assert "ORDER BY ts_rank(mapsets.search_vector, websearch_to_tsquery(" in sql
+    assert sql.endswith("DESC")
+    assert params == [SEARCH_CONFIG, "hutan"]
+
+
+def test_fuzzy_match_uses_word_similarity_operator():
+    sql, params = compile_sql(
+        select(MapsetModel.id)
+        .where(fuzzy_match(MapsetModel.name, "banyuwangie"))
+        .order_by(fuzzy_rank(MapsetModel.name, "banyuwangie").desc())
+    )
+
+    assert "<%% mapsets.name" in sql
+    assert "ORDER BY word_similarity(" in sql
+    assert params == ["banyuwangie", "banyuwangie"]
+
+
+def test_fuzzy_server_settings():
+    assert fuzzy_server_settings(0.4) == {"pg_trgm.word_similarity_threshold": "0.4"}
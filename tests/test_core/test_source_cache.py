@@ -0,0 +1,104 @@
+import httpx
+import pytest
+
+from app.core import source_cache as module
+from app.core.exceptions import ForbiddenException
+from app.core.http_client import http_client
+from app.core.source_cache import SourceCache
+
+GEOJSON = b'{"type":"FeatureCollection","features":[]}'
+
+
+class FakeMinio:
+    etag = "v1"
+    reads = 0
+
+    async def stat_file(self, object_name):
+        return {"etag": FakeMinio.etag}
+
+    async def read_file(self, object_name):
+        FakeMinio.reads += 1
+        return GEOJSON
+
+
+@pytest.fixture
+def fake_minio(monkeypatch):
+    monkeypatch.setattr(module, "MinioClient", FakeMinio)
+    FakeMinio.etag = "v1"
+    FakeMinio.reads = 0
+    return FakeMinio
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Upstream HTTP dengan ETag; mengembalikan 304 jika If-None-Match cocok."""
+    state = {"etag": '"a"', "downloads": 0}
+
+    def handler(request):
+        if request.headers.get("if-none-match") == state["etag"]:
+            return httpx.Response(304)
+        state["downloads"] += 1
+        return httpx.Response(200, content=GEOJSON, headers={"etag": state["etag"]})
+
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return state
+
+
+@pytest.mark.parametrize("url", ["minio://cache/choropleth/key.json", "minio://sources/../secret.json", "minio://x"])
+async def test_minio_objects_outside_prefix_are_forbidden(fake_minio, url):
+    cache = SourceCache(ttl=60, max_bytes=1024, minio_prefixes=["sources"])
+
+    with pytest.raises(ForbiddenException):
+        await cache.fetch(url)
+    assert fake_minio.reads == 0
+
+
+async def test_minio_entry_is_revalidated_by_etag(fake_minio):
+    cache = SourceCache(ttl=0, max_bytes=1024, minio_prefixes=["sources/"])
+
+    first = await cache.fetch("minio://sources/points.geojson")
+    second = await cache.fetch("minio://sources/points.geojson")
+    assert second is first
+    assert fake_minio.reads == 1
+
+    fake_minio.etag = "v2"
+    third = await cache.fetch("minio://sources/points.geojson")
+    assert third is not first and third.read() == GEOJSON
+    assert fake_minio.reads == 2
+
+
+async def test_http_entry_is_revalidated_with_etag(upstream):
+    cache = SourceCache(ttl=0, max_bytes=1024)
+
+    first = await cache.fetch("https://example.com/points.geojson")
+    second = await cache.fetch("https://example.com/points.geojson")
+
+    assert second is first
+    assert upstream["downloads"] == 1
+
+    upstream["etag"] = '"b"'
+    third = await cache.fetch("https://example.com/points.geojson")
+    assert third is not first and third.etag == '"b"'
+    assert upstream["downloads"] == 2
+
+
+async def test_fresh_entry_skips_upstream(upstream):
+    cache = SourceCache(ttl=60, max_bytes=1024)
+
+    await cache.fetch("https://example.com/points.geojson")
+    upstream["etag"] = '"b"'
+    entry = await cache.fetch("https://example.com/points.geojson")
+
+    assert entry.etag == '"a"'
+    assert upstream["downloads"] == 1
+
+
+async def test_entries_are_evicted_by_size(upstream):
+    first = await SourceCache(ttl=60, max_bytes=1024).fetch("https://example.com/a.geojson")
+    cache = SourceCache(ttl=60, max_bytes=len(first.body) + 1)
+
+    await cache.fetch("https://example.com/a.geojson")
+    await cache.fetch("https://example.com/b.geojson")
+    await cache.fetch("https://example.com/a.geojson")
+
+    assert upstream["downloads"] == 4
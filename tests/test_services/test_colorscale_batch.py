@@ -0,0 +1,100 @@
+import httpx
+import orjson
+import pytest
+
+from app.core import geoprocessing
+from app.core.boundary_registry import BoundaryRegistry
+from app.core.choropleth_cache import ChoroplethCache
+from app.core.http_client import http_client
+from app.core.source_cache import SourceCache
+from app.schemas.mapset_schema import ColorScaleRequestSchema
+from app.services import mapset_service as module
+from app.services.mapset_service import MapsetService
+from tests.test_core.test_http_client import ConcurrencyTracker
+
+REGIONS = {"35.01": (0, 0, 1, 1), "35.02": (1, 0, 2, 1)}
+
+
+def points(count):
+    features = [
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0.05 + 0.9 * i / count + i % 2, 0.5]}}
+        for i in range(count)
+    ]
+    return orjson.dumps({"type": "FeatureCollection", "features": features})
+
+
+class Upstream(ConcurrencyTracker):
+    def __init__(self):
+        super().__init__()
+        self.downloads = []
+
+    async def __call__(self, request):
+        await super().__call__(request)
+        self.downloads.append(request.url.path)
+        if request.url.path == "/rusak.geojson":
+            return httpx.Response(500)
+        if request.url.path == "/bukan.geojson":
+            return httpx.Response(200, content=b'{"type": "FeatureCollection", "features": [{"type": ')
+        return httpx.Response(200, content=points(int(request.url.path.strip("/").split(".")[0])))
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    features = [
+        {
+            "type": "Feature",
+            "properties": {"kode": code},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[minx, miny], [maxx, miny], [maxx, maxy], [minx, maxy], [minx, miny]]],
+            },
+        }
+        for code, (minx, miny, maxx, maxy) in REGIONS.items()
+    ]
+    (tmp_path / "uji.json").write_bytes(orjson.dumps({"type": "FeatureCollection", "features": features}))
+    registry = BoundaryRegistry(str(tmp_path))
+    monkeypatch.setattr(module, "boundary_registry", registry)
+    monkeypatch.setattr(geoprocessing, "boundary_registry", registry)
+    monkeypatch.setattr(module, "source_cache", SourceCache(ttl=60, max_bytes=1024 * 1024))
+    monkeypatch.setattr(module, "choropleth_cache", ChoroplethCache(maxsize=16, use_minio=False))
+
+    upstream = Upstream()
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(upstream)))
+    monkeypatch.setattr(http_client, "max_per_host", 2)
+    monkeypatch.setattr(http_client, "_host_slots", {})
+    return upstream
+
+
+def make_service():
+    return MapsetService(None, None, None, None)
+
+
+async def test_failing_items_do_not_fail_the_batch(upstream):
+    urls = [f"https://data.example.com/{count}.geojson" for count in (4, 5, 6, 7)] + [
+        "https://data.example.com/rusak.geojson",
+        "https://data.example.com/bukan.geojson",
+        "https://lain.example.com/3.geojson",
+        "https://data.example.com/4.geojson",
+    ]
+    jobs = [ColorScaleRequestSchema(source_url=url, boundary="uji") for url in urls]
+
+    results = await make_service().generate_colorscale_batch(jobs)
+
+    totals = [sum(row["value"] for row in result["data"]) if "data" in result else None for result in results]
+    assert totals == [4, 5, 6, 7, None, None, 3, 4]
+    assert "rusak.geojson" in results[4]["error"]
+    assert results[5]["error"] == "Invalid GeoJSON data format"
+    assert results[0]["fingerprint"] == results[7]["fingerprint"]
+
+    # URL yang sama hanya diunduh sekali dan request ke satu host dibatasi.
+    assert upstream.downloads.count("/4.geojson") == 1
+    assert upstream.peak["data.example.com"] == 2
+
+
+async def test_batch_limit_is_enforced(upstream, monkeypatch):
+    monkeypatch.setattr(module.settings, "COLOR_SCALE_BATCH_MAX_JOBS", 2)
+    jobs = [ColorScaleRequestSchema(source_url=f"https://data.example.com/{i}.geojson") for i in range(3)]
+
+    with pytest.raises(module.UnprocessableEntity):
+        await make_service().generate_colorscale_batch(jobs)
+    assert upstream.downloads == []
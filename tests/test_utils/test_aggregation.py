@@ -0,0 +1,37 @@
+import numpy as np
+
+from app.utils.aggregation import AggregateFunction, PolygonAggregator
+
+
+def make_aggregator():
+    aggregator = PolygonAggregator(4)
+    aggregator.update(np.array([0, 0, 1, 1, 2]), np.array([-4.0, 2.0, 0.0, np.nan, np.nan]))
+    return aggregator
+
+
+def test_polygons_without_values_are_nan_except_count():
+    aggregator = make_aggregator()
+
+    assert aggregator.result(AggregateFunction.count).tolist() == [2, 2, 1, 0]
+    for function in (AggregateFunction.sum, AggregateFunction.mean, AggregateFunction.min, AggregateFunction.max):
+        result = aggregator.result(function)
+        assert np.isnan(result[2:]).all(), function
+
+
+def test_negative_and_zero_aggregates():
+    aggregator = make_aggregator()
+
+    assert aggregator.result(AggregateFunction.sum)[:2].tolist() == [-2.0, 0.0]
+    assert aggregator.result(AggregateFunction.mean)[:2].tolist() == [-1.0, 0.0]
+    assert aggregator.result(AggregateFunction.min)[:2].tolist() == [-4.0, 0.0]
+    assert aggregator.result(AggregateFunction.max)[:2].tolist() == [2.0, 0.0]
+
+
+def test_rollup_matches_direct_aggregation():
+    aggregator = make_aggregator()
+
+    parent = aggregator.rollup(np.array([0, 0, 1, -1]), 2)
+
+    assert parent.result(AggregateFunction.count).tolist() == [4, 1]
+    assert parent.result(AggregateFunction.sum)[0] == -2.0
+    assert np.isnan(parent.result(AggregateFunction.max)[1])
@@ -0,0 +1,101 @@
+import numpy as np
+from shapely.geometry import box
+
+from app.utils.aggregation import AggregateFunction, PolygonAggregator
+from app.utils.assignment import AssignmentState, coordinate_hash, feature_keys
+from app.utils.geojson_stream import PointChunk
+from app.utils.spatial import PointInPolygonEngine
+
+# Dua poligon bersebelahan dan satu poligon yang menumpuk keduanya.
+ENGINE = PointInPolygonEngine([box(0, 0, 1, 1), box(1, 0, 2, 1), box(0.5, 0, 1.5, 1)])
+
+
+def chunks(keys, xs, ys, values=None, size=2):
+    keys, xs, ys = np.asarray(keys, dtype=np.uint64), np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    for i in range(0, keys.size, size):
+        part = slice(i, i + size)
+        yield PointChunk(xs[part], ys[part], None if values is None else np.asarray(values)[part], keys[part])
+
+
+def pairs(state):
+    inside = state.polygons >= 0
+    first = zip(state.keys[inside].tolist(), state.polygons[inside].tolist())
+    extra = zip(state.keys[state.extra_owners].tolist(), state.extra_polygons.tolist())
+    return sorted([*first, *extra])
+
+
+def update(state, *args, **kwargs):
+    aggregator = PolygonAggregator(len(ENGINE))
+    state, joined = state.update(ENGINE, chunks(*args, **kwargs), aggregator)
+    return state, joined, aggregator
+
+
+def full_join(xs, ys, values=None):
+    aggregator = PolygonAggregator(len(ENGINE))
+    point_idx, polygon_idx = ENGINE.join(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+    aggregator.update(polygon_idx, None if values is None else np.asarray(values)[point_idx])
+    return aggregator
+
+
+def test_unchanged_features_are_reused():
+    args = ([3, 1, 2], [0.2, 1.2, 0.7], [0.5, 0.5, 0.5])
+    state, joined, _ = update(AssignmentState.empty(), *args)
+    assert joined == 3
+
+    updated, joined, aggregator = update(state, *args)
+
+    assert joined == 0
+    assert pairs(updated) == pairs(state)
+    assert aggregator.count.tolist() == full_join(*args[1:]).count.tolist() == [2, 1, 2]
+
+
+def test_update_matches_full_join_after_diff():
+    state, _, _ = update(AssignmentState.empty(), [1, 2, 3], [0.2, 1.2, 0.7], [0.5, 0.5, 0.5])
+
+    # Feature 1 berpindah, 2 dihapus, 3 tetap dan 4 baru.
+    args = ([4, 3, 1], [1.7, 0.7, 1.2], [0.5, 0.5, 0.5])
+    values = [5.0, -2.0, 8.0]
+    updated, joined, aggregator = update(state, *args, values=values)
+
+    assert joined == 2
+    assert pairs(updated) == pairs(update(AssignmentState.empty(), *args)[0])
+    expected = full_join(*args[1:], values=values)
+    for function in AggregateFunction:
+        np.testing.assert_array_equal(aggregator.result(function), expected.result(function))
+
+
+def test_overlapping_polygons_survive_reuse():
+    state, _, _ = update(AssignmentState.empty(), [1], [0.7], [0.5])
+    assert pairs(state) == sorted((int(feature_keys([1], [0.7], [0.5])[0]), p) for p in (0, 2))
+
+    updated, joined, aggregator = update(state, [1, 2], [0.7, 1.2], [0.5, 0.5], size=1)
+
+    assert joined == 1
+    assert aggregator.count.tolist() == [1, 1, 2]
+    assert updated.extra_owners.size == 2
+
+
+def test_points_outside_boundary_are_kept_in_state():
+    state, _, aggregator = update(AssignmentState.empty(), [1, 2], [5.0, 0.2], [5.0, 0.5])
+
+    assert state.polygons.tolist().count(-1) == 1
+    assert aggregator.count.tolist() == [1, 0, 0]
+    assert update(state, [1, 2], [5.0, 0.2], [5.0, 0.5])[1] == 0
+
+
+def test_duplicate_features_are_counted_separately():
+    xs, ys = [0.2, 0.2, 0.2], [0.5, 0.5, 0.5]
+    keys = coordinate_hash(np.array(xs), np.array(ys))
+    state, _, _ = update(AssignmentState.empty(), keys, xs, ys)
+
+    _, joined, aggregator = update(state, keys, xs, ys)
+
+    assert joined == 0
+    assert aggregator.count.tolist() == [3, 0, 0]
+
+
+def test_empty_source():
+    state, joined, aggregator = update(AssignmentState.empty(), [], [], [])
+
+    assert (state.keys.size, joined) == (0, 0)
+    assert aggregator.count.tolist() == [0, 0, 0]
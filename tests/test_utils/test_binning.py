@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import shape
+
+from app.utils.binning import BinShape, bin_cells, cell_polygons, group_cells
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(11)
+    return rng.uniform((95.0, -11.0), (141.0, 6.0), size=(2000, 2))
+
+
+@pytest.mark.parametrize("bin_shape", list(BinShape))
+def test_points_fall_inside_their_cell(points, bin_shape):
+    columns, rows = bin_cells(points[:, 0], points[:, 1], 0.75, bin_shape)
+    cell_columns, cell_rows, inverse = group_cells(columns, rows)
+    polygons = np.array([shape(geometry) for geometry in cell_polygons(cell_columns, cell_rows, 0.75, bin_shape)])
+
+    cells = polygons[inverse]
+    assert shapely.covers(shapely.buffer(cells, 1e-9), shapely.points(points)).all()
+
+
+def test_hexagon_cells_tile_the_plane():
+    geometries = cell_polygons(np.array([0, 1, 0]), np.array([0, 0, 1]), 1.0, BinShape.hexagon)
+    polygons = [shape(geometry) for geometry in geometries]
+
+    assert polygons[0].area == pytest.approx(3 * np.sqrt(3) / 2)
+    # Hexagon bertetangga berbagi satu sisi tanpa tumpang tindih.
+    for neighbour in polygons[1:]:
+        assert polygons[0].intersection(neighbour).area == pytest.approx(0, abs=1e-9)
+        shared = {tuple(np.round(xy, 9)) for xy in polygons[0].exterior.coords} & {
+            tuple(np.round(xy, 9)) for xy in neighbour.exterior.coords
+        }
+        assert len(shared) == 2
+
+
+def test_group_cells_counts_points():
+    columns, rows, inverse = group_cells(np.array([2, -1, 2, 2]), np.array([5, 0, 5, 6]))
+
+    cells = list(zip(columns.tolist(), rows.tolist()))
+    counts = np.bincount(inverse)
+    assert sorted(zip(cells, counts.tolist())) == [((-1, 0), 1), ((2, 5), 2), ((2, 6), 1)]
+
+
+def test_group_cells_empty():
+    columns, rows, inverse = group_cells(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    assert columns.size == rows.size == inverse.size == 0
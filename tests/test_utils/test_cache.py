@@ -0,0 +1,49 @@
+from app.utils.cache import LRUCache
+
+
+def test_least_recently_used_item_is_evicted():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_evicts_by_total_size():
+    cache = LRUCache(maxsize=None, max_bytes=10, sizeof=len)
+    cache.set("a", b"xxxx")
+    cache.set("b", b"yyyy")
+
+    cache.set("c", b"zzzz")
+
+    assert list(cache) == ["b", "c"]
+    assert cache.current_bytes == 8
+
+
+def test_oversized_value_is_not_stored():
+    cache = LRUCache(max_bytes=4, sizeof=len)
+    cache.set("a", b"xx")
+
+    cache.set("b", b"too large")
+
+    assert list(cache) == ["a"]
+    assert cache.current_bytes == 2
+
+
+def test_replacing_and_popping_keep_size_in_sync():
+    cache = LRUCache(max_bytes=100, sizeof=len)
+    cache.set("a", b"xxxx")
+    cache.set("a", b"xx")
+    assert cache.current_bytes == 2
+
+    assert cache.pop("a") == b"xx"
+    assert cache.pop("a", "hilang") == "hilang"
+    assert (len(cache), cache.current_bytes) == (0, 0)
+
+    cache.set("b", b"yyy")
+    cache.clear()
+    assert (len(cache), cache.current_bytes) == (0, 0)
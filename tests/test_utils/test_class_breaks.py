@@ -0,0 +1,177 @@
+import numpy as np
+import pytest
+
+from app.utils.class_breaks import (
+    NO_DATA_COLOR,
+    ClassificationMethod,
+    assign_classes,
+    build_rangelist,
+    classify,
+    compute_breaks,
+)
+
+COLOR_RANGE = ["#FFEDA0", "#800026"]
+
+
+def test_count_zero_is_no_data():
+    values = np.array([0, 1, 2, 3, 10, 20], dtype=np.float64)
+
+    index, rangelist = classify(values, COLOR_RANGE, ClassificationMethod.equal_interval, classes=2)
+
+    assert rangelist[0] == {"from": 0, "to": 0, "color": NO_DATA_COLOR, "total_cluster": 1}
+    assert [(item["from"], item["to"]) for item in rangelist[1:]] == [(1, 11), (12, 20)]
+    assert index.tolist() == [0, 1, 1, 1, 1, 2]
+    assert [item["total_cluster"] for item in rangelist] == [1, 4, 1]
+
+
+def test_negative_and_zero_values_are_classified():
+    values = np.array([-10.0, -5.0, 0.0, 5.0, 10.0, np.nan])
+
+    index, rangelist = classify(
+        values, COLOR_RANGE, ClassificationMethod.equal_interval, classes=2, integer=False, zero_is_no_data=False
+    )
+
+    assert rangelist[0]["from"] is None and rangelist[0]["to"] is None
+    assert [(item["from"], item["to"]) for item in rangelist[1:]] == [(-10, 0), (0, 10)]
+    assert index.tolist() == [1, 1, 1, 2, 2, 0]
+    assert [item["total_cluster"] for item in rangelist] == [1, 3, 2]
+
+
+def test_all_negative_values_get_a_colour():
+    values = np.array([-3.5, -2.0, -1.0])
+
+    index, rangelist = classify(values, COLOR_RANGE, classes=3, integer=False, zero_is_no_data=False)
+
+    assert (index > 0).all()
+    assert sum(item["total_cluster"] for item in rangelist[1:]) == 3
+
+
+def test_values_outside_ranges_get_minus_one():
+    rangelist = build_rangelist(np.array([1.0, 5.0, 9.0]), COLOR_RANGE, integer=False, zero_is_no_data=False)
+
+    index = assign_classes(np.array([0.5, 1.0, 5.0, 5.5, 9.5]), rangelist, zero_is_no_data=False)
+
+    assert index.tolist() == [-1, 1, 1, 2, -1]
+    assert [item["total_cluster"] for item in rangelist] == [0, 2, 1]
+
+
+def test_compute_breaks_ignores_no_data():
+    values = np.array([np.nan, 0, 2, 4, 6, 8])
+
+    assert compute_breaks(values, ClassificationMethod.equal_interval, 2).tolist() == [2, 5, 8]
+    assert compute_breaks(
+        values, ClassificationMethod.equal_interval, 2, integer=False, zero_is_no_data=False
+    ).tolist() == [0, 4, 8]
+
+
+@pytest.mark.parametrize("method", list(ClassificationMethod))
+def test_breaks_are_sorted_and_cover_data(method):
+    values = np.random.default_rng(7).normal(0, 50, 500)
+
+    breaks = compute_breaks(values, method, 5, integer=False, zero_is_no_data=False)
+
+    assert np.all(np.diff(breaks) > 0)
+    assert breaks[0] == values.min() and breaks[-1] == values.max()
+
+
+def test_jenks_separates_clusters():
+    values = np.array([1.0, 2.0, 3.0, 50.0, 51.0, 52.0, 100.0, 101.0, 102.0])
+
+    breaks = compute_breaks(values, ClassificationMethod.natural_breaks, 3, integer=False)
+
+    assert breaks.tolist() == [1, 3, 52, 102]
+
+
+def brute_force_jenks_cost(data, classes):
+    # DP O(k * n^2) tanpa optimisasi, sebagai acuan SSD minimum.
+    n = data.size
+    cost = np.full((classes + 1, n + 1), np.inf)
+    cost[0, 0] = 0
+    for c in range(1, classes + 1):
+        for end in range(1, n + 1):
+            for start in range(c - 1, end):
+                segment = data[start:end]
+                cost[c, end] = min(cost[c, end], cost[c - 1, start] + ((segment - segment.mean()) ** 2).sum())
+    return cost[classes, n]
+
+
+def breaks_cost(data, breaks):
+    # Nilai pada batas masuk kelas yang lebih rendah, sama dengan assign_classes.
+    position = np.searchsorted(breaks[1:], data, side="left")
+    return sum(((data[position == i] - data[position == i].mean()) ** 2).sum() for i in np.unique(position))
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("classes", [2, 3, 5])
+def test_jenks_matches_brute_force(seed, classes):
+    data = np.sort(np.random.default_rng(seed).choice(np.arange(-20, 60, 0.5), 40))
+
+    breaks = compute_breaks(data, ClassificationMethod.natural_breaks, classes, integer=False, zero_is_no_data=False)
+
+    assert breaks.size == classes + 1
+    assert breaks_cost(data, breaks) == pytest.approx(brute_force_jenks_cost(data, classes))
+
+
+def test_jenks_with_fewer_unique_values_than_classes():
+    values = np.array([4.0, 4.0, 9.0, 9.0, 9.0])
+
+    assert compute_breaks(values, ClassificationMethod.natural_breaks, 5, integer=False).tolist() == [4, 9]
+
+
+def test_quantile_breaks_follow_percentiles():
+    values = np.arange(1, 101, dtype=np.float64)
+
+    breaks = compute_breaks(values, ClassificationMethod.quantile, 4, integer=False)
+    index, rangelist = classify(values, COLOR_RANGE, ClassificationMethod.quantile, classes=4, integer=False)
+
+    assert breaks.tolist() == np.percentile(values, [0, 25, 50, 75, 100]).tolist()
+    assert [item["total_cluster"] for item in rangelist] == [0, 25, 25, 25, 25]
+    assert (index > 0).all()
+
+
+def test_quantile_reduces_classes_for_repeated_values():
+    values = np.array([1.0] * 10 + [2.0, 3.0])
+
+    breaks = compute_breaks(values, ClassificationMethod.quantile, 5)
+
+    assert np.all(np.diff(breaks) > 0)
+    assert breaks[0] == 1 and breaks[-1] == 3
+
+
+def test_equal_interval_breaks_are_evenly_spaced():
+    values = np.array([-4.0, 1.0, 3.0, 16.0])
+
+    breaks = compute_breaks(values, ClassificationMethod.equal_interval, 4, integer=False, zero_is_no_data=False)
+
+    assert breaks.tolist() == [-4, 1, 6, 11, 16]
+
+
+def test_std_dev_breaks_are_centred_on_mean():
+    values = np.random.default_rng(3).normal(100, 10, 1000)
+
+    breaks = compute_breaks(values, ClassificationMethod.std_dev, 4, integer=False, zero_is_no_data=False)
+
+    expected = values.mean() + np.array([-1, 0, 1]) * values.std()
+    np.testing.assert_allclose(breaks[1:-1], expected)
+    assert breaks[0] == values.min() and breaks[-1] == values.max()
+
+
+@pytest.mark.parametrize("method", list(ClassificationMethod))
+def test_single_and_empty_inputs(method):
+    assert compute_breaks(np.array([7.2]), method, 5).tolist() == [8]
+    assert compute_breaks(np.array([0.0, np.nan]), method, 5).tolist() == []
+
+    index, rangelist = classify(np.array([0.0, 0.0]), COLOR_RANGE, method)
+    assert index.tolist() == [0, 0] and len(rangelist) == 1
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        compute_breaks(np.array([1.0, 2.0, 3.0]), "geometric")
+
+
+def test_rangelist_colours_span_the_colour_range():
+    rangelist = build_rangelist(np.array([1, 10, 20, 30]), ["#ffffff", "#000000"])
+
+    assert rangelist[1]["color"] == "#fff" and rangelist[-1]["color"] == "#000"
+    assert [(item["from"], item["to"]) for item in rangelist[1:]] == [(1, 10), (11, 20), (21, 30)]
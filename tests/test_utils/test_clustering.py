@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from app.utils.clustering import ClusterIndex, lonlat_to_unit, unit_to_lonlat
+from app.utils.geojson_stream import PointChunk
+
+WORLD = (-180, -85, 180, 85)
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(7)
+    # Dua kelompok titik yang berjauhan (Jakarta dan Makassar) ditambah satu titik terpencil.
+    jakarta = rng.normal((106.8, -6.2), 0.01, size=(50, 2))
+    makassar = rng.normal((119.4, -5.1), 0.01, size=(30, 2))
+    return np.vstack((jakarta, makassar, [(140.7, -2.5)]))
+
+
+def test_unit_projection_round_trip():
+    lon, lat = np.array([-120.0, 0.0, 106.8]), np.array([45.0, 0.0, -6.2])
+
+    result_lon, result_lat = unit_to_lonlat(*lonlat_to_unit(lon, lat))
+
+    assert result_lon == pytest.approx(lon)
+    assert result_lat == pytest.approx(lat)
+
+
+def test_every_zoom_keeps_all_points(points):
+    index = ClusterIndex(points[:, 0], points[:, 1], max_zoom=10)
+
+    for zoom in range(0, 12):
+        features = index.query(WORLD, zoom)
+        assert sum(feature["properties"]["point_count"] for feature in features) == len(points)
+
+
+def test_low_zoom_groups_clusters(points):
+    index = ClusterIndex(points[:, 0], points[:, 1], max_zoom=10)
+
+    features = sorted(index.query(WORLD, 3), key=lambda feature: feature["geometry"]["coordinates"][0])
+
+    assert [feature["properties"]["point_count"] for feature in features] == [50, 30, 1]
+    assert features[2]["properties"] == {"cluster": False, "point_count": 1, "index": 80}
+    lon, lat = features[0]["geometry"]["coordinates"]
+    assert (lon, lat) == pytest.approx(points[:50].mean(axis=0), abs=0.01)
+
+
+def test_expansion_zoom_splits_cluster(points):
+    index = ClusterIndex(points[:, 0], points[:, 1], max_zoom=16)
+    jakarta_bbox = (106.0, -7.0, 107.5, -5.5)
+
+    cluster = index.query(jakarta_bbox, 3)[0]["properties"]
+    assert cluster["cluster"] and cluster["point_count"] == 50
+
+    zoom = cluster["expansion_zoom"]
+    assert len(index.query(jakarta_bbox, zoom - 1)) == 1
+    assert len(index.query(jakarta_bbox, zoom)) > 1
+
+
+def test_leaves_map_to_source_order(points):
+    index = ClusterIndex(points[:, 0], points[:, 1], max_zoom=10)
+
+    features = index.query(WORLD, 11)
+
+    assert sorted(feature["properties"]["index"] for feature in features) == list(range(len(points)))
+    for feature in features:
+        assert feature["geometry"]["coordinates"] == pytest.approx(points[feature["properties"]["index"]])
+
+
+def test_bbox_filters_points(points):
+    index = ClusterIndex(points[:, 0], points[:, 1], max_zoom=10)
+
+    features = index.query((118, -6, 121, -4), 11)
+
+    assert sorted(feature["properties"]["index"] for feature in features) == list(range(50, 80))
+    assert index.query((0, 0, 10, 10), 5) == []
+
+
+def test_empty_index():
+    index = ClusterIndex(np.empty(0), np.empty(0), max_zoom=5)
+
+    assert len(index) == 0
+    assert index.query(WORLD, 3) == []
+
+
+def test_index_from_chunks_matches_arrays(points):
+    chunks = [PointChunk(part[:, 0], part[:, 1]) for part in np.array_split(points, 4)]
+
+    streamed = ClusterIndex.from_chunks(iter(chunks), max_zoom=10)
+    direct = ClusterIndex(points[:, 0], points[:, 1], max_zoom=10)
+
+    for zoom in (0, 3, 11):
+        assert streamed.query(WORLD, zoom) == direct.query(WORLD, zoom)
+    assert len(ClusterIndex.from_chunks(iter([]), max_zoom=5)) == 0
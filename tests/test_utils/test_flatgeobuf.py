@@ -0,0 +1,186 @@
+import math
+import struct
+
+import numpy as np
+import pytest
+
+from app.utils.flatgeobuf import iter_point_chunks
+
+# ColumnType dan GeometryType FlatGeobuf yang dipakai fixture.
+_INT, _DOUBLE, _STRING = 5, 10, 11
+_UNKNOWN, _POINT, _LINESTRING = 0, 1, 2
+
+
+def _write_table(out, fields):
+    """
+    Tulis table FlatBuffers: vtable, table, lalu objek yang dirujuk (offset selalu maju).
+
+    `fields` berisi {indeks field: (jenis, nilai)} dengan jenis `scalar` (nilai berupa
+    (format struct, nilai)), `table`, `tables`, `string`, `bytes` atau `doubles`.
+    """
+    layout, size = {}, 4
+    for index in sorted(fields):
+        kind, value = fields[index]
+        layout[index] = size
+        size += struct.calcsize(value[0]) if kind == "scalar" else 4
+
+    count = max(fields) + 1 if fields else 0
+    vtable_pos = len(out)
+    out += struct.pack("<HH", 4 + 2 * count, size)
+    out += b"".join(struct.pack("<H", layout.get(i, 0)) for i in range(count))
+    table_pos = len(out)
+    out += struct.pack("<i", table_pos - vtable_pos) + bytes(size - 4)
+
+    for index, (kind, value) in sorted(fields.items()):
+        field_pos = table_pos + layout[index]
+        if kind == "scalar":
+            struct.pack_into(value[0], out, field_pos, value[1])
+        else:
+            struct.pack_into("<I", out, field_pos, _write_child(out, kind, value) - field_pos)
+    return table_pos
+
+
+def _write_child(out, kind, value):
+    if kind == "table":
+        return _write_table(out, value)
+    pos = len(out)
+    if kind == "tables":
+        out += struct.pack("<I", len(value)) + bytes(4 * len(value))
+        for i, fields in enumerate(value):
+            slot = pos + 4 + 4 * i
+            struct.pack_into("<I", out, slot, _write_table(out, fields) - slot)
+    elif kind == "doubles":
+        out += struct.pack(f"<I{len(value)}d", len(value), *value)
+    else:
+        data = value.encode() + b"\0" if kind == "string" else value
+        out += struct.pack("<I", len(data) - (kind == "string")) + data
+    return pos
+
+
+def _flatbuffer(fields):
+    out = bytearray(4)
+    struct.pack_into("<I", out, 0, _write_table(out, fields))
+    return bytes(out)
+
+
+def _properties(values):
+    out = bytearray()
+    for column, column_type, value in values:
+        out += struct.pack("<H", column)
+        if column_type == _INT:
+            out += struct.pack("<i", value)
+        elif column_type == _DOUBLE:
+            out += struct.pack("<d", value)
+        else:
+            out += struct.pack("<I", len(value.encode())) + value.encode()
+    return bytes(out)
+
+
+def _index_nodes(count, node_size):
+    nodes, level = count, count
+    while True:
+        level = -(-level // node_size)
+        nodes += level
+        if level == 1:
+            return nodes
+
+
+def make_fgb(features, geometry_type=_POINT, columns=(), node_size=16, index=True):
+    """
+    Buat file FlatGeobuf. `features` berisi (tipe geometri, koordinat datar, properti).
+
+    Index R-tree diisi node berisi bbox asli (bukan nol) sehingga salah hitung ukuran
+    index terlihat sebagai data rusak.
+    """
+    header = _flatbuffer(
+        {
+            0: ("string", "titik"),
+            2: ("scalar", ("<B", geometry_type)),
+            7: ("tables", [{0: ("string", name), 1: ("scalar", ("<B", kind))} for name, kind in columns]),
+            8: ("scalar", ("<Q", len(features))),
+            9: ("scalar", ("<H", node_size if index else 0)),
+        }
+    )
+    out = bytearray(b"fgb\x03fgb\x00") + struct.pack("<I", len(header)) + header
+
+    if index and features:
+        coords = np.concatenate([np.asarray(xy, dtype=np.float64).reshape(-1, 2) for _, xy, _ in features])
+        bbox = (*coords.min(axis=0), *coords.max(axis=0))
+        out += struct.pack("<4dQ", *bbox, 1 << 62) * _index_nodes(len(features), node_size)
+
+    for kind, xy, properties in features:
+        geometry = {1: ("doubles", list(xy))}
+        if geometry_type == _UNKNOWN:
+            geometry[6] = ("scalar", ("<B", kind))
+        feature = {0: ("table", geometry)}
+        if properties:
+            feature[1] = ("bytes", _properties(properties))
+        data = _flatbuffer(feature)
+        out += struct.pack("<I", len(data)) + data
+    return bytes(out)
+
+
+def read_all(data, **kwargs):
+    chunks = list(iter_point_chunks(data, **kwargs))
+    if not chunks:
+        return np.empty(0), np.empty(0), None
+    xs, ys, values = zip(*chunks)
+    return np.concatenate(xs), np.concatenate(ys), None if values[0] is None else np.concatenate(values)
+
+
+def points(n):
+    return [(_POINT, (106.0 + i * 0.01, -6.0 - i * 0.01), [(0, _DOUBLE, float(i))]) for i in range(n)]
+
+
+@pytest.mark.parametrize("index", [True, False])
+@pytest.mark.parametrize("n", [1, 2, 17, 300])
+def test_reads_points_with_and_without_index(n, index):
+    data = make_fgb(points(n), columns=[("nilai", _DOUBLE)], index=index)
+
+    xs, ys, values = read_all(data, chunk_size=64, value_field="nilai")
+
+    assert xs.tolist() == pytest.approx([106.0 + i * 0.01 for i in range(n)])
+    assert ys.tolist() == pytest.approx([-6.0 - i * 0.01 for i in range(n)])
+    assert values.tolist() == [float(i) for i in range(n)]
+
+
+def test_non_point_geometries_are_skipped():
+    features = [
+        (_POINT, (1.0, 2.0), None),
+        (_LINESTRING, (0.0, 0.0, 1.0, 1.0), None),
+        (_POINT, (3.0, 4.0), None),
+    ]
+
+    xs, ys, _ = read_all(make_fgb(features, geometry_type=_UNKNOWN))
+
+    assert list(zip(xs.tolist(), ys.tolist())) == [(1.0, 2.0), (3.0, 4.0)]
+    assert read_all(make_fgb(features[1:2], geometry_type=_LINESTRING))[0].size == 0
+
+
+def test_numeric_and_text_properties():
+    columns = [("nama", _STRING), ("jumlah", _INT), ("teks_angka", _STRING)]
+    features = [
+        (_POINT, (1.0, 1.0), [(0, _STRING, "Bogor"), (1, _INT, -7), (2, _STRING, "2.5")]),
+        (_POINT, (2.0, 2.0), [(0, _STRING, "Depok"), (2, _STRING, "bukan angka")]),
+    ]
+    data = make_fgb(features, columns=columns)
+
+    assert read_all(data, value_field="jumlah")[2].tolist()[0] == -7.0
+    assert math.isnan(read_all(data, value_field="jumlah")[2][1])
+    assert read_all(data, value_field="teks_angka")[2].tolist()[0] == 2.5
+    assert math.isnan(read_all(data, value_field="nama")[2][0])
+    assert np.isnan(read_all(data, value_field="tidak_ada")[2]).all()
+
+
+@pytest.mark.parametrize("n", [1, 5])
+def test_truncated_file_raises_value_error(n):
+    data = make_fgb(points(n), columns=[("nilai", _DOUBLE)])
+
+    for size in (10, 20, len(data) - 1, len(data) - 20):
+        with pytest.raises(ValueError):
+            read_all(data[:size], value_field="nilai")
+
+
+def test_invalid_magic_raises_value_error():
+    with pytest.raises(ValueError, match="tidak valid"):
+        read_all(b'{"type": "FeatureCollection"}')
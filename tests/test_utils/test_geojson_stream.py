@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import orjson
+import pytest
+
+from app.utils.geojson_stream import iter_features, iter_point_chunks
+
+DOCUMENT = (
+    '{"type": "FeatureCollection", "name": "Sekolah \\"Negeri\\"", "features": [\n'
+    '  {"type": "Feature", "id": 1, "geometry": {"type": "Point", "coordinates": [106.8271, -6.1754]},'
+    ' "properties": {"nama": "SD Caf\\u00e9", "jumlah": 1250}},\n'
+    '  {"type": "Feature", "geometry": {"type": "Point", "coordinates": [-1.5e2, 2.5E-1, 10]},'
+    ' "properties": {"nama": "Sekolah \\\\ Ujung", "jumlah": -3.75}},\n'
+    '  {"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},'
+    ' "properties": {"jumlah": 9}},\n'
+    '  {"type": "Feature", "geometry": null, "properties": {"jumlah": 9}},\n'
+    '  {"type": "Feature", "geometry": {"type": "Point", "coordinates": [110.0, -7.0]}, "properties": null},\n'
+    '  {"type": "Feature", "geometry": {"type": "Point", "coordinates": [111.0, -7.5]},'
+    ' "properties": {"nama": "Pesantren éè", "jumlah": "bukan angka"}}\n'
+    "]}"
+).encode()
+
+
+def split(data, *positions):
+    bounds = [0, *positions, len(data)]
+    return [data[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def test_features_match_full_parse():
+    assert list(iter_features([DOCUMENT])) == orjson.loads(DOCUMENT)["features"]
+
+
+@pytest.mark.parametrize("marker", ["1250", "\\u00e9", '\\"Negeri', "\\\\ Ujung", "-1.5e2", "éè", "features"])
+def test_split_inside_tokens(marker):
+    expected = orjson.loads(DOCUMENT)["features"]
+    start = DOCUMENT.index(marker.encode())
+
+    for offset in range(1, len(marker.encode())):
+        assert list(iter_features(split(DOCUMENT, start + offset))) == expected
+
+
+def test_every_split_position_and_single_bytes():
+    expected = orjson.loads(DOCUMENT)["features"]
+
+    for position in range(1, len(DOCUMENT)):
+        assert list(iter_features(split(DOCUMENT, position))) == expected
+    assert list(iter_features(DOCUMENT[i : i + 1] for i in range(len(DOCUMENT)))) == expected
+
+
+def test_point_chunks_skip_other_geometries_and_missing_values():
+    chunks = list(iter_point_chunks(iter_features([DOCUMENT]), chunk_size=2, value_field="jumlah", with_keys=True))
+
+    assert [chunk.x.size for chunk in chunks] == [2, 2]
+    xs = np.concatenate([chunk.x for chunk in chunks])
+    values = np.concatenate([chunk.values for chunk in chunks])
+    assert xs.tolist() == [106.8271, -150.0, 110.0, 111.0]
+    assert values[:2].tolist() == [1250.0, -3.75]
+    assert math.isnan(values[2]) and math.isnan(values[3])
+    assert np.unique(np.concatenate([chunk.keys for chunk in chunks])).size == 4
+
+
+def test_missing_value_field_is_nan():
+    (chunk,) = iter_point_chunks(iter_features([DOCUMENT]), value_field="tidak_ada")
+
+    assert np.isnan(chunk.values).all()
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"type": "FeatureCollection"}',
+        b'{"type": "FeatureCollection", "features": [{"type": "Feature"',
+        b'{"type": "FeatureCollection", "features": [{"type": "Feature"}',
+        b'{"type": "FeatureCollection", "features": [{"type": "Feature"}, nope]}',
+        b'{"type": "FeatureCollection", "features": [{"geometry": {"type": "Point", "coordinates": ["a", 1]}}]}',
+    ],
+)
+def test_invalid_documents_raise_value_error(document):
+    for chunks in ([document], split(document, len(document) // 2)):
+        with pytest.raises(ValueError):
+            list(iter_point_chunks(iter_features(chunks)))
+
+
+def test_non_object_features_are_skipped():
+    document = (
+        b'{"features": [1, "x", [2], {"geometry": "rusak"},'
+        b' {"geometry": {"type": "Point", "coordinates": [1, 2]}}]}'
+    )
+
+    (chunk,) = iter_point_chunks(iter_features([document]))
+
+    assert (chunk.x.tolist(), chunk.y.tolist()) == ([1.0], [2.0])
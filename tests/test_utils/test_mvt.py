@@ -0,0 +1,157 @@
+import struct
+
+import pytest
+import shapely
+from shapely.geometry import Polygon, box
+
+from app.utils.mvt import EARTH_HALF_CIRCUMFERENCE, EXTENT, encode_tile, tile_bounds, to_tile_geometry
+
+
+def read_varint(data, i):
+    value = shift = 0
+    while True:
+        byte = data[i]
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        i += 1
+        if byte < 0x80:
+            return value, i
+
+
+def read_fields(data):
+    i = 0
+    while i < len(data):
+        key, i = read_varint(data, i)
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, i = read_varint(data, i)
+        elif wire_type == 1:
+            value, i = data[i : i + 8], i + 8
+        else:
+            size, i = read_varint(data, i)
+            value, i = data[i : i + size], i + size
+        yield field, value
+
+
+def read_packed(data):
+    values, i = [], 0
+    while i < len(data):
+        value, i = read_varint(data, i)
+        values.append(value)
+    return values
+
+
+def unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def read_value(data):
+    field, value = next(read_fields(data))
+    return {
+        1: lambda: value.decode(),
+        3: lambda: struct.unpack("<d", value)[0],
+        5: lambda: value,
+        6: lambda: unzigzag(value),
+        7: lambda: bool(value),
+    }[field]()
+
+
+def read_rings(commands):
+    rings, x, y, i = [], 0, 0, 0
+    while i < len(commands):
+        command, count = commands[i] & 0x7, commands[i] >> 3
+        i += 1
+        if command == 7:
+            continue
+        if command == 1:
+            rings.append([])
+        for _ in range(count):
+            x += unzigzag(commands[i])
+            y += unzigzag(commands[i + 1])
+            rings[-1].append((x, y))
+            i += 2
+    return rings
+
+
+def decode_tile(tile):
+    """Decoder MVT minimal untuk memeriksa isi tile hasil `encode_tile`."""
+    layers = {}
+    for _, layer_data in read_fields(tile):
+        layer = {"keys": [], "values": [], "features": []}
+        for field, value in read_fields(layer_data):
+            if field == 1:
+                layer["name"] = value.decode()
+            elif field == 2:
+                layer["features"].append(dict(read_fields(value)))
+            elif field == 3:
+                layer["keys"].append(value.decode())
+            elif field == 4:
+                layer["values"].append(read_value(value))
+            elif field == 5:
+                layer["extent"] = value
+            elif field == 15:
+                layer["version"] = value
+
+        for feature in layer["features"]:
+            tags = read_packed(feature.get(2, b""))
+            feature["properties"] = {
+                layer["keys"][tags[i]]: layer["values"][tags[i + 1]] for i in range(0, len(tags), 2)
+            }
+            feature["rings"] = read_rings(read_packed(feature[4]))
+        layers[layer["name"]] = layer
+    return layers
+
+
+def signed_area(ring):
+    # Positif berarti searah jarum jam pada koordinat tile (sumbu y ke bawah).
+    return sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(ring, ring[1:] + ring[:1]))
+
+
+def test_tile_bounds():
+    half = EARTH_HALF_CIRCUMFERENCE
+    assert tile_bounds(0, 0, 0) == pytest.approx((-half, -half, half, half))
+    assert tile_bounds(1, 0, 1) == pytest.approx((-half, -half, 0, 0))
+    assert tile_bounds(1, 1, 0) == pytest.approx((0, 0, half, half))
+
+
+def test_tile_geometry_is_clipped_to_buffer():
+    bounds = tile_bounds(1, 1, 0)
+    geometry = to_tile_geometry(box(-1e6, -1e6, 1e6, 1e6), bounds, buffer=64)
+
+    minx, miny, maxx, maxy = geometry.bounds
+    assert (minx, maxy) == (-64, EXTENT + 64)
+    assert maxx == pytest.approx(EXTENT * 1e6 / EARTH_HALF_CIRCUMFERENCE, abs=1)
+    assert miny == pytest.approx(EXTENT - EXTENT * 1e6 / EARTH_HALF_CIRCUMFERENCE, abs=1)
+    assert to_tile_geometry(box(-2e6, -2e6, -1e6, -1e6), bounds) is None
+
+
+def test_encode_tile_layers_and_attributes():
+    square = Polygon([(0, 0), (100, 0), (100, 100), (0, 100)], [[(25, 25), (25, 75), (75, 75), (75, 25)]])
+    attributes = [
+        {"name": "Kota A", "value": 12, "ratio": 0.5, "delta": -3, "flag": True, "missing": float("nan")},
+        {"name": "Kosong"},
+        {"name": "Kota B", "value": 12, "extra": None},
+    ]
+    tile = encode_tile(
+        [
+            ("choropleth", [square, None, box(200, 200, 300, 300)], attributes),
+            ("empty", [None], [{}]),
+        ]
+    )
+
+    layers = decode_tile(tile)
+    assert list(layers) == ["choropleth"]
+    layer = layers["choropleth"]
+    assert (layer["version"], layer["extent"]) == (2, EXTENT)
+    assert [feature[1] for feature in layer["features"]] == [0, 2]
+    assert [feature[3] for feature in layer["features"]] == [3, 3]
+
+    first, second = layer["features"]
+    assert first["properties"] == {"name": "Kota A", "value": 12, "ratio": 0.5, "delta": -3, "flag": True}
+    assert second["properties"] == {"name": "Kota B", "value": 12}
+    assert layer["values"].count(12) == 1
+
+    exterior, interior = first["rings"]
+    assert signed_area(exterior) > 0 > signed_area(interior)
+    assert shapely.Polygon(exterior, [interior]).area == square.area
+    assert shapely.Polygon(*second["rings"]).equals(box(200, 200, 300, 300))
@@ -0,0 +1,69 @@
+import builtins
+
+import numpy as np
+import pytest
+
+from app.utils.reprojection import WEB_MERCATOR, WGS84, get_transformer, normalize_crs
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        (None, WGS84),
+        ("WGS 84", WGS84),
+        ("epsg 4326", WGS84),
+        ("Pseudo-Mercator", WEB_MERCATOR),
+        ("UTM 49S", "EPSG:32749"),
+        ("WGS 84 / UTM zone 50N", "EPSG:32650"),
+        ("+proj=longlat", "+proj=longlat"),
+    ],
+)
+def test_normalize_crs(name, expected):
+    assert normalize_crs(name) == expected
+
+
+def test_same_crs_needs_no_transformer():
+    assert get_transformer("WGS 84") is None
+
+
+def test_utm_central_meridian():
+    transformer = get_transformer("EPSG:32749")
+
+    lon, lat = transformer(np.array([500000.0]), np.array([10000000.0]))
+
+    assert lon[0] == pytest.approx(111.0)
+    assert lat[0] == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    "crs, xs, ys",
+    [
+        ("EPSG:32749", [200000.0, 500000.0, 800000.0], [9100000.0, 9200000.0, 9900000.0]),
+        ("EPSG:32650", [250000.0, 500000.0, 750000.0], [10000.0, 300000.0, 600000.0]),
+        (WEB_MERCATOR, [1.2e7, 1.25e7, 1.3e7], [-9e5, -8e5, 1e5]),
+    ],
+)
+def test_builtin_transformers_match_pyproj(crs, xs, ys):
+    pyproj = pytest.importorskip("pyproj")
+    xs, ys = np.array(xs), np.array(ys)
+
+    lon, lat = get_transformer(crs)(xs, ys)
+    expected_lon, expected_lat = pyproj.Transformer.from_crs(crs, WGS84, always_xy=True).transform(xs, ys)
+
+    np.testing.assert_allclose(lon, expected_lon, atol=1e-6)
+    np.testing.assert_allclose(lat, expected_lat, atol=1e-6)
+
+
+def test_other_crs_without_pyproj_is_rejected(monkeypatch):
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name.startswith("pyproj"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    get_transformer.cache_clear()
+
+    with pytest.raises(ValueError, match="pyproj"):
+        get_transformer("EPSG:23830")
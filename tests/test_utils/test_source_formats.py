@@ -0,0 +1,90 @@
+import importlib.util
+import zlib
+
+import numpy as np
+import orjson
+import pytest
+import shapely
+
+from app.core.source_cache import SourceEntry
+from app.utils.source_formats import SourceFormat, detect_format, iter_source_point_chunks, missing_dependency
+
+
+def test_detect_format_from_magic_bytes():
+    assert detect_format(b"PAR1\x15\x04") == SourceFormat.geoparquet
+    assert detect_format(b"ARROW1\x00\x00") == SourceFormat.arrow
+    assert detect_format(b'{"type":"FeatureCollection"') == SourceFormat.geojson
+
+
+def test_columnar_formats_need_pyarrow(monkeypatch):
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+
+    assert missing_dependency(SourceFormat.geoparquet) == "pyarrow"
+    assert missing_dependency(SourceFormat.arrow) == "pyarrow"
+    assert missing_dependency(SourceFormat.geojson) is None
+    assert missing_dependency(SourceFormat.flatgeobuf) is None
+
+
+def make_source(body):
+    return SourceEntry("https://example.com/titik", zlib.compress(body), len(body), "digest")
+
+
+def read_source(body, **kwargs):
+    chunks = list(iter_source_point_chunks(make_source(body), chunk_size=3, value_field="nilai", **kwargs))
+    return (
+        np.concatenate([chunk.x for chunk in chunks]),
+        np.concatenate([chunk.y for chunk in chunks]),
+        np.concatenate([chunk.values for chunk in chunks]),
+    )
+
+
+POINTS = [(106.8 + i * 0.1, -6.2 - i * 0.05, float(i) if i != 3 else None) for i in range(7)]
+
+
+@pytest.fixture(scope="module")
+def geojson_points():
+    features = [
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [x, y]}, "properties": {"nilai": value}}
+        for x, y, value in POINTS
+    ]
+    return read_source(orjson.dumps({"type": "FeatureCollection", "features": features}))
+
+
+def assert_same_points(result, expected):
+    for actual, wanted in zip(result, expected):
+        np.testing.assert_allclose(actual, wanted, equal_nan=True)
+
+
+def test_geoparquet_matches_geojson(geojson_points):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    geometry = shapely.to_wkb(shapely.points([(x, y) for x, y, _ in POINTS]))
+    table = pa.table({"geometry": geometry, "nilai": [value for _, _, value in POINTS]})
+    metadata = {"primary_column": "geometry", "columns": {"geometry": {"encoding": "WKB"}}}
+    table = table.replace_schema_metadata({b"geo": orjson.dumps(metadata)})
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, row_group_size=4)
+
+    body = sink.getvalue().to_pybytes()
+    assert detect_format(body[:8]) == SourceFormat.geoparquet
+    assert_same_points(read_source(body), geojson_points)
+
+
+def test_arrow_ipc_matches_geojson(geojson_points):
+    pa = pytest.importorskip("pyarrow")
+
+    table = pa.table(
+        {
+            "lon": [x for x, _, _ in POINTS],
+            "lat": [y for _, y, _ in POINTS],
+            "nilai": [value for _, _, value in POINTS],
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=4)
+
+    body = sink.getvalue().to_pybytes()
+    assert detect_format(body[:8]) == SourceFormat.arrow
+    assert_same_points(read_source(body), geojson_points)
@@ -0,0 +1,45 @@
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon, Polygon, box
+
+from app.utils.spatial import PointInPolygonEngine
+
+POLYGONS = [
+    box(0, 0, 2, 2),
+    Polygon([(2, 0), (4, 0), (4, 2), (2, 2)], holes=[[(2.5, 0.5), (3.5, 0.5), (3.5, 1.5), (2.5, 1.5)]]),
+    MultiPolygon([box(0, 3, 1, 4), box(3, 3, 4, 4)]),
+    Polygon([(1, 1), (3, 1), (2, 3.5)]),
+]
+
+
+def brute_force_pairs(xs, ys):
+    pairs = [
+        (point, polygon)
+        for polygon, geometry in enumerate(POLYGONS)
+        for point in np.flatnonzero(shapely.contains_xy(geometry, xs, ys))
+    ]
+    return sorted(pairs)
+
+
+def test_join_matches_brute_force():
+    rng = np.random.default_rng(1)
+    xs, ys = rng.uniform(-0.5, 4.5, 5000), rng.uniform(-0.5, 4.5, 5000)
+
+    point_idx, polygon_idx = PointInPolygonEngine(POLYGONS).join(xs, ys)
+
+    assert sorted(zip(point_idx.tolist(), polygon_idx.tolist())) == brute_force_pairs(xs, ys)
+
+
+def test_count_handles_holes_multipolygons_and_overlaps():
+    engine = PointInPolygonEngine(POLYGONS)
+    xs = np.array([0.5, 3.0, 2.2, 0.5, 3.5, 2.0, 10.0])
+    ys = np.array([0.5, 1.0, 0.2, 3.5, 3.5, 1.5, 10.0])
+
+    assert engine.count(xs, ys).tolist() == [1, 1, 2, 1]
+
+
+def test_empty_inputs():
+    engine = PointInPolygonEngine(POLYGONS)
+
+    assert engine.count(np.empty(0), np.empty(0)).tolist() == [0, 0, 0, 0]
+    assert PointInPolygonEngine([]).count(np.array([1.0]), np.array([1.0])).tolist() == []
@@ -0,0 +1,79 @@
+import numpy as np
+import orjson
+import pytest
+import shapely
+from shapely.geometry import MultiPolygon, Polygon, box
+
+from app.utils.topojson import QuantizedTopology, accepts_topojson
+
+
+def decode(document, object_name):
+    """Susun kembali geometri dari dokumen TopoJSON terkuantisasi."""
+    scale = np.asarray(document["transform"]["scale"])
+    translate = np.asarray(document["transform"]["translate"])
+    arcs = [np.cumsum(np.asarray(arc), axis=0) * scale + translate for arc in document["arcs"]]
+
+    def ring(refs):
+        parts = [arcs[ref] if ref >= 0 else arcs[~ref][::-1] for ref in refs]
+        return np.concatenate([parts[0], *(part[1:] for part in parts[1:])])
+
+    def polygon(rings):
+        return Polygon(ring(rings[0]), [ring(refs) for refs in rings[1:]])
+
+    geometries = []
+    for geometry in document["objects"][object_name]["geometries"]:
+        if geometry["type"] == "Polygon":
+            geometries.append(polygon(geometry["arcs"]))
+        elif geometry["type"] == "MultiPolygon":
+            geometries.append(MultiPolygon([polygon(rings) for rings in geometry["arcs"]]))
+        else:
+            geometries.append(None)
+    return geometries
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        ("application/topo+json", True),
+        ("application/json, Application/Topo+JSON;q=0.9", True),
+        ("*/*", False),
+        (None, False),
+    ],
+)
+def test_accepts_topojson(accept, expected):
+    assert accepts_topojson(accept) is expected
+
+
+def test_shared_border_is_stored_once():
+    topology = QuantizedTopology([box(0, 0, 1, 1), box(1, 0, 2, 1)])
+    document = orjson.loads(topology.encode("boundary", [{"id": 1}, {"id": 2}]))
+
+    first, second = (geometry["arcs"][0] for geometry in document["objects"]["boundary"]["geometries"])
+    shared = {ref if ref >= 0 else ~ref for ref in first} & {ref if ref >= 0 else ~ref for ref in second}
+    assert len(shared) == 1
+    assert len(document["arcs"]) == 3
+
+
+def test_round_trip_within_quantization_error():
+    hole = [(0.3, 0.3), (0.3, 0.6), (0.6, 0.6), (0.6, 0.3)]
+    geometries = [
+        Polygon([(0, 0), (1, 0), (1, 1), (0, 1)], [hole]),
+        MultiPolygon([box(1, 0, 2, 1), box(3, 3, 4, 4)]),
+        Polygon(),
+    ]
+    topology = QuantizedTopology(geometries, quantization=10000)
+
+    document = orjson.loads(topology.encode("boundary", [{"name": "A"}, {"name": "B"}, {"name": "C"}], rangelist=[]))
+
+    assert document["type"] == "Topology"
+    assert document["bbox"] == [0.0, 0.0, 4.0, 4.0]
+    assert document["rangelist"] == []
+    geometries_json = document["objects"]["boundary"]["geometries"]
+    assert [geometry["properties"]["name"] for geometry in geometries_json] == ["A", "B", "C"]
+
+    decoded = decode(document, "boundary")
+    tolerance = 4 / 9999
+    for original, result in zip(geometries[:2], decoded[:2]):
+        assert shapely.hausdorff_distance(original, result) <= tolerance
+        assert result.area == pytest.approx(original.area, abs=1e-3)
+    assert decoded[2] is None